@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+import hashlib
 import logging
 from pathlib import Path
 
+from aplicacion.casos_uso.generar_manifest import ResolutorHashManifest
 from aplicacion.puertos.calculadora_hash import CalculadoraHash
 from aplicacion.puertos.manifest import EscritorManifest, LectorManifest
 from dominio.manifest import EntradaManifest, ManifestProyecto
@@ -15,17 +17,23 @@ LOGGER = logging.getLogger(__name__)
 
 
 class ActualizarManifestPatch:
-    """Anexa solo nuevas entradas al manifest existente."""
+    """Anexa solo nuevas entradas al manifest existente.
+
+    Los hashes se calculan sobre el contenido UTF-8 del plan, que son los
+    mismos bytes que escribe ``EjecutarPlan``; ``verificar_en_disco`` los
+    contrasta además con lo que hay en disco.
+    """
 
     def __init__(
         self,
         lector_manifest: LectorManifest,
         escritor_manifest: EscritorManifest,
         calculadora_hash: CalculadoraHash,
+        verificar_en_disco: bool = False,
     ) -> None:
         self._lector_manifest = lector_manifest
         self._escritor_manifest = escritor_manifest
-        self._calculadora_hash = calculadora_hash
+        self._resolutor_hash = ResolutorHashManifest(calculadora_hash, verificar_en_disco)
 
     def ejecutar(self, ruta_proyecto: str, plan_archivos_nuevos: PlanGeneracion) -> ManifestProyecto:
         manifest_actual = self._lector_manifest.leer(ruta_proyecto)
@@ -34,8 +42,12 @@ class ActualizarManifestPatch:
 
         for archivo in plan_archivos_nuevos.archivos:
             ruta_absoluta = base / archivo.ruta_relativa
-            hash_sha = self._calculadora_hash.calcular_sha256(str(ruta_absoluta))
-            LOGGER.info("PATCH: hash calculado para %s", archivo.ruta_relativa)
+            hash_sha = self._resolutor_hash.resolver(
+                ruta_absoluta,
+                archivo.ruta_relativa,
+                hashlib.sha256(archivo.renderizar().encode("utf-8")).hexdigest(),
+            )
+            LOGGER.debug("PATCH: hash calculado para %s", archivo.ruta_relativa)
             nuevas_entradas.append(
                 EntradaManifest(ruta_relativa=archivo.ruta_relativa, hash_sha256=hash_sha)
             )
@@ -352,6 +352,8 @@ class AuditarFinalizacionProyecto:
                     tipo=str(atributo.get("tipo", "str")),
                     obligatorio=bool(atributo.get("obligatorio", False)),
                     valor_por_defecto=atributo.get("valor_por_defecto"),
+                    indexado=bool(atributo.get("indexado", False)),
+                    unico=bool(atributo.get("unico", False)),
                 )
                 for atributo in clase.get("atributos", [])
                 if isinstance(atributo, dict)
@@ -10,10 +10,13 @@ import logging
 from pathlib import Path
 import re
 
+from aplicacion.casos_uso.auditoria.grafo_imports import ExtractorGrafoImports, GrafoImports
+from aplicacion.casos_uso.auditoria.verificador_hashes_manifest import VerificadorHashesManifest
 from aplicacion.casos_uso.auditoria.validadores import ContextoAuditoria, ValidadorAuditoria, ValidadorImports
 from aplicacion.errores import ErrorAuditoria, ErrorInfraestructura
 from aplicacion.puertos.calculadora_hash_puerto import CalculadoraHashPuerto
 from aplicacion.puertos.ejecutor_procesos import EjecutorProcesos
+from aplicacion.puertos.manifest import CacheEstadoManifest
 from aplicacion.validacion import MotorValidacion, ReglaValidacion, ResultadoValidacion
 from dominio.errores import ErrorDominio
 
@@ -46,17 +49,15 @@ class _EstadoAuditoria:
     )
     cobertura: float | None = None
     conclusion: str = "RECHAZADO"
+    verificacion_completa: bool = False
 
 
 class _CalculadoraHashLocal:
     """Fallback temporal para evitar dependencia directa de infraestructura."""
 
     def calcular_hash_archivo(self, ruta: Path) -> str:
-        digestor = hashlib.sha256()
         with open(ruta, "rb") as archivo:
-            for bloque in iter(lambda: archivo.read(8192), b""):
-                digestor.update(bloque)
-        return digestor.hexdigest()
+            return hashlib.file_digest(archivo, "sha256").hexdigest()
 
 
 @dataclass(frozen=True)
@@ -65,7 +66,9 @@ class _ContextoReglasAuditoria:
     blueprints: list[str]
     estructura_requerida: list[str]
     validadores: list[ValidadorAuditoria]
-    calculadora_hash: CalculadoraHashPuerto
+    verificador_hashes: VerificadorHashesManifest
+    verificacion_completa: bool = False
+    grafo_imports: GrafoImports | None = None
 
 
 class _ReglaRecursoObligatorio(ReglaValidacion):
@@ -84,7 +87,7 @@ class _ReglaValidadorArquitecturaIndividual(ReglaValidacion):
         self._validador = validador
 
     def validar(self, contexto: _ContextoReglasAuditoria) -> ResultadoValidacion | None:
-        auditoria = ContextoAuditoria(base=contexto.base)
+        auditoria = ContextoAuditoria(base=contexto.base, grafo_imports=contexto.grafo_imports)
         resultado = self._validador.validar(auditoria)
         if not resultado.errores:
             return None
@@ -116,24 +119,19 @@ class _ReglaConsistenciaManifest(ReglaValidacion):
         if not ruta_manifest.exists():
             return None
         payload = json.loads(ruta_manifest.read_text(encoding="utf-8"))
-        for entrada in payload.get("archivos", []):
-            error = self._validar_entrada_manifest(contexto, entrada)
-            if error is not None:
-                return ResultadoValidacion(False, error, "ERROR")
-        return None
+        entradas = payload.get("archivos", [])
+        if any(not entrada.get("ruta_relativa") or not entrada.get("hash_sha256") for entrada in entradas):
+            return ResultadoValidacion(False, "manifest.json contiene entradas incompletas.", "ERROR")
 
-    def _validar_entrada_manifest(self, contexto: _ContextoReglasAuditoria, entrada: dict[str, str]) -> str | None:
-        ruta_relativa = entrada.get("ruta_relativa", "")
-        hash_esperado = entrada.get("hash_sha256", "")
-        if not ruta_relativa or not hash_esperado:
-            return "manifest.json contiene entradas incompletas."
-        ruta_archivo = contexto.base / ruta_relativa
-        if not ruta_archivo.exists():
-            return f"manifest.json referencia archivo inexistente: {ruta_relativa}"
-        hash_actual = contexto.calculadora_hash.calcular_hash_archivo(ruta_archivo)
-        if hash_actual != hash_esperado:
-            return f"Hash inconsistente para {ruta_relativa} en manifest.json"
-        return None
+        hashes_esperados = {entrada["ruta_relativa"]: entrada["hash_sha256"] for entrada in entradas}
+        verificacion = contexto.verificador_hashes.verificar(
+            contexto.base, hashes_esperados, verificacion_completa=contexto.verificacion_completa
+        )
+        if verificacion.exito:
+            return None
+        errores = [f"manifest.json referencia archivo inexistente: {ruta}" for ruta in verificacion.faltantes]
+        errores.extend(f"Hash inconsistente para {ruta} en manifest.json" for ruta in verificacion.inconsistentes)
+        return ResultadoValidacion(False, "; ".join(errores), "ERROR")
 
 
 class AuditarProyectoGenerado:
@@ -156,9 +154,14 @@ class AuditarProyectoGenerado:
         self,
         ejecutor_procesos: EjecutorProcesos,
         calculadora_hash: CalculadoraHashPuerto | None = None,
+        cache_estado_manifest: CacheEstadoManifest | None = None,
     ) -> None:
         self._ejecutor_procesos = ejecutor_procesos
         self._calculadora_hash = calculadora_hash or _CalculadoraHashLocal()
+        self._verificador_hashes = VerificadorHashesManifest(
+            self._calculadora_hash, cache_estado=cache_estado_manifest
+        )
+        self._extractor_grafo = ExtractorGrafoImports()
         self._validadores_auditoria = self._crear_validadores_auditoria()
         self._motor_validacion = MotorValidacion(self._crear_reglas_base())
 
@@ -185,10 +188,18 @@ class AuditarProyectoGenerado:
         )
         return reglas
 
-    def ejecutar(self, ruta_proyecto: str, blueprints_usados: list[str] | None = None) -> ResultadoAuditoria:
-        """Ejecuta las validaciones obligatorias sobre un proyecto ya generado."""
+    def ejecutar(
+        self,
+        ruta_proyecto: str,
+        blueprints_usados: list[str] | None = None,
+        verificacion_completa: bool = False,
+    ) -> ResultadoAuditoria:
+        """Ejecuta las validaciones obligatorias sobre un proyecto ya generado.
+
+        ``verificacion_completa`` ignora el caché de ``stat`` y rehashea todo el manifest.
+        """
         base = self._construir_base_proyecto(ruta_proyecto)
-        estado = self._crear_estado_auditoria(blueprints_usados)
+        estado = self._crear_estado_auditoria(blueprints_usados, verificacion_completa)
         LOGGER.info("Inicio auditoría avanzada proyecto=%s", ruta_proyecto)
 
         try:
@@ -215,8 +226,12 @@ class AuditarProyectoGenerado:
     def _construir_base_proyecto(self, ruta_proyecto: str) -> Path:
         return Path(ruta_proyecto)
 
-    def _crear_estado_auditoria(self, blueprints_usados: list[str] | None) -> _EstadoAuditoria:
-        return _EstadoAuditoria(errores=[], blueprints=blueprints_usados or [])
+    def _crear_estado_auditoria(
+        self, blueprints_usados: list[str] | None, verificacion_completa: bool = False
+    ) -> _EstadoAuditoria:
+        return _EstadoAuditoria(
+            errores=[], blueprints=blueprints_usados or [], verificacion_completa=verificacion_completa
+        )
 
     def _validar_reglas_base(self, base: Path, estado: _EstadoAuditoria) -> None:
         self._motor_validacion = MotorValidacion(self._crear_reglas_base())
@@ -225,7 +240,9 @@ class AuditarProyectoGenerado:
             blueprints=estado.blueprints,
             estructura_requerida=self.ESTRUCTURA_REQUERIDA,
             validadores=self._validadores_auditoria,
-            calculadora_hash=self._calculadora_hash,
+            verificador_hashes=self._verificador_hashes,
+            verificacion_completa=estado.verificacion_completa,
+            grafo_imports=self._extractor_grafo.extraer(base) if self._validadores_auditoria else None,
         )
         for resultado in self._motor_validacion.ejecutar(contexto):
             if resultado.severidad == "ERROR" and not resultado.exito and resultado.mensaje:
@@ -8,6 +8,7 @@ import logging
 from pathlib import Path
 import subprocess
 
+from aplicacion.casos_uso.auditoria.grafo_imports import ExtractorGrafoImports
 from aplicacion.casos_uso.auditoria.reglas_dependencias import (
     ReglaAplicacionNoDependeInfraestructura,
     ReglaDependencia,
@@ -63,6 +64,7 @@ class AuditarProyectoGenerado:
             ReglaAplicacionNoDependeInfraestructura(),
             ReglaDominioNoDependeDeOtrasCapas(),
         ]
+        self._extractor_grafo = ExtractorGrafoImports()
 
     def auditar(self, ruta_proyecto: str) -> ResultadoAuditoria:
         """Ejecuta la auditoría del proyecto generado."""
@@ -125,7 +127,7 @@ class AuditarProyectoGenerado:
         return []
 
     def _validar_dependencias_capas(self, base: Path) -> list[str]:
-        contexto = ContextoAuditoria(base=base)
+        contexto = ContextoAuditoria(base=base, grafo_imports=self._extractor_grafo.extraer(base))
         errores: list[str] = []
         for regla in self._reglas_dependencias:
             errores.extend(regla.evaluar(contexto).errores)
@@ -0,0 +1,153 @@
+"""Grafo de imports de un proyecto Python extraído en una sola pasada."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import re
+
+PATRON_IMPORT = re.compile(r"^\s*import\s+([a-zA-Z0-9_\.]+)", re.MULTILINE)
+PATRON_FROM = re.compile(r"^\s*from\s+([a-zA-Z0-9_\.]+)\s+import\s+", re.MULTILINE)
+UMBRAL_EXTRACCION_PARALELA = 200
+ARCHIVOS_POR_PROCESO = 50
+
+HuellaArchivo = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class ModuloImportado:
+    """Imports declarados por un archivo ``.py`` del proyecto auditado."""
+
+    relativo: Path
+    modulo: str
+    imports: frozenset[str]
+
+    @property
+    def capa(self) -> str | None:
+        return self.relativo.parts[0] if len(self.relativo.parts) > 1 else None
+
+
+@dataclass(frozen=True)
+class GrafoImports:
+    """Grafo compartido por las reglas de arquitectura de una auditoría."""
+
+    modulos: dict[str, ModuloImportado]
+
+    def en_capa(self, capa: str) -> list[ModuloImportado]:
+        return [modulo for modulo in self.modulos.values() if modulo.capa == capa]
+
+    def ciclos(self) -> list[list[str]]:
+        """Componentes fuertemente conexas con más de un módulo."""
+        return _BuscadorComponentes(self).componentes()
+
+    def vecinos(self, modulo: str) -> list[str]:
+        """Imports de ``modulo`` que apuntan a otros módulos del proyecto."""
+        return sorted(dependencia for dependencia in self.modulos[modulo].imports if dependencia in self.modulos)
+
+
+class _BuscadorComponentes:
+    """Algoritmo de Tarjan en versión iterativa para no depender del límite de recursión."""
+
+    def __init__(self, grafo: GrafoImports) -> None:
+        self._grafo = grafo
+        self._indices: dict[str, int] = {}
+        self._minimos: dict[str, int] = {}
+        self._pila: list[str] = []
+        self._en_pila: set[str] = set()
+        self._componentes: list[list[str]] = []
+
+    def componentes(self) -> list[list[str]]:
+        for origen in self._grafo.modulos:
+            if origen not in self._indices:
+                self._recorrer(origen)
+        return sorted(componente for componente in self._componentes if len(componente) > 1)
+
+    def _recorrer(self, origen: str) -> None:
+        trabajo = [self._visitar(origen)]
+        while trabajo:
+            nodo, pendientes = trabajo[-1]
+            if pendientes:
+                self._avanzar(nodo, pendientes.pop(), trabajo)
+                continue
+            trabajo.pop()
+            self._cerrar(nodo, trabajo[-1][0] if trabajo else None)
+
+    def _visitar(self, nodo: str) -> tuple[str, list[str]]:
+        self._indices[nodo] = self._minimos[nodo] = len(self._indices)
+        self._pila.append(nodo)
+        self._en_pila.add(nodo)
+        return nodo, self._grafo.vecinos(nodo)
+
+    def _avanzar(self, nodo: str, vecino: str, trabajo: list[tuple[str, list[str]]]) -> None:
+        if vecino not in self._indices:
+            trabajo.append(self._visitar(vecino))
+        elif vecino in self._en_pila:
+            self._minimos[nodo] = min(self._minimos[nodo], self._indices[vecino])
+
+    def _cerrar(self, nodo: str, padre: str | None) -> None:
+        if padre is not None:
+            self._minimos[padre] = min(self._minimos[padre], self._minimos[nodo])
+        if self._minimos[nodo] != self._indices[nodo]:
+            return
+        componente: list[str] = []
+        while not componente or componente[-1] != nodo:
+            miembro = self._pila.pop()
+            self._en_pila.discard(miembro)
+            componente.append(miembro)
+        self._componentes.append(sorted(componente))
+
+
+def extraer_imports_archivo(ruta_archivo: str) -> frozenset[str]:
+    contenido = Path(ruta_archivo).read_text(encoding="utf-8")
+    return frozenset(PATRON_IMPORT.findall(contenido)) | frozenset(PATRON_FROM.findall(contenido))
+
+
+class ExtractorGrafoImports:
+    """Lee cada archivo una vez y cachea sus imports por ``(ruta, mtime_ns, tamaño)``.
+
+    El caché solo conserva los archivos del último árbol extraído: reauditar
+    el mismo proyecto no relee nada y auditar otro descarta lo anterior, así
+    que no crece con las auditorías de un proceso largo.
+
+    Si hay al menos ``UMBRAL_EXTRACCION_PARALELA`` archivos sin caché y
+    ``max_procesos`` es mayor que 1, la lectura se reparte en un pool de procesos.
+    """
+
+    def __init__(self, max_procesos: int | None = None) -> None:
+        self._max_procesos = max(1, max_procesos if max_procesos is not None else os.cpu_count() or 1)
+        self._cache: dict[Path, tuple[HuellaArchivo, frozenset[str]]] = {}
+
+    def extraer(self, base: Path) -> GrafoImports:
+        archivos = sorted(base.rglob("*.py"))
+        huellas: dict[Path, HuellaArchivo] = {}
+        cache: dict[Path, tuple[HuellaArchivo, frozenset[str]]] = {}
+        pendientes: list[Path] = []
+        for archivo in archivos:
+            estado = archivo.stat()
+            huellas[archivo] = (estado.st_mtime_ns, estado.st_size)
+            cacheado = self._cache.get(archivo)
+            if cacheado is None or cacheado[0] != huellas[archivo]:
+                pendientes.append(archivo)
+            else:
+                cache[archivo] = cacheado
+
+        for archivo, imports in zip(pendientes, self._leer_imports(pendientes)):
+            cache[archivo] = (huellas[archivo], imports)
+        self._cache = cache
+
+        modulos: dict[str, ModuloImportado] = {}
+        for archivo in archivos:
+            relativo = archivo.relative_to(base)
+            nombre_modulo = ".".join(relativo.with_suffix("").parts)
+            modulos[nombre_modulo] = ModuloImportado(relativo, nombre_modulo, cache[archivo][1])
+        return GrafoImports(modulos=modulos)
+
+    def _leer_imports(self, archivos: list[Path]) -> list[frozenset[str]]:
+        rutas = [str(archivo) for archivo in archivos]
+        if self._max_procesos == 1 or len(rutas) < UMBRAL_EXTRACCION_PARALELA:
+            return [extraer_imports_archivo(ruta) for ruta in rutas]
+        procesos = min(self._max_procesos, len(rutas) // ARCHIVOS_POR_PROCESO)
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            return list(pool.map(extraer_imports_archivo, rutas, chunksize=64))
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+from aplicacion.casos_uso.auditoria.grafo_imports import ExtractorGrafoImports, ModuloImportado
 from aplicacion.casos_uso.auditoria.validadores.validador_base import ContextoAuditoria, ResultadoValidacion
 
 
@@ -13,3 +14,8 @@ class ReglaDependencia(ABC):
     @abstractmethod
     def evaluar(self, contexto: ContextoAuditoria) -> ResultadoValidacion:
         """Ejecuta la regla sobre el contexto de auditoría y devuelve su resultado."""
+
+    def _modulos_de_capa(self, contexto: ContextoAuditoria, capa: str) -> list[ModuloImportado]:
+        """Módulos de ``capa`` según el grafo compartido o, si falta, uno extraído al vuelo."""
+        grafo = contexto.grafo_imports or ExtractorGrafoImports(max_procesos=1).extraer(contexto.base)
+        return grafo.en_capa(capa)
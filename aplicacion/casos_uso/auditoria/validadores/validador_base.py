@@ -6,12 +6,19 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from aplicacion.casos_uso.auditoria.grafo_imports import GrafoImports
+
 
 @dataclass(frozen=True)
 class ContextoAuditoria:
-    """Información disponible para cada validador de auditoría."""
+    """Información disponible para cada validador de auditoría.
+
+    ``grafo_imports`` permite que varias reglas compartan una única lectura
+    del árbol; si falta, cada regla lo extrae por su cuenta.
+    """
 
     base: Path
+    grafo_imports: GrafoImports | None = None
 
 
 @dataclass(frozen=True)
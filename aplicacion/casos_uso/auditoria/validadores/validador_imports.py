@@ -4,8 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-import re
 
+from aplicacion.casos_uso.auditoria.grafo_imports import ExtractorGrafoImports, GrafoImports, ModuloImportado
 from aplicacion.casos_uso.auditoria.validadores.validador_base import (
     ContextoAuditoria,
     ResultadoValidacion,
@@ -41,44 +41,29 @@ class ValidadorImports(ValidadorAuditoria):
 
     _MODULOS_EXPORTACION = {"openpyxl", "reportlab"}
 
-    def __init__(self) -> None:
-        self._patron_import = re.compile(r"^\s*import\s+([a-zA-Z0-9_\.]+)", re.MULTILINE)
-        self._patron_from = re.compile(r"^\s*from\s+([a-zA-Z0-9_\.]+)\s+import\s+", re.MULTILINE)
+    def __init__(self, extractor_grafo: ExtractorGrafoImports | None = None) -> None:
+        self._extractor_grafo = extractor_grafo or ExtractorGrafoImports()
 
     def validar(self, contexto: ContextoAuditoria) -> ResultadoValidacion:
+        grafo = contexto.grafo_imports or self._extractor_grafo.extraer(contexto.base)
         errores: list[str] = []
-        grafo_imports: dict[str, set[str]] = {}
+        for modulo in grafo.modulos.values():
+            self._validar_modulo(modulo, errores)
 
-        for ruta_archivo in contexto.base.rglob("*.py"):
-            self._procesar_archivo(contexto.base, ruta_archivo, errores, grafo_imports)
-
-        errores.extend(self._detectar_ciclos_basicos(grafo_imports))
+        errores.extend(self._detectar_ciclos(grafo))
         return ResultadoValidacion(exito=not errores, errores=errores)
 
-    def _procesar_archivo(
-        self,
-        base: Path,
-        ruta_archivo: Path,
-        errores: list[str],
-        grafo_imports: dict[str, set[str]],
-    ) -> None:
-        relativo = ruta_archivo.relative_to(base)
-        modulo_actual = self._ruta_a_modulo(relativo)
-        contenido = ruta_archivo.read_text(encoding="utf-8")
-        imports = set(self._patron_import.findall(contenido)) | set(self._patron_from.findall(contenido))
-        grafo_imports[modulo_actual] = imports
-        if not relativo.parts:
-            return
-
+    def _validar_modulo(self, modulo: ModuloImportado, errores: list[str]) -> None:
+        relativo = modulo.relativo
+        imports = set(modulo.imports)
         self._validar_modulos_restringidos(relativo, imports, errores)
-        capa = relativo.parts[0]
-        if capa == "dominio":
+        if modulo.capa == "dominio":
             self._regla_imports_dominio(relativo, imports, errores)
             return
-        if capa == "aplicacion":
+        if modulo.capa == "aplicacion":
             self._regla_imports_aplicacion(relativo, imports, errores)
             return
-        if capa == "presentacion":
+        if modulo.capa == "presentacion":
             self._regla_imports_presentacion(relativo, imports, errores)
 
     def _validar_modulos_restringidos(self, relativo: Path, imports: set[str], errores: list[str]) -> None:
@@ -117,14 +102,9 @@ class ValidadorImports(ValidadorAuditoria):
             if modulo.lower().startswith("infraestructura") or modulo.lower().startswith("dominio"):
                 errores.append(f"Import prohibido en presentación ({relativo}): {modulo}")
 
-    def _detectar_ciclos_basicos(self, grafo_imports: dict[str, set[str]]) -> list[str]:
+    def _detectar_ciclos(self, grafo: GrafoImports) -> list[str]:
         errores: list[str] = []
-        for modulo, dependencias in grafo_imports.items():
-            for dependencia in dependencias:
-                if dependencia in grafo_imports and modulo in grafo_imports.get(dependencia, set()):
-                    errores.append(f"Import circular detectado entre {modulo} y {dependencia}")
-        return sorted(set(errores))
-
-    def _ruta_a_modulo(self, relativa: Path) -> str:
-        sin_sufijo = relativa.with_suffix("")
-        return ".".join(sin_sufijo.parts)
+        for componente in grafo.ciclos():
+            modulos = ", ".join(componente[:-1]) + f" y {componente[-1]}"
+            errores.append(f"Import circular detectado entre {modulos}")
+        return errores
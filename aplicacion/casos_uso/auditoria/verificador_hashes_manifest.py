@@ -0,0 +1,103 @@
+"""Verificación concurrente de los hashes declarados en un manifest."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+import time
+
+from aplicacion.puertos.calculadora_hash_puerto import CalculadoraHashPuerto
+from aplicacion.puertos.manifest import CacheEstadoManifest, EstadoArchivoManifest
+
+ESTADO_FALTANTE = "faltante"
+ESTADO_INCONSISTENTE = "inconsistente"
+MARGEN_RACY_NS = 2_000_000_000
+
+_ResultadoEntrada = tuple[str | None, EstadoArchivoManifest | None]
+
+
+@dataclass(frozen=True)
+class ResultadoVerificacionHashes:
+    """Rutas del manifest que no existen o cuyo contenido ya no coincide."""
+
+    faltantes: list[str] = field(default_factory=list)
+    inconsistentes: list[str] = field(default_factory=list)
+
+    @property
+    def exito(self) -> bool:
+        return not self.faltantes and not self.inconsistentes
+
+
+class VerificadorHashesManifest:
+    """Comprueba todas las entradas en un pool de hilos y reporta cada discrepancia.
+
+    ``hashlib`` libera el GIL mientras digiere bloques, así que los hilos
+    solapan lectura y cálculo. Los errores de la calculadora se propagan.
+
+    Con ``cache_estado`` solo se hashean las entradas cuyo ``stat`` (mtime,
+    tamaño, inodo) o hash esperado cambió desde la última verificación, como
+    hace el índice de git. Los archivos modificados en los últimos
+    ``MARGEN_RACY_NS`` no se cachean: una escritura posterior dentro de la
+    misma resolución de mtime pasaría desapercibida.
+    """
+
+    def __init__(
+        self,
+        calculadora_hash: CalculadoraHashPuerto,
+        max_hilos: int | None = None,
+        cache_estado: CacheEstadoManifest | None = None,
+    ) -> None:
+        self._calculadora_hash = calculadora_hash
+        self._max_hilos = max_hilos
+        self._cache_estado = cache_estado
+
+    def verificar(
+        self,
+        base: Path,
+        hashes_esperados: dict[str, str],
+        verificacion_completa: bool = False,
+    ) -> ResultadoVerificacionHashes:
+        usar_cache = self._cache_estado is not None and not verificacion_completa
+        estados_previos = self._cache_estado.cargar(str(base)) if usar_cache else {}
+        entradas = [(ruta, hash_sha, estados_previos.get(ruta)) for ruta, hash_sha in hashes_esperados.items()]
+        resultados = self._verificar_entradas(base, entradas)
+
+        resultado = ResultadoVerificacionHashes()
+        estados_nuevos: dict[str, EstadoArchivoManifest] = {}
+        limite_racy = time.time_ns() - MARGEN_RACY_NS
+        for (ruta_relativa, _, previo), (estado, huella) in zip(entradas, resultados):
+            if estado == ESTADO_FALTANTE:
+                resultado.faltantes.append(ruta_relativa)
+            elif estado == ESTADO_INCONSISTENTE:
+                resultado.inconsistentes.append(ruta_relativa)
+            elif huella is not None and (huella == previo or huella.mtime_ns < limite_racy):
+                estados_nuevos[ruta_relativa] = huella
+
+        if self._cache_estado is not None and estados_nuevos != estados_previos:
+            self._cache_estado.guardar(str(base), estados_nuevos)
+        return resultado
+
+    def _verificar_entradas(
+        self, base: Path, entradas: list[tuple[str, str, EstadoArchivoManifest | None]]
+    ) -> list[_ResultadoEntrada]:
+        if len(entradas) <= 1 or self._max_hilos == 1:
+            return [self._verificar_entrada(base, entrada) for entrada in entradas]
+        with ThreadPoolExecutor(max_workers=self._max_hilos) as pool:
+            return list(pool.map(lambda entrada: self._verificar_entrada(base, entrada), entradas))
+
+    def _verificar_entrada(
+        self, base: Path, entrada: tuple[str, str, EstadoArchivoManifest | None]
+    ) -> _ResultadoEntrada:
+        ruta_relativa, hash_esperado, previo = entrada
+        ruta_archivo = base / ruta_relativa
+        try:
+            estado = ruta_archivo.stat()
+        except FileNotFoundError:
+            return ESTADO_FALTANTE, None
+        huella = EstadoArchivoManifest(estado.st_mtime_ns, estado.st_size, estado.st_ino, hash_esperado)
+        if huella == previo:
+            return None, huella
+        if self._calculadora_hash.calcular_hash_archivo(ruta_archivo) != hash_esperado:
+            return ESTADO_INCONSISTENTE, None
+        return None, huella
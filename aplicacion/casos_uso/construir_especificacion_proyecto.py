@@ -97,6 +97,8 @@ class ConstruirEspecificacionProyecto:
                             nombre=dto_atributo.nombre.strip(),
                             tipo=dto_atributo.tipo.strip(),
                             obligatorio=dto_atributo.obligatorio,
+                            indexado=dto_atributo.indexado,
+                            unico=dto_atributo.unico,
                         )
                     )
                 especificacion.agregar_clase(clase)
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import logging
+from time import perf_counter_ns
 
 from aplicacion.errores import ErrorBlueprintNoEncontrado, ErrorConflictoArchivos, ErrorValidacion
-from aplicacion.puertos.blueprint import RepositorioBlueprints
+from aplicacion.puertos.blueprint import Blueprint, RepositorioBlueprints
 from dominio.especificacion import ErrorValidacionDominio, EspecificacionProyecto
-from dominio.plan_generacion import PlanGeneracion
+from dominio.plan_generacion import ArchivoGenerado, PlanGeneracion
 from aplicacion.puertos.descubridor_plugins_puerto import DescubridorPluginsPuerto
+from aplicacion.servicios.trazado import Trazador, span, trazador_actual
 
 LOGGER = logging.getLogger(__name__)
 
@@ -30,14 +32,25 @@ class CrearPlanDesdeBlueprints:
         self,
         repositorio_blueprints: RepositorioBlueprints,
         descubridor_plugins: DescubridorPluginsPuerto | None = None,
+        plan_diferido: bool = False,
     ) -> None:
         self._repositorio = repositorio_blueprints
         self._descubridor_plugins = descubridor_plugins or _DescubridorPluginsNulo()
+        self._plan_diferido = plan_diferido
 
     def ejecutar(
         self, especificacion: EspecificacionProyecto, nombres_blueprints: list[str]
     ) -> PlanGeneracion:
-        """Valida y fusiona planes parciales de blueprints solicitados."""
+        """Valida y fusiona planes parciales de blueprints solicitados.
+
+        Con ``plan_diferido`` los blueprints que lo soportan entregan archivos
+        cuyo contenido se renderiza al escribirse; los conflictos se validan
+        solo con las rutas.
+
+        El span ``planificar_blueprint`` mide validar y planificar; en modo
+        diferido el renderizado ocurre al escribir y cada blueprint suma su
+        tiempo en el contador ``renderizado_ns.<blueprint>`` del trazador.
+        """
         plan_final = PlanGeneracion()
         LOGGER.info("Creando plan compuesto con blueprints: %s", nombres_blueprints)
 
@@ -45,9 +58,13 @@ class CrearPlanDesdeBlueprints:
             blueprint = self._resolver_blueprint(nombre_blueprint, nombres_blueprints)
 
             try:
-                blueprint.validar(especificacion)
-                plan_blueprint = blueprint.generar_plan(especificacion)
-                plan_final = plan_final.fusionar(plan_blueprint)
+                with span("planificar_blueprint", nombre=nombre_blueprint):
+                    blueprint.validar(especificacion)
+                    plan_blueprint = self._generar_plan(blueprint, especificacion)
+                    trazador = trazador_actual()
+                    if trazador is not None:
+                        plan_blueprint = _medir_renderizado(plan_blueprint, nombre_blueprint, trazador)
+                    plan_final.incorporar(plan_blueprint)
             except ErrorValidacionDominio as exc:
                 if "rutas duplicadas" in str(exc):
                     raise ErrorConflictoArchivos(str(exc)) from exc
@@ -59,6 +76,20 @@ class CrearPlanDesdeBlueprints:
             raise ErrorConflictoArchivos(str(exc)) from exc
         return plan_final
 
+    def obtener_rutas(self, especificacion: EspecificacionProyecto, nombre_blueprint: str) -> list[str]:
+        """Rutas que generaría ``nombre_blueprint`` sin renderizar ningún contenido."""
+        blueprint = self._resolver_blueprint(nombre_blueprint, [nombre_blueprint])
+        try:
+            blueprint.validar(especificacion)
+        except ErrorValidacionDominio as exc:
+            raise ErrorValidacion(str(exc)) from exc
+        return list(blueprint.obtener_rutas(especificacion))
+
+    def _generar_plan(self, blueprint: Blueprint, especificacion: EspecificacionProyecto) -> PlanGeneracion:
+        if self._plan_diferido:
+            return blueprint.generar_plan_diferido(especificacion)
+        return blueprint.generar_plan(especificacion)
+
     def _resolver_blueprint(self, nombre_blueprint: str, seleccionados: list[str]):
         try:
             return self._repositorio.obtener_por_nombre(nombre_blueprint)
@@ -80,3 +111,25 @@ class CrearPlanDesdeBlueprints:
                 f"Plugin incompatible '{nombre_blueprint}': requiere alguno de {sorted(compatibilidades)}"
             )
         return plugin
+
+
+def _medir_renderizado(plan: PlanGeneracion, nombre_blueprint: str, trazador: Trazador) -> PlanGeneracion:
+    """Envuelve los archivos diferidos para sumar su tiempo de renderizado al blueprint."""
+    contador = f"renderizado_ns.{nombre_blueprint}"
+
+    def medido(archivo: ArchivoGenerado) -> ArchivoGenerado:
+        if not archivo.es_diferido:
+            return archivo
+
+        def renderizar() -> str:
+            inicio_ns = perf_counter_ns()
+            try:
+                return archivo.renderizar()
+            finally:
+                trazador.incrementar(contador, perf_counter_ns() - inicio_ns)
+
+        return ArchivoGenerado.diferido(archivo.ruta_relativa, renderizar)
+
+    if not any(archivo.es_diferido for archivo in plan.archivos):
+        return plan
+    return PlanGeneracion(archivos=[medido(archivo) for archivo in plan.archivos])
@@ -2,16 +2,39 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import logging
 from pathlib import Path
+import threading
 from typing import Any
 
 from aplicacion.casos_uso.generar_manifest import GenerarManifest
-from aplicacion.puertos.sistema_archivos import SistemaArchivos
+from aplicacion.puertos.sistema_archivos import ContenidoArchivo, SistemaArchivos, resolver_contenido
+from aplicacion.servicios.trazado import Trazador, span, trazador_actual
 from dominio.plan_generacion import PlanGeneracion
 
 LOGGER = logging.getLogger(__name__)
 
+NotificadorProgreso = Callable[[int, int], None]
+
+
+class _ContadorProgreso:
+    """Cuenta archivos escritos de forma segura entre hilos y notifica el avance."""
+
+    def __init__(self, total: int, notificar: NotificadorProgreso | None) -> None:
+        self._total = total
+        self._notificar = notificar
+        self._completados = 0
+        self._candado = threading.Lock()
+
+    def registrar(self, ruta_absoluta: str) -> None:
+        LOGGER.debug("Archivo escrito: %s", ruta_absoluta)
+        if self._notificar is None:
+            return
+        with self._candado:
+            self._completados += 1
+            self._notificar(self._completados, self._total)
+
 
 class EjecutarPlan:
     """Aplica un plan de generación usando el puerto de sistema de archivos."""
@@ -32,26 +55,78 @@ class EjecutarPlan:
         version_generador: str = "0.2.0",
         blueprints_usados: list[str] | None = None,
         generar_manifest: bool = True,
+        notificar_progreso: NotificadorProgreso | None = None,
+        escritura_directa: bool = False,
     ) -> list[str]:
-        """Crea directorios, escribe archivos y genera el manifest final."""
+        """Crea directorios, escribe archivos y genera el manifest final.
+
+        El manifest reutiliza los SHA256 calculados durante la escritura. Los
+        archivos diferidos se renderizan uno a uno al escribirse.
+
+        ``notificar_progreso`` recibe ``(completados, total)`` tras cada archivo
+        escrito, incluso cuando el puerto escribe el lote en paralelo.
+
+        ``escritura_directa`` indica que ``ruta_destino`` es un área de
+        preparación que se publicará entera; los archivos se escriben sin
+        temporal propio si el puerto lo soporta.
+        """
         plan.validar_sin_conflictos()
-        archivos_creados: list[str] = []
+        escrituras: list[tuple[str, ContenidoArchivo]] = []
         for archivo in plan.archivos:
-            LOGGER.info("Generando archivo: %s", archivo.ruta_relativa)
+            LOGGER.debug("Generando archivo: %s", archivo.ruta_relativa)
             ruta_absoluta = Path(ruta_destino) / archivo.ruta_relativa
-            self._sistema_archivos.asegurar_directorio(str(ruta_absoluta.parent))
-            self._sistema_archivos.escribir_texto_atomico(
-                str(ruta_absoluta), archivo.contenido_texto
+            contenido = archivo.renderizar if archivo.es_diferido else archivo.renderizar()
+            escrituras.append((str(ruta_absoluta), contenido))
+
+        trazador = trazador_actual()
+        if trazador is not None:
+            escrituras = [(ruta, _contenido_medido(contenido, trazador)) for ruta, contenido in escrituras]
+            trazador.incrementar("archivos", len(escrituras))
+
+        with span("escribir_lote", archivos=len(escrituras)):
+            for directorio in dict.fromkeys(str(Path(ruta).parent) for ruta, _ in escrituras):
+                self._sistema_archivos.asegurar_directorio(directorio)
+            hashes = self._escribir_lote(
+                escrituras, _ContadorProgreso(len(escrituras), notificar_progreso), escritura_directa
             )
-            archivos_creados.append(archivo.ruta_relativa)
+        archivos_creados = [archivo.ruta_relativa for archivo in plan.archivos]
+        LOGGER.info("Plan ejecutado: %s archivos escritos en %s", len(archivos_creados), ruta_destino)
 
         if self._generador_manifest is not None and generar_manifest:
-            self._generador_manifest.ejecutar(
-                plan=plan,
-                ruta_destino=ruta_destino,
-                opciones=opciones or {},
-                version_generador=version_generador,
-                blueprints_usados=blueprints_usados or [],
-            )
+            with span("generar_manifest"):
+                self._generador_manifest.ejecutar(
+                    plan=plan,
+                    ruta_destino=ruta_destino,
+                    opciones=opciones or {},
+                    version_generador=version_generador,
+                    blueprints_usados=blueprints_usados or [],
+                    hashes_sha256={
+                        ruta: hash_sha
+                        for ruta, hash_sha in zip(archivos_creados, hashes)
+                        if isinstance(hash_sha, str)
+                    },
+                )
 
         return archivos_creados
+
+    def _escribir_lote(
+        self,
+        escrituras: list[tuple[str, ContenidoArchivo]],
+        contador: _ContadorProgreso,
+        escritura_directa: bool = False,
+    ) -> list[str]:
+        """Escribe el lote y retorna los SHA256 reportados por el puerto."""
+        if escritura_directa:
+            return self._sistema_archivos.escribir_lote_directo(escrituras, contador.registrar)
+        return self._sistema_archivos.escribir_lote_atomico(escrituras, contador.registrar)
+
+
+def _contenido_medido(contenido: ContenidoArchivo, trazador: Trazador) -> Callable[[], str]:
+    """Envuelve el contenido para sumar sus bytes UTF-8 al trazador cuando se resuelve."""
+
+    def renderizar() -> str:
+        texto = resolver_contenido(contenido)
+        trazador.incrementar("bytes", len(texto.encode("utf-8")))
+        return texto
+
+    return renderizar
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import logging
 from pathlib import Path
 
@@ -11,7 +11,8 @@ from aplicacion.casos_uso.auditoria.auditar_proyecto_generado import (
     ResultadoAuditoria,
 )
 from aplicacion.casos_uso.crear_plan_desde_blueprints import CrearPlanDesdeBlueprints
-from aplicacion.casos_uso.ejecutar_plan import EjecutarPlan
+from aplicacion.casos_uso.ejecutar_plan import EjecutarPlan, NotificadorProgreso
+from aplicacion.casos_uso.generacion.pasos.area_preparacion import AreaPreparacion, AreaPreparacionGeneracion
 from aplicacion.casos_uso.generacion.pasos.ejecutar_auditoria import EjecutorAuditoriaGeneracion
 from aplicacion.casos_uso.generacion.pasos.ejecutar_plan import EjecutorPlanGeneracion
 from aplicacion.casos_uso.generacion.pasos.errores_pipeline import (
@@ -22,7 +23,10 @@ from aplicacion.casos_uso.generacion.pasos.errores_pipeline import (
     ErrorPublicacionManifestGeneracion,
     ErrorValidacionEntradaGeneracion,
 )
-from aplicacion.casos_uso.generacion.pasos.normalizar_entrada import NormalizadorEntradaGeneracion
+from aplicacion.casos_uso.generacion.pasos.normalizar_entrada import (
+    DtoEntradaNormalizada,
+    NormalizadorEntradaGeneracion,
+)
 from aplicacion.casos_uso.generacion.pasos.preparar_estructura import PreparadorEstructuraGeneracion
 from aplicacion.casos_uso.generacion.pasos.publicar_manifest import PublicadorManifestGeneracion
 from aplicacion.casos_uso.generacion.pasos.rollback_generacion import RollbackGeneracion
@@ -30,11 +34,22 @@ from aplicacion.casos_uso.generacion.pasos.validar_entrada import ValidadorEntra
 from aplicacion.errores import ErrorGeneracionProyecto, ErrorInfraestructura
 from aplicacion.puertos.generador_manifest_puerto import GeneradorManifestPuerto
 from aplicacion.puertos.sistema_archivos import SistemaArchivos
+from aplicacion.servicios.trazado import Trazador, activar_trazador, ruta_traza_junto_a, trazador_actual
 from dominio.errores import ErrorDominio
 from dominio.especificacion import EspecificacionProyecto
 
 LOGGER = logging.getLogger(__name__)
 
+_ERRORES_RECUPERABLES = (
+    ErrorPreparacionEstructuraGeneracion,
+    ErrorEjecucionPlanGeneracion,
+    ErrorPublicacionManifestGeneracion,
+    ErrorAuditoriaGeneracion,
+    ErrorInfraestructura,
+    OSError,
+    ValueError,
+)
+
 
 @dataclass(frozen=True)
 class GenerarProyectoMvpEntrada:
@@ -44,6 +59,7 @@ class GenerarProyectoMvpEntrada:
     ruta_destino: str
     nombre_proyecto: str
     blueprints: list[str]
+    notificar_progreso: NotificadorProgreso | None = None
 
 
 @dataclass(frozen=True)
@@ -56,6 +72,7 @@ class GenerarProyectoMvpSalida:
     errores: list[str]
     warnings: list[str]
     auditoria: ResultadoAuditoria | None = None
+    ruta_traza: str | None = None
 
 
 class GenerarProyectoMvp:
@@ -68,7 +85,13 @@ class GenerarProyectoMvp:
         sistema_archivos: SistemaArchivos,
         generador_manifest: GeneradorManifestPuerto | None = None,
         auditor: AuditarProyectoGenerado | None = None,
+        emitir_traza: bool = False,
+        preparacion_aislada: bool = False,
     ) -> None:
+        self._sistema_archivos = sistema_archivos
+        self._emitir_traza = emitir_traza
+        self._preparacion_aislada = preparacion_aislada
+        self._area_preparacion = AreaPreparacionGeneracion(sistema_archivos)
         self._validador_entrada = ValidadorEntradaGeneracion()
         self._normalizador_entrada = NormalizadorEntradaGeneracion()
         self._preparador_estructura = PreparadorEstructuraGeneracion(sistema_archivos)
@@ -78,54 +101,108 @@ class GenerarProyectoMvp:
         self._rollback = RollbackGeneracion()
 
     def ejecutar(self, entrada: GenerarProyectoMvpEntrada) -> GenerarProyectoMvpSalida:
-        """Genera el proyecto final en disco a partir de los blueprints MVP."""
+        """Genera el proyecto final en disco a partir de los blueprints MVP.
+
+        Cada paso queda medido en un span del trazador activo (o de uno propio).
+        Con ``emitir_traza`` la traza se escribe como JSON junto al proyecto.
+
+        Con ``preparacion_aislada`` todo se escribe y audita en un directorio
+        hermano que se publica con un único renombrado; ante un fallo basta con
+        descartarlo y el destino no llega a existir a medias.
+        """
+        trazador = trazador_actual() or Trazador()
+        with activar_trazador(trazador), trazador.span("generar_proyecto_mvp", proyecto=entrada.nombre_proyecto):
+            salida = self._ejecutar_pasos(entrada, trazador)
+        if not self._emitir_traza:
+            return salida
+        ruta_traza = str(ruta_traza_junto_a(salida.ruta_generada))
+        try:
+            self._sistema_archivos.escribir_texto_atomico(ruta_traza, trazador.a_json())
+        except OSError as exc:
+            LOGGER.warning("No se pudo escribir la traza de generación en %s: %s", ruta_traza, exc)
+            return salida
+        return replace(salida, ruta_traza=ruta_traza)
+
+    def _ejecutar_pasos(self, entrada: GenerarProyectoMvpEntrada, trazador: Trazador) -> GenerarProyectoMvpSalida:
         LOGGER.info(
             "Iniciando generación MVP para proyecto='%s' destino='%s' blueprints=%s",
             entrada.nombre_proyecto,
             entrada.ruta_destino,
             entrada.blueprints,
         )
-        ruta_proyecto = self._validador_entrada.validar(entrada)
-        entrada_normalizada = self._normalizador_entrada.normalizar(entrada, ruta_proyecto)
+        with trazador.span("validar_entrada"):
+            ruta_proyecto = self._validador_entrada.validar(entrada)
+        with trazador.span("normalizar_entrada"):
+            entrada_normalizada = self._normalizador_entrada.normalizar(entrada, ruta_proyecto)
+
+        if self._preparacion_aislada:
+            return self._ejecutar_en_area_preparacion(entrada, entrada_normalizada, ruta_proyecto, trazador)
 
         carpeta_creada_en_ejecucion = False
         carpeta_existia_antes = ruta_proyecto.exists()
         carpeta_existia_vacia = carpeta_existia_antes and not any(ruta_proyecto.iterdir())
         try:
-            carpeta_creada_en_ejecucion = self._preparador_estructura.preparar(ruta_proyecto)
+            with trazador.span("preparar_estructura"):
+                carpeta_creada_en_ejecucion = self._preparador_estructura.preparar(ruta_proyecto)
+            return self._generar_en(ruta_proyecto, entrada, entrada_normalizada, trazador)
+        except _ERRORES_RECUPERABLES as exc:
+            self._rollback.ejecutar(
+                ruta_proyecto,
+                carpeta_creada_en_ejecucion or not carpeta_existia_antes or carpeta_existia_vacia,
+            )
+            raise ErrorGeneracionProyecto("Falló la generación del proyecto MVP.") from exc
+
+    def _ejecutar_en_area_preparacion(
+        self,
+        entrada: GenerarProyectoMvpEntrada,
+        entrada_normalizada: DtoEntradaNormalizada,
+        ruta_proyecto: Path,
+        trazador: Trazador,
+    ) -> GenerarProyectoMvpSalida:
+        area: AreaPreparacion | None = None
+        try:
+            with trazador.span("preparar_estructura", preparacion_aislada=True):
+                area = self._area_preparacion.crear(ruta_proyecto)
+                self._preparador_estructura.preparar(area.ruta)
+            salida = self._generar_en(area.ruta, entrada, entrada_normalizada, trazador)
+            with trazador.span("publicar_preparacion"):
+                self._area_preparacion.publicar(area)
+            return salida
+        except _ERRORES_RECUPERABLES as exc:
+            if area is not None:
+                self._area_preparacion.descartar(area)
+            raise ErrorGeneracionProyecto("Falló la generación del proyecto MVP.") from exc
+
+    def _generar_en(
+        self,
+        ruta_trabajo: Path,
+        entrada: GenerarProyectoMvpEntrada,
+        entrada_normalizada: DtoEntradaNormalizada,
+        trazador: Trazador,
+    ) -> GenerarProyectoMvpSalida:
+        """Plan, manifest y auditoría sobre ``ruta_trabajo``; la salida apunta al destino final."""
+        with trazador.span("ejecutar_plan", blueprints=len(entrada_normalizada.blueprints)):
             resultado_plan = self._ejecutor_plan.ejecutar(
                 especificacion=entrada_normalizada.especificacion_proyecto,
                 blueprints=entrada_normalizada.blueprints,
-                ruta_proyecto=entrada_normalizada.ruta_proyecto,
+                ruta_proyecto=str(ruta_trabajo),
+                notificar_progreso=entrada.notificar_progreso,
+                escritura_directa=self._preparacion_aislada,
             )
+        with trazador.span("publicar_manifest"):
             self._publicador_manifest.publicar(
-                ruta_proyecto=entrada_normalizada.ruta_proyecto,
+                ruta_proyecto=str(ruta_trabajo),
                 especificacion_proyecto=entrada_normalizada.especificacion_proyecto,
                 blueprints=entrada.blueprints,
                 archivos_generados=resultado_plan.archivos_creados,
             )
-            resultado_auditoria = self._ejecutor_auditoria.ejecutar(entrada_normalizada.ruta_proyecto)
-            return GenerarProyectoMvpSalida(
-                ruta_generada=entrada_normalizada.ruta_proyecto,
-                archivos_generados=len(resultado_plan.archivos_creados),
-                valido=resultado_auditoria.valido,
-                errores=resultado_auditoria.errores,
-                warnings=resultado_auditoria.warnings,
-                auditoria=resultado_auditoria,
-            )
-        except (ErrorValidacionEntradaGeneracion, ErrorNormalizacionEntradaGeneracion, ErrorDominio):
-            raise
-        except (
-            ErrorPreparacionEstructuraGeneracion,
-            ErrorEjecucionPlanGeneracion,
-            ErrorPublicacionManifestGeneracion,
-            ErrorAuditoriaGeneracion,
-            ErrorInfraestructura,
-            OSError,
-            ValueError,
-        ) as exc:
-            self._rollback.ejecutar(
-                ruta_proyecto,
-                carpeta_creada_en_ejecucion or not carpeta_existia_antes or carpeta_existia_vacia,
-            )
-            raise ErrorGeneracionProyecto("Falló la generación del proyecto MVP.") from exc
+        with trazador.span("auditoria"):
+            resultado_auditoria = self._ejecutor_auditoria.ejecutar(str(ruta_trabajo))
+        return GenerarProyectoMvpSalida(
+            ruta_generada=entrada_normalizada.ruta_proyecto,
+            archivos_generados=len(resultado_plan.archivos_creados),
+            valido=resultado_auditoria.valido,
+            errores=resultado_auditoria.errores,
+            warnings=resultado_auditoria.warnings,
+            auditoria=resultado_auditoria,
+        )
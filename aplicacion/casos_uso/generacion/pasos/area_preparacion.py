@@ -0,0 +1,77 @@
+"""Paso para generar en un directorio hermano y publicarlo con un renombrado."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import shutil
+from uuid import uuid4
+
+from aplicacion.casos_uso.generacion.pasos.errores_pipeline import ErrorPreparacionEstructuraGeneracion
+from aplicacion.puertos.sistema_archivos import SistemaArchivos
+
+
+@dataclass(frozen=True)
+class AreaPreparacion:
+    """Directorio de trabajo reservado para publicarse en ``ruta_proyecto``."""
+
+    ruta: Path
+    ruta_proyecto: Path
+    destino_vacio_retirado: bool
+
+
+class AreaPreparacionGeneracion:
+    """Gestiona el directorio de preparación de una generación.
+
+    El área vive junto al destino, en el mismo sistema de archivos, para que
+    publicarla sea un único ``rename`` sobre una ruta inexistente: otros
+    procesos ven el proyecto completo o no lo ven. Descartarla deja el
+    destino como estaba.
+    """
+
+    PREFIJO = ".preparacion-"
+
+    def __init__(self, sistema_archivos: SistemaArchivos) -> None:
+        self._sistema_archivos = sistema_archivos
+
+    def crear(self, ruta_proyecto: Path) -> AreaPreparacion:
+        """Reserva el destino antes de generar y crea el área junto a él.
+
+        Un destino vacío se retira ya (``rmdir`` falla si alguien lo llenó);
+        uno con contenido aborta aquí, no después de generar.
+        """
+        ruta_area = ruta_proyecto.parent / f".{ruta_proyecto.name}{self.PREFIJO}{uuid4().hex[:12]}"
+        destino_vacio_retirado = False
+        try:
+            ruta_proyecto.parent.mkdir(parents=True, exist_ok=True)
+            if ruta_proyecto.exists():
+                ruta_proyecto.rmdir()
+                destino_vacio_retirado = True
+            ruta_area.mkdir()
+        except OSError as exc:
+            if destino_vacio_retirado:
+                ruta_proyecto.mkdir(exist_ok=True)
+            raise ErrorPreparacionEstructuraGeneracion(
+                f"No se pudo reservar el destino '{ruta_proyecto}': debe estar vacío o no existir."
+            ) from exc
+        return AreaPreparacion(ruta_area, ruta_proyecto, destino_vacio_retirado)
+
+    def publicar(self, area: AreaPreparacion) -> None:
+        """Renombra el área al destino y sincroniza el directorio padre si el modo lo pide."""
+        try:
+            os.rename(area.ruta, area.ruta_proyecto)
+            self._sistema_archivos.sincronizar_directorio(str(area.ruta_proyecto.parent))
+        except OSError as exc:
+            raise ErrorPreparacionEstructuraGeneracion(
+                f"No se pudo publicar el proyecto generado en '{area.ruta_proyecto}'."
+            ) from exc
+
+    def descartar(self, area: AreaPreparacion) -> bool:
+        """Elimina el área y repone el destino vacío si se retiró al reservarlo."""
+        if area.destino_vacio_retirado:
+            area.ruta_proyecto.mkdir(exist_ok=True)
+        if not area.ruta.exists():
+            return False
+        shutil.rmtree(area.ruta, ignore_errors=True)
+        return True
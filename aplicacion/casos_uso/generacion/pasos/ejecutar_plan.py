@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from aplicacion.casos_uso.crear_plan_desde_blueprints import CrearPlanDesdeBlueprints
-from aplicacion.casos_uso.ejecutar_plan import EjecutarPlan
+from aplicacion.casos_uso.ejecutar_plan import EjecutarPlan, NotificadorProgreso
 from aplicacion.casos_uso.generacion.pasos.errores_pipeline import ErrorEjecucionPlanGeneracion
 from aplicacion.errores import ErrorAplicacion
 from dominio.especificacion import EspecificacionProyecto
@@ -30,6 +30,8 @@ class EjecutorPlanGeneracion:
         especificacion: EspecificacionProyecto,
         blueprints: list[str],
         ruta_proyecto: str,
+        notificar_progreso: NotificadorProgreso | None = None,
+        escritura_directa: bool = False,
     ) -> ResultadoEjecucionPlan:
         try:
             plan = self._crear_plan.ejecutar(especificacion, blueprints)
@@ -39,6 +41,8 @@ class EjecutorPlanGeneracion:
                 opciones={"origen": "wizard_mvp"},
                 blueprints_usados=[f"{nombre}@1.0.0" for nombre in blueprints],
                 generar_manifest=True,
+                notificar_progreso=notificar_progreso,
+                escritura_directa=escritura_directa,
             )
             return ResultadoEjecucionPlan(archivos_creados=archivos_creados)
         except (ErrorAplicacion, ValueError, FileNotFoundError, OSError, RuntimeError) as exc:
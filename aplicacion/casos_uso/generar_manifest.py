@@ -9,6 +9,7 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from aplicacion.errores import ErrorIntegridadManifest
 from aplicacion.puertos.calculadora_hash import CalculadoraHash
 from dominio.manifest import EntradaManifest, ManifestProyecto
 from dominio.plan_generacion import PlanGeneracion
@@ -16,11 +17,34 @@ from dominio.plan_generacion import PlanGeneracion
 LOGGER = logging.getLogger(__name__)
 
 
+class ResolutorHashManifest:
+    """Decide el hash de cada entrada del manifest evitando relecturas de disco.
+
+    Si ya se conoce el SHA256 de los bytes escritos se usa directamente; en
+    modo ``verificar_en_disco`` se recalcula desde disco y se exige igualdad.
+    """
+
+    def __init__(self, calculadora_hash: CalculadoraHash, verificar_en_disco: bool = False) -> None:
+        self._calculadora_hash = calculadora_hash
+        self._verificar_en_disco = verificar_en_disco
+
+    def resolver(self, ruta_absoluta: Path, ruta_relativa: str, hash_conocido: str | None) -> str:
+        if hash_conocido is None:
+            return self._calculadora_hash.calcular_sha256(str(ruta_absoluta))
+        if self._verificar_en_disco:
+            hash_disco = self._calculadora_hash.calcular_sha256(str(ruta_absoluta))
+            if hash_disco != hash_conocido:
+                raise ErrorIntegridadManifest(
+                    f"El contenido en disco de '{ruta_relativa}' no coincide con el escrito."
+                )
+        return hash_conocido
+
+
 class GenerarManifest:
     """Construye y persiste manifest.json con hashes de archivos generados."""
 
-    def __init__(self, calculadora_hash: CalculadoraHash) -> None:
-        self._calculadora_hash = calculadora_hash
+    def __init__(self, calculadora_hash: CalculadoraHash, verificar_en_disco: bool = False) -> None:
+        self._resolutor_hash = ResolutorHashManifest(calculadora_hash, verificar_en_disco)
 
     def ejecutar(
         self,
@@ -29,15 +53,23 @@ class GenerarManifest:
         opciones: dict[str, Any],
         version_generador: str,
         blueprints_usados: list[str],
+        hashes_sha256: dict[str, str] | None = None,
     ) -> ManifestProyecto:
-        """Calcula hashes, crea el manifest y lo escribe en disco."""
+        """Crea el manifest y lo escribe en disco.
+
+        ``hashes_sha256`` aporta los hashes calculados al escribir; solo las
+        rutas ausentes se leen de disco para calcular su hash.
+        """
         entradas: list[EntradaManifest] = []
         ruta_base = Path(ruta_destino)
+        hashes_conocidos = hashes_sha256 or {}
 
         for archivo in plan.archivos:
             ruta_absoluta = ruta_base / archivo.ruta_relativa
-            hash_sha = self._calculadora_hash.calcular_sha256(str(ruta_absoluta))
-            LOGGER.info("Hash calculado para %s: %s", archivo.ruta_relativa, hash_sha)
+            hash_sha = self._resolutor_hash.resolver(
+                ruta_absoluta, archivo.ruta_relativa, hashes_conocidos.get(archivo.ruta_relativa)
+            )
+            LOGGER.debug("Hash calculado para %s: %s", archivo.ruta_relativa, hash_sha)
             entradas.append(
                 EntradaManifest(ruta_relativa=archivo.ruta_relativa, hash_sha256=hash_sha)
             )
@@ -50,6 +82,7 @@ class GenerarManifest:
             opciones=opciones,
         )
         self._escribir_manifest(manifest, ruta_base / "manifest.json")
+        LOGGER.info("Manifest generado con %s entradas en %s", len(entradas), ruta_destino)
         return manifest
 
     def _escribir_manifest(self, manifest: ManifestProyecto, ruta_manifest: Path) -> None:
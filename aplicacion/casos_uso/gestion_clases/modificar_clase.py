@@ -35,6 +35,8 @@ class EditarAtributo(CasoUsoGestionClases):
         tipo: str,
         obligatorio: bool,
         valor_por_defecto: str | None,
+        indexado: bool | None = None,
+        unico: bool | None = None,
     ) -> EspecificacionAtributo:
         logger.debug(
             "Intentando editar atributo id '%s' en clase id '%s'.", id_atributo, id_clase
@@ -48,6 +50,8 @@ class EditarAtributo(CasoUsoGestionClases):
                 tipo=tipo,
                 obligatorio=obligatorio,
                 valor_por_defecto=valor_por_defecto,
+                indexado=indexado,
+                unico=unico,
             )
         except ErrorValidacionDominio:
             logger.warning(
@@ -0,0 +1,162 @@
+"""Caso de uso para regenerar un proyecto escribiendo solo los archivos que cambiaron."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any
+
+from aplicacion.casos_uso.auditoria.verificador_hashes_manifest import VerificadorHashesManifest
+from aplicacion.casos_uso.crear_plan_desde_blueprints import CrearPlanDesdeBlueprints
+from aplicacion.casos_uso.ejecutar_plan import EjecutarPlan
+from aplicacion.puertos.manifest import EscritorManifest, LectorManifest
+from aplicacion.servicios.cache_renderizado import (
+    CacheRenderizado,
+    activar_cache_renderizado,
+    cache_renderizado_actual,
+)
+from dominio.especificacion import EspecificacionProyecto, ErrorValidacionDominio
+from dominio.manifest import EntradaManifest, ManifestProyecto
+from dominio.plan_generacion import PlanGeneracion
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ResultadoSincronizacion:
+    """Clasificación de rutas tras sincronizar un proyecto con su manifest."""
+
+    sin_cambios: list[str]
+    actualizados: list[str]
+    nuevos: list[str]
+    huerfanos: list[str]
+
+    def resumen(self) -> str:
+        return (
+            f"sin cambios={len(self.sin_cambios)}, actualizados={len(self.actualizados)}, "
+            f"nuevos={len(self.nuevos)}, huérfanos={len(self.huerfanos)}"
+        )
+
+
+class SincronizarProyecto:
+    """Regenera el plan completo y escribe solo los archivos cuyo hash difiere del manifest.
+
+    Cada archivo se renderiza, se hashea y su contenido se descarta antes de
+    pasar al siguiente; los que cambiaron se vuelven a renderizar al
+    escribirse. Durante la ejecución se activa una caché de renderizado
+    acotada en bytes (o se reutiliza la ya activa), así que esos textos suelen
+    salir de la caché y el proyecto nunca está entero en memoria. Los archivos
+    cuyo hash coincide con el manifest solo se reescriben si faltan en disco:
+    las ediciones locales se respetan. Con ``restaurar_editados`` también se
+    reescriben los que ya no coinciden con el manifest, detectados con
+    ``verificador_hashes`` (que reutiliza el caché de ``stat`` de la
+    auditoría). Las entradas huérfanas (presentes en el manifest pero
+    ausentes del plan) se reportan y se retiran del manifest;
+    sus archivos no se borran.
+    """
+
+    def __init__(
+        self,
+        lector_manifest: LectorManifest,
+        escritor_manifest: EscritorManifest,
+        crear_plan_desde_blueprints: CrearPlanDesdeBlueprints,
+        ejecutar_plan: EjecutarPlan,
+        verificador_hashes: VerificadorHashesManifest | None = None,
+    ) -> None:
+        self._lector_manifest = lector_manifest
+        self._escritor_manifest = escritor_manifest
+        self._crear_plan_desde_blueprints = crear_plan_desde_blueprints
+        self._ejecutar_plan = ejecutar_plan
+        self._verificador_hashes = verificador_hashes
+
+    def ejecutar(
+        self,
+        especificacion: EspecificacionProyecto,
+        ruta_proyecto: str,
+        blueprints: list[str] | None = None,
+        version_generador: str | None = None,
+        opciones: dict[str, Any] | None = None,
+        restaurar_editados: bool = False,
+    ) -> ResultadoSincronizacion:
+        manifest_actual = self._lector_manifest.leer(ruta_proyecto)
+        blueprints_usados = (
+            [f"{nombre}@1.0.0" for nombre in blueprints] if blueprints else list(manifest_actual.blueprints_usados)
+        )
+        nombres_blueprints = [nombre.split("@", maxsplit=1)[0] for nombre in blueprints_usados]
+        if not nombres_blueprints:
+            raise ErrorValidacionDominio("El manifest no declara blueprints usados para sincronizar.")
+
+        hashes_manifest = {entrada.ruta_relativa: entrada.hash_sha256 for entrada in manifest_actual.archivos}
+        with activar_cache_renderizado(cache_renderizado_actual() or CacheRenderizado()):
+            plan = self._crear_plan_desde_blueprints.ejecutar(especificacion, nombres_blueprints)
+            hashes_plan = self._hashear_plan(plan)
+            plan_cambios, sin_cambios, actualizados, nuevos = self._clasificar(
+                Path(ruta_proyecto), plan, hashes_plan, hashes_manifest, restaurar_editados
+            )
+            if plan_cambios.archivos:
+                self._ejecutar_plan.ejecutar(plan=plan_cambios, ruta_destino=ruta_proyecto, generar_manifest=False)
+        huerfanos = [ruta for ruta in hashes_manifest if ruta not in hashes_plan]
+
+        self._escritor_manifest.escribir(
+            ruta_proyecto,
+            ManifestProyecto(
+                version_generador=version_generador or manifest_actual.version_generador,
+                blueprints_usados=blueprints_usados,
+                archivos=[
+                    EntradaManifest(ruta_relativa=ruta, hash_sha256=hash_sha) for ruta, hash_sha in hashes_plan.items()
+                ],
+                timestamp_generacion=datetime.now(timezone.utc).isoformat(),
+                opciones=manifest_actual.opciones if opciones is None else opciones,
+            ),
+        )
+        resultado = ResultadoSincronizacion(
+            sin_cambios=sin_cambios,
+            actualizados=actualizados,
+            nuevos=nuevos,
+            huerfanos=huerfanos,
+        )
+        LOGGER.info("Sincronización completada en %s: %s", ruta_proyecto, resultado.resumen())
+        return resultado
+
+    @staticmethod
+    def _hashear_plan(plan: PlanGeneracion) -> dict[str, str]:
+        """SHA256 de cada archivo del plan, renderizando de uno en uno sin retener el contenido."""
+        return {
+            archivo.ruta_relativa: hashlib.sha256(archivo.renderizar().encode("utf-8")).hexdigest()
+            for archivo in plan.archivos
+        }
+
+    def _clasificar(
+        self,
+        base: Path,
+        plan: PlanGeneracion,
+        hashes_plan: dict[str, str],
+        hashes_manifest: dict[str, str],
+        restaurar_editados: bool,
+    ) -> tuple[PlanGeneracion, list[str], list[str], list[str]]:
+        """Separa rutas sin cambios, actualizadas y nuevas; las dos últimas van al plan de cambios."""
+        candidatos = {
+            ruta: hash_sha for ruta, hash_sha in hashes_plan.items() if hashes_manifest.get(ruta) == hash_sha
+        }
+        intactos = candidatos.keys() - self._archivos_desviados(base, candidatos, restaurar_editados)
+        plan_cambios = PlanGeneracion()
+        sin_cambios: list[str] = []
+        actualizados: list[str] = []
+        nuevos: list[str] = []
+        for archivo in plan.archivos:
+            if archivo.ruta_relativa in intactos:
+                sin_cambios.append(archivo.ruta_relativa)
+                continue
+            (actualizados if archivo.ruta_relativa in hashes_manifest else nuevos).append(archivo.ruta_relativa)
+            plan_cambios.agregar_archivo(archivo)
+        return plan_cambios, sin_cambios, actualizados, nuevos
+
+    def _archivos_desviados(self, base: Path, candidatos: dict[str, str], restaurar_editados: bool) -> set[str]:
+        """Rutas sin cambios en el plan que faltan en disco o, con ``restaurar_editados``, ya no coinciden."""
+        if not restaurar_editados or self._verificador_hashes is None:
+            return {ruta for ruta in candidatos if not (base / ruta).exists()}
+        verificacion = self._verificador_hashes.verificar(base, candidatos)
+        return {*verificacion.faltantes, *verificacion.inconsistentes}
@@ -12,3 +12,5 @@ class DtoAtributo:
     nombre: str
     tipo: str
     obligatorio: bool = False
+    indexado: bool = False
+    unico: bool = False
@@ -6,6 +6,7 @@ from .errores_generacion import (
     ErrorConflictoArchivos,
     ErrorGeneracionProyecto,
     ErrorInfraestructura,
+    ErrorIntegridadManifest,
 )
 from .errores_pipeline import (
     ErrorAuditoriaGeneracion,
@@ -26,6 +27,7 @@ __all__ = [
     "ErrorEjecucionPlanGeneracion",
     "ErrorGeneracionProyecto",
     "ErrorInfraestructura",
+    "ErrorIntegridadManifest",
     "ErrorNormalizacionEntradaGeneracion",
     "ErrorPreparacionEstructuraGeneracion",
     "ErrorPublicacionManifestGeneracion",
@@ -19,3 +19,7 @@ class ErrorBlueprintNoEncontrado(ErrorAplicacion):
 
 class ErrorInfraestructura(ErrorAplicacion):
     """Error técnico proveniente de un adaptador de infraestructura."""
+
+
+class ErrorIntegridadManifest(ErrorAplicacion):
+    """Error cuando el contenido en disco no coincide con el hash registrado."""
@@ -27,6 +27,22 @@ class Blueprint(ABC):
     def generar_plan(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
         """Genera un plan parcial a partir de la especificación."""
 
+    def generar_plan_diferido(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
+        """Genera el plan con rutas resueltas y contenidos renderizados al escribir.
+
+        Por defecto delega en ``generar_plan``; los blueprints con muchos
+        archivos lo sobrescriben para no retener todo el texto en memoria.
+        """
+        return self.generar_plan(especificacion)
+
+    def obtener_rutas(self, especificacion: EspecificacionProyecto) -> list[str]:
+        """Enumera las rutas que generaría ``generar_plan`` sin renderizar contenidos.
+
+        Por defecto usa el plan diferido, que ya resuelve rutas sin texto; los
+        blueprints sin plan diferido deben sobrescribirlo si renderizar es caro.
+        """
+        return self.generar_plan_diferido(especificacion).obtener_rutas()
+
 
 class RepositorioBlueprints(ABC):
     """Contrato de acceso a blueprints disponibles en el sistema."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
 from dominio.manifest import ManifestProyecto
 
@@ -21,3 +22,25 @@ class EscritorManifest(ABC):
     @abstractmethod
     def escribir(self, ruta_proyecto: str, manifest: ManifestProyecto) -> None:
         """Persiste el manifest del proyecto."""
+
+
+@dataclass(frozen=True)
+class EstadoArchivoManifest:
+    """``stat`` de un archivo del proyecto junto al hash con el que fue verificado."""
+
+    mtime_ns: int
+    tamano: int
+    inodo: int
+    hash_sha256: str
+
+
+class CacheEstadoManifest(ABC):
+    """Contrato para el caché de ``stat`` que acompaña a manifest.json."""
+
+    @abstractmethod
+    def cargar(self, ruta_proyecto: str) -> dict[str, EstadoArchivoManifest]:
+        """Retorna los estados guardados por ruta relativa; vacío si no hay caché."""
+
+    @abstractmethod
+    def guardar(self, ruta_proyecto: str, estados: dict[str, EstadoArchivoManifest]) -> None:
+        """Reemplaza el caché del proyecto."""
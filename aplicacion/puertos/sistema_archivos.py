@@ -3,15 +3,59 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+
+ContenidoArchivo = str | Callable[[], str]
+
+
+def resolver_contenido(contenido: ContenidoArchivo) -> str:
+    """Retorna el texto de una escritura, renderizándolo si es diferido."""
+    return contenido() if callable(contenido) else contenido
 
 
 class SistemaArchivos(ABC):
     """Define el contrato para escritura y creación de directorios."""
 
     @abstractmethod
-    def escribir_texto_atomico(self, ruta_absoluta: str, contenido: str) -> None:
-        """Escribe texto de forma atómica en una ruta absoluta."""
+    def escribir_texto_atomico(self, ruta_absoluta: str, contenido: str) -> str:
+        """Escribe texto UTF-8 de forma atómica y retorna el SHA256 de los bytes escritos."""
 
     @abstractmethod
     def asegurar_directorio(self, ruta_absoluta: str) -> None:
         """Asegura la existencia de un directorio."""
+
+    def sincronizar_directorio(self, ruta_absoluta: str) -> None:
+        """Hace durables las entradas de un directorio si el adaptador lo exige; por defecto no hace nada."""
+
+    def escribir_lote_atomico(
+        self,
+        escrituras: Sequence[tuple[str, ContenidoArchivo]],
+        al_escribir: Callable[[str], None] | None = None,
+    ) -> list[str]:
+        """Escribe un lote de archivos cuyos directorios padre ya existen.
+
+        Retorna los SHA256 en el mismo orden que ``escrituras``. Un contenido
+        invocable se renderiza justo antes de escribir su archivo, de modo que
+        el lote no retiene todos los textos a la vez. La implementación por
+        defecto es secuencial; los adaptadores pueden paralelizarla siempre
+        que cada archivo mantenga la escritura atómica.
+        """
+        hashes: list[str] = []
+        for ruta_absoluta, contenido in escrituras:
+            hashes.append(self.escribir_texto_atomico(ruta_absoluta, resolver_contenido(contenido)))
+            if al_escribir is not None:
+                al_escribir(ruta_absoluta)
+        return hashes
+
+    def escribir_lote_directo(
+        self,
+        escrituras: Sequence[tuple[str, ContenidoArchivo]],
+        al_escribir: Callable[[str], None] | None = None,
+    ) -> list[str]:
+        """Escribe un lote dentro de un área de preparación que nadie observa aún.
+
+        El área se publica después con un único renombrado, así que cada
+        archivo puede escribirse en su ruta final sin temporal propio. La
+        implementación por defecto conserva la escritura atómica.
+        """
+        return self.escribir_lote_atomico(escrituras, al_escribir)
@@ -0,0 +1,86 @@
+"""Caché de contenidos renderizados, acotada por bytes y activa solo durante una ejecución."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import threading
+
+CAPACIDAD_BYTES_POR_DEFECTO = 64 * 1024 * 1024
+
+ClaveRenderizado = tuple[str, str, str, str]
+
+
+class CacheRenderizado:
+    """Memoriza textos por ``(blueprint, versión, plantilla, huella de clase)`` con desalojo LRU.
+
+    El límite es la suma de bytes UTF-8 de los textos retenidos; un texto
+    mayor que el límite se devuelve sin guardarse. Es segura entre hilos: el
+    plan diferido puede renderizarse desde el pool de escritura. Dos fallos
+    simultáneos de la misma clave renderizan dos veces, pero el resultado es
+    idéntico.
+    """
+
+    def __init__(self, max_bytes: int = CAPACIDAD_BYTES_POR_DEFECTO) -> None:
+        self._max_bytes = max(0, max_bytes)
+        self._entradas: OrderedDict[ClaveRenderizado, tuple[str, int]] = OrderedDict()
+        self._bytes = 0
+        self._candado = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener_o_renderizar(self, clave: ClaveRenderizado, renderizar: Callable[[], str]) -> str:
+        with self._candado:
+            entrada = self._entradas.get(clave)
+            if entrada is not None:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return entrada[0]
+            self.fallos += 1
+
+        contenido = renderizar()
+        tamano = len(contenido.encode("utf-8"))
+        if tamano > self._max_bytes:
+            return contenido
+        with self._candado:
+            anterior = self._entradas.pop(clave, None)
+            if anterior is not None:
+                self._bytes -= anterior[1]
+            self._entradas[clave] = (contenido, tamano)
+            self._bytes += tamano
+            while self._bytes > self._max_bytes:
+                _, (_, tamano_desalojado) = self._entradas.popitem(last=False)
+                self._bytes -= tamano_desalojado
+        return contenido
+
+    def estadisticas(self) -> dict[str, int]:
+        with self._candado:
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "entradas": len(self._entradas),
+                "bytes": self._bytes,
+            }
+
+
+_CACHE_ACTIVA: ContextVar[CacheRenderizado | None] = ContextVar("cache_renderizado_activa", default=None)
+
+
+def cache_renderizado_actual() -> CacheRenderizado | None:
+    return _CACHE_ACTIVA.get()
+
+
+@contextmanager
+def activar_cache_renderizado(cache: CacheRenderizado | None) -> Iterator[CacheRenderizado | None]:
+    """Hace que los planes creados en este contexto memoricen sus textos en ``cache``.
+
+    Sin caché activa los blueprints renderizan siempre; la caché vive mientras
+    la retengan quien la activó y los planes diferidos creados con ella.
+    """
+    token = _CACHE_ACTIVA.set(cache)
+    try:
+        yield cache
+    finally:
+        _CACHE_ACTIVA.reset(token)
@@ -0,0 +1,138 @@
+"""Trazado ligero por spans para medir las etapas de la generación."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+import json
+from pathlib import Path
+import threading
+from time import perf_counter_ns
+from typing import Any
+
+_SPAN_PADRE: ContextVar[int | None] = ContextVar("span_padre", default=None)
+_SPAN_NULO: AbstractContextManager[None] = nullcontext()
+
+
+@dataclass
+class SpanTraza:
+    """Intervalo medido; los tiempos son relativos al inicio de la traza."""
+
+    identificador: int
+    nombre: str
+    padre: int | None
+    inicio_ns: int
+    duracion_ns: int = 0
+    hilo: str = ""
+    atributos: dict[str, Any] = field(default_factory=dict)
+
+
+class Trazador:
+    """Acumula spans anidados y contadores de una ejecución.
+
+    Registrar un span cuesta dos lecturas de reloj y un append bajo candado,
+    así que puede quedar activo en producción. Es seguro entre hilos; el
+    anidamiento se sigue por contexto, no por hilo.
+    """
+
+    def __init__(self) -> None:
+        self._origen_ns = perf_counter_ns()
+        self._spans: list[SpanTraza] = []
+        self._contadores: dict[str, int] = {}
+        self._candado = threading.Lock()
+
+    @contextmanager
+    def span(self, nombre: str, /, **atributos: Any) -> Iterator[SpanTraza]:
+        inicio_ns = perf_counter_ns()
+        with self._candado:
+            span = SpanTraza(
+                identificador=len(self._spans),
+                nombre=nombre,
+                padre=_SPAN_PADRE.get(),
+                inicio_ns=inicio_ns - self._origen_ns,
+                hilo=threading.current_thread().name,
+                atributos=atributos,
+            )
+            self._spans.append(span)
+        token = _SPAN_PADRE.set(span.identificador)
+        try:
+            yield span
+        finally:
+            span.duracion_ns = perf_counter_ns() - inicio_ns
+            _SPAN_PADRE.reset(token)
+
+    def incrementar(self, contador: str, valor: int = 1) -> None:
+        with self._candado:
+            self._contadores[contador] = self._contadores.get(contador, 0) + valor
+
+    @property
+    def spans(self) -> list[SpanTraza]:
+        with self._candado:
+            return list(self._spans)
+
+    @property
+    def contadores(self) -> dict[str, int]:
+        with self._candado:
+            return dict(self._contadores)
+
+    def a_dict(self) -> dict[str, Any]:
+        return {
+            "duracion_total_ms": round((perf_counter_ns() - self._origen_ns) / 1_000_000, 3),
+            "contadores": self.contadores,
+            "spans": [asdict(span) for span in self.spans],
+        }
+
+    def a_json(self) -> str:
+        return json.dumps(self.a_dict(), ensure_ascii=False, indent=2)
+
+    def resumen(self) -> list[str]:
+        """Una línea por span, sangrada según su profundidad, más los contadores."""
+        spans = self.spans
+        profundidades: dict[int, int] = {}
+        lineas: list[str] = []
+        for span in spans:
+            profundidad = 0 if span.padre is None else profundidades.get(span.padre, 0) + 1
+            profundidades[span.identificador] = profundidad
+            detalle = "".join(f" {clave}={valor}" for clave, valor in span.atributos.items())
+            lineas.append(f"{'  ' * profundidad}{span.nombre}{detalle}: {span.duracion_ns / 1_000_000:.2f} ms")
+        lineas.extend(f"{nombre}={valor}" for nombre, valor in sorted(self.contadores.items()))
+        return lineas
+
+
+_TRAZADOR_ACTIVO: ContextVar[Trazador | None] = ContextVar("trazador_activo", default=None)
+
+
+def trazador_actual() -> Trazador | None:
+    return _TRAZADOR_ACTIVO.get()
+
+
+@contextmanager
+def activar_trazador(trazador: Trazador | None) -> Iterator[Trazador | None]:
+    """Hace de ``trazador`` el destino de ``span`` e ``incrementar`` en este contexto."""
+    token = _TRAZADOR_ACTIVO.set(trazador)
+    try:
+        yield trazador
+    finally:
+        _TRAZADOR_ACTIVO.reset(token)
+
+
+def span(nombre: str, /, **atributos: Any) -> AbstractContextManager[SpanTraza | None]:
+    """Span en el trazador activo; sin trazador es un contexto vacío sin coste."""
+    trazador = _TRAZADOR_ACTIVO.get()
+    if trazador is None:
+        return _SPAN_NULO
+    return trazador.span(nombre, **atributos)
+
+
+def incrementar(contador: str, valor: int = 1) -> None:
+    trazador = _TRAZADOR_ACTIVO.get()
+    if trazador is not None:
+        trazador.incrementar(contador, valor)
+
+
+def ruta_traza_junto_a(ruta_proyecto: str) -> Path:
+    """``<padre>/<proyecto>.traza.json``: fuera del proyecto para no alterar su manifest ni su auditoría."""
+    proyecto = Path(ruta_proyecto)
+    return proyecto.parent / f"{proyecto.name}.traza.json"
@@ -0,0 +1,31 @@
+"""Huella de clase con la que los blueprints indexan la caché de renderizado."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+
+def huella_clase(clase: Any) -> str:
+    """Hash estable de lo que influye en el renderizado de una clase.
+
+    Ignora ``id_interno`` para que dos especificaciones equivalentes (por
+    ejemplo, un preset recargado) compartan entradas de caché.
+    """
+    datos = {
+        "nombre": clase.nombre,
+        "atributos": [
+            [
+                atributo.nombre,
+                atributo.tipo,
+                atributo.obligatorio,
+                getattr(atributo, "valor_por_defecto", None),
+                getattr(atributo, "indexado", False),
+                getattr(atributo, "unico", False),
+            ]
+            for atributo in clase.atributos
+        ],
+    }
+    serializado = json.dumps(datos, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serializado.encode("utf-8")).hexdigest()
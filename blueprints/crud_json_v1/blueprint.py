@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 import textwrap
+from typing import Any
 
 from aplicacion.puertos.blueprint import Blueprint
+from aplicacion.servicios.cache_renderizado import cache_renderizado_actual
+from blueprints.cache_renderizado import huella_clase
 from dominio.especificacion import (
     EspecificacionClase,
     EspecificacionProyecto,
@@ -40,49 +45,75 @@ class CrudJsonBlueprint(Blueprint):
             )
 
     def generar_plan(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
+        return self.generar_plan_diferido(especificacion).materializar()
+
+    def generar_plan_diferido(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
         self.validar(especificacion)
 
         archivos: list[ArchivoGenerado] = [ArchivoGenerado("datos/.gitkeep", "")]
 
         for clase in especificacion.clases:
             nombres = self._construir_nombres(clase)
+            huella = huella_clase(clase)
             archivos.extend(
                 [
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"dominio/entidades/{nombres.nombre_snake}.py",
-                        self._contenido_entidad(clase, nombres),
+                        huella,
+                        self._contenido_entidad,
+                        clase,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"aplicacion/puertos/repositorio_{nombres.nombre_snake}.py",
-                        self._contenido_puerto(nombres),
+                        huella,
+                        self._contenido_puerto,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"aplicacion/casos_uso/{nombres.nombre_snake}/crear_{nombres.nombre_snake}.py",
-                        self._contenido_caso_uso_crear(clase, nombres),
+                        huella,
+                        self._contenido_caso_uso_crear,
+                        clase,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"aplicacion/casos_uso/{nombres.nombre_snake}/obtener_{nombres.nombre_snake}.py",
-                        self._contenido_caso_uso_obtener(nombres),
+                        huella,
+                        self._contenido_caso_uso_obtener,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"aplicacion/casos_uso/{nombres.nombre_snake}/listar_{nombres.nombre_plural}.py",
-                        self._contenido_caso_uso_listar(nombres),
+                        huella,
+                        self._contenido_caso_uso_listar,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"aplicacion/casos_uso/{nombres.nombre_snake}/actualizar_{nombres.nombre_snake}.py",
-                        self._contenido_caso_uso_actualizar(clase, nombres),
+                        huella,
+                        self._contenido_caso_uso_actualizar,
+                        clase,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"aplicacion/casos_uso/{nombres.nombre_snake}/eliminar_{nombres.nombre_snake}.py",
-                        self._contenido_caso_uso_eliminar(nombres),
+                        huella,
+                        self._contenido_caso_uso_eliminar,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"infraestructura/persistencia/json/repositorio_{nombres.nombre_snake}_json.py",
-                        self._contenido_repositorio_json(nombres),
+                        huella,
+                        self._contenido_repositorio_json,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"tests/aplicacion/test_crud_{nombres.nombre_snake}.py",
-                        self._contenido_test_crud(clase, nombres),
+                        huella,
+                        self._contenido_test_crud,
+                        clase,
+                        nombres,
                     ),
                     ArchivoGenerado(f"datos/{nombres.nombre_plural}.json", "[]\n"),
                 ]
@@ -92,6 +123,21 @@ class CrudJsonBlueprint(Blueprint):
         plan.validar_sin_conflictos()
         return plan
 
+    def _archivo_renderizado(
+        self,
+        ruta_relativa: str,
+        huella: str,
+        plantilla: Callable[..., str],
+        *argumentos: Any,
+    ) -> ArchivoGenerado:
+        """Archivo diferido; con caché de renderizado activa, su texto se memoriza por plantilla y clase."""
+        renderizar = partial(plantilla, *argumentos)
+        cache = cache_renderizado_actual()
+        if cache is None:
+            return ArchivoGenerado.diferido(ruta_relativa, renderizar)
+        clave = (self.nombre(), self.version(), plantilla.__name__, huella)
+        return ArchivoGenerado.diferido(ruta_relativa, partial(cache.obtener_o_renderizar, clave, renderizar))
+
     def _construir_nombres(self, clase: EspecificacionClase) -> NombresClase:
         nombre_snake = self._pascal_a_snake(clase.nombre)
         return NombresClase(
@@ -171,6 +217,7 @@ class CrudJsonBlueprint(Blueprint):
             from __future__ import annotations
 
             from abc import ABC, abstractmethod
+            from collections.abc import Mapping
 
             from dominio.entidades.{nombres.nombre_snake} import {nombres.nombre_clase}
 
@@ -188,6 +235,18 @@ class CrudJsonBlueprint(Blueprint):
                 def listar(self) -> list[{nombres.nombre_clase}]:
                     """Lista todas las entidades."""
 
+                @abstractmethod
+                def listar_pagina(
+                    self,
+                    limite: int,
+                    despues_de_id: int = 0,
+                    filtros: Mapping[str, object] | None = None,
+                ) -> list[{nombres.nombre_clase}]:
+                    """Lista hasta ``limite`` entidades con id mayor que ``despues_de_id``, en orden de id.
+
+                    ``filtros`` exige igualdad sobre atributos declarados de la entidad.
+                    """
+
                 @abstractmethod
                 def actualizar(self, entidad: {nombres.nombre_clase}) -> {nombres.nombre_clase}:
                     """Actualiza una entidad existente."""
@@ -276,6 +335,7 @@ class CrudJsonBlueprint(Blueprint):
 
             from __future__ import annotations
 
+            from collections.abc import Mapping
             import logging
 
             from aplicacion.puertos.repositorio_{nombres.nombre_snake} import Repositorio{nombres.nombre_clase}
@@ -291,6 +351,15 @@ class CrudJsonBlueprint(Blueprint):
                 def ejecutar(self) -> list[{nombres.nombre_clase}]:
                     LOGGER.info("Listando {nombres.nombre_plural}.")
                     return self._repositorio.listar()
+
+                def ejecutar_pagina(
+                    self,
+                    limite: int,
+                    despues_de_id: int = 0,
+                    filtros: Mapping[str, object] | None = None,
+                ) -> list[{nombres.nombre_clase}]:
+                    LOGGER.info("Listando página de {nombres.nombre_plural} tras id=%s", despues_de_id)
+                    return self._repositorio.listar_pagina(limite, despues_de_id, filtros)
             '''
         )
 
@@ -355,8 +424,10 @@ class CrudJsonBlueprint(Blueprint):
             self._generar_metodo_guardar_json(nombres),
             self._generar_metodo_obtener_json(nombres),
             self._generar_metodo_listar_json(nombres),
+            self._generar_metodo_listar_pagina_json(nombres),
             self._generar_metodo_actualizar_json(nombres),
             self._generar_metodo_eliminar_json(nombres),
+            self._generar_metodo_lote_json(),
             self._generar_utilidades_json(),
         ]
         primera_parte = partes[0].rstrip("\n")
@@ -370,6 +441,10 @@ class CrudJsonBlueprint(Blueprint):
 
             from __future__ import annotations
 
+            from bisect import bisect_right
+            from collections.abc import Iterator, Mapping
+            from contextlib import contextmanager
+            from dataclasses import fields
             import json
             import logging
             from pathlib import Path
@@ -386,11 +461,25 @@ class CrudJsonBlueprint(Blueprint):
         return textwrap.dedent(
             f'''\
             class Repositorio{nombres.nombre_clase}Json(Repositorio{nombres.nombre_clase}):
+                """Repositorio JSON con índice por id en memoria.
+
+                El archivo solo se vuelve a leer cuando cambian su mtime o su tamaño.
+                Dentro de ``lote()`` las mutaciones se acumulan y se escriben una vez.
+                """
+
+                CAMPOS_FILTRABLES = frozenset(campo.name for campo in fields({nombres.nombre_clase}))
+
                 def __init__(self, ruta_base: str) -> None:
                     self._ruta_archivo = Path(ruta_base) / "datos" / "{nombres.nombre_plural}.json"
                     self._ruta_archivo.parent.mkdir(parents=True, exist_ok=True)
+                    self._indice: dict[int, dict] = {{}}
+                    self._ids_ordenados: list[int] | None = None
+                    self._siguiente_id = 1
+                    self._firma_archivo: tuple[int, int] | None = None
+                    self._profundidad_lote = 0
+                    self._cambios_pendientes = False
                     if not self._ruta_archivo.exists():
-                        self._escribir_datos([])
+                        self._escribir_datos()
             '''
         )
 
@@ -399,11 +488,14 @@ class CrudJsonBlueprint(Blueprint):
             textwrap.dedent(
                 f'''\
                 def crear(self, entidad: {nombres.nombre_clase}) -> {nombres.nombre_clase}:
-                    datos = self._leer_datos()
-                    nuevo_id = max((item.get("id", 0) for item in datos), default=0) + 1
+                    self._sincronizar()
+                    nuevo_id = self._siguiente_id
                     entidad_persistida = {nombres.nombre_clase}(**{{**entidad.__dict__, "id": nuevo_id}})
-                    datos.append(entidad_persistida.__dict__)
-                    self._escribir_datos(datos)
+                    self._indice[nuevo_id] = dict(entidad_persistida.__dict__)
+                    self._siguiente_id = nuevo_id + 1
+                    if self._ids_ordenados is not None:
+                        self._ids_ordenados.append(nuevo_id)
+                    self._guardar()
                     LOGGER.info("{nombres.nombre_clase} creada id=%s", nuevo_id)
                     return entidad_persistida
                 '''
@@ -415,10 +507,11 @@ class CrudJsonBlueprint(Blueprint):
             textwrap.dedent(
                 f'''\
                 def obtener_por_id(self, entidad_id: int) -> {nombres.nombre_clase}:
-                    for item in self._leer_datos():
-                        if item.get("id") == entidad_id:
-                            return {nombres.nombre_clase}(**item)
-                    raise ValueError("{nombres.nombre_clase} no encontrado")
+                    self._sincronizar()
+                    item = self._indice.get(entidad_id)
+                    if item is None:
+                        raise ValueError("{nombres.nombre_clase} no encontrado")
+                    return {nombres.nombre_clase}(**item)
                 '''
             )
         )
@@ -428,7 +521,40 @@ class CrudJsonBlueprint(Blueprint):
             textwrap.dedent(
                 f'''\
                 def listar(self) -> list[{nombres.nombre_clase}]:
-                    return [{nombres.nombre_clase}(**item) for item in self._leer_datos()]
+                    self._sincronizar()
+                    return [{nombres.nombre_clase}(**item) for item in self._indice.values()]
+                '''
+            )
+        )
+
+    def _generar_metodo_listar_pagina_json(self, nombres: NombresClase) -> str:
+        return self._indentar_bloque_clase(
+            textwrap.dedent(
+                f'''\
+                def listar_pagina(
+                    self,
+                    limite: int,
+                    despues_de_id: int = 0,
+                    filtros: Mapping[str, object] | None = None,
+                ) -> list[{nombres.nombre_clase}]:
+                    criterios = dict(filtros or {{}})
+                    desconocidos = sorted(set(criterios) - self.CAMPOS_FILTRABLES)
+                    if desconocidos:
+                        raise ValueError(f"Campos de filtro no soportados: {{', '.join(desconocidos)}}")
+                    if limite < 1:
+                        raise ValueError("El límite de página debe ser mayor que cero")
+                    self._sincronizar()
+                    if self._ids_ordenados is None:
+                        self._ids_ordenados = sorted(self._indice)
+                    ids = self._ids_ordenados
+                    pagina: list[{nombres.nombre_clase}] = []
+                    for posicion in range(bisect_right(ids, despues_de_id), len(ids)):
+                        item = self._indice[ids[posicion]]
+                        if all(item.get(campo) == valor for campo, valor in criterios.items()):
+                            pagina.append({nombres.nombre_clase}(**item))
+                            if len(pagina) == limite:
+                                break
+                    return pagina
                 '''
             )
         )
@@ -438,14 +564,13 @@ class CrudJsonBlueprint(Blueprint):
             textwrap.dedent(
                 f'''\
                 def actualizar(self, entidad: {nombres.nombre_clase}) -> {nombres.nombre_clase}:
-                    datos = self._leer_datos()
-                    for indice, item in enumerate(datos):
-                        if item.get("id") == entidad.id:
-                            datos[indice] = entidad.__dict__
-                            self._escribir_datos(datos)
-                            LOGGER.info("{nombres.nombre_clase} actualizada id=%s", entidad.id)
-                            return entidad
-                    raise ValueError("{nombres.nombre_clase} no encontrado")
+                    self._sincronizar()
+                    if entidad.id not in self._indice:
+                        raise ValueError("{nombres.nombre_clase} no encontrado")
+                    self._indice[entidad.id] = dict(entidad.__dict__)
+                    self._guardar()
+                    LOGGER.info("{nombres.nombre_clase} actualizada id=%s", entidad.id)
+                    return entidad
                 '''
             )
         )
@@ -455,26 +580,72 @@ class CrudJsonBlueprint(Blueprint):
             textwrap.dedent(
                 f'''\
                 def eliminar(self, entidad_id: int) -> None:
-                    datos = self._leer_datos()
-                    filtrados = [item for item in datos if item.get("id") != entidad_id]
-                    if len(filtrados) == len(datos):
+                    self._sincronizar()
+                    if self._indice.pop(entidad_id, None) is None:
                         raise ValueError("{nombres.nombre_clase} no encontrado")
-                    self._escribir_datos(filtrados)
+                    self._ids_ordenados = None
+                    self._guardar()
                     LOGGER.info("{nombres.nombre_clase} eliminada id=%s", entidad_id)
                 '''
             )
         )
 
+    def _generar_metodo_lote_json(self) -> str:
+        return self._indentar_bloque_clase(
+            textwrap.dedent(
+                '''\
+                @contextmanager
+                def lote(self) -> Iterator[None]:
+                    """Agrupa las mutaciones del bloque en una sola escritura al salir.
+
+                    Si el bloque más externo termina con una excepción, los cambios
+                    en memoria se descartan y se recarga el estado del disco.
+                    """
+                    self._sincronizar()
+                    self._profundidad_lote += 1
+                    try:
+                        yield
+                    except BaseException:
+                        self._profundidad_lote -= 1
+                        if self._profundidad_lote == 0:
+                            self._descartar_cambios()
+                        raise
+                    self._profundidad_lote -= 1
+                    if self._profundidad_lote == 0 and self._cambios_pendientes:
+                        self._escribir_datos()
+                '''
+            )
+        )
+
     def _generar_utilidades_json(self) -> str:
         bloque = "\n".join(
             [
-                "def _leer_datos(self) -> list[dict]:",
+                "def _sincronizar(self) -> None:",
+                "    if self._profundidad_lote:",
+                "        return",
+                "    estado = self._ruta_archivo.stat()",
+                "    firma = (estado.st_mtime_ns, estado.st_size)",
+                "    if firma == self._firma_archivo:",
+                "        return",
                 '    contenido = self._ruta_archivo.read_text(encoding="utf-8").strip()',
-                "    if not contenido:",
-                "        return []",
-                "    return json.loads(contenido)",
+                "    datos = json.loads(contenido) if contenido else []",
+                '    self._indice = {item["id"]: item for item in datos}',
+                "    self._ids_ordenados = None",
+                "    self._siguiente_id = max(self._indice, default=0) + 1",
+                "    self._firma_archivo = firma",
+                "",
+                "def _descartar_cambios(self) -> None:",
+                "    self._cambios_pendientes = False",
+                "    self._firma_archivo = None",
+                "    self._sincronizar()",
                 "",
-                "def _escribir_datos(self, datos: list[dict]) -> None:",
+                "def _guardar(self) -> None:",
+                "    if self._profundidad_lote:",
+                "        self._cambios_pendientes = True",
+                "        return",
+                "    self._escribir_datos()",
+                "",
+                "def _escribir_datos(self) -> None:",
                 "    descriptor, ruta_tmp = tempfile.mkstemp(",
                 "        dir=str(self._ruta_archivo.parent),",
                 '        prefix=f".{self._ruta_archivo.name}.",',
@@ -483,12 +654,15 @@ class CrudJsonBlueprint(Blueprint):
                 "    ruta_tmp_path = Path(ruta_tmp)",
                 "    try:",
                 '        with open(descriptor, "w", encoding="utf-8", closefd=True) as archivo_tmp:',
-                "            json.dump(datos, archivo_tmp, ensure_ascii=False, indent=2)",
+                '            json.dump(list(self._indice.values()), archivo_tmp, ensure_ascii=False, separators=(",", ":"))',
                 '            archivo_tmp.write("\\n")',
                 "        ruta_tmp_path.replace(self._ruta_archivo)",
                 "    finally:",
                 "        if ruta_tmp_path.exists():",
                 "            ruta_tmp_path.unlink()",
+                "    estado = self._ruta_archivo.stat()",
+                "    self._firma_archivo = (estado.st_mtime_ns, estado.st_size)",
+                "    self._cambios_pendientes = False",
             ]
         )
         return self._indentar_bloque_clase(bloque)
@@ -510,6 +684,8 @@ class CrudJsonBlueprint(Blueprint):
             self._generar_test_update(nombres, kwargs_crear, kwargs_actualizar, assert_actualizar),
             self._generar_test_delete(nombres, kwargs_crear),
             self._generar_utilidades_test(nombres),
+            self._generar_test_paginacion(nombres, self._generar_kwargs_test_iteracion(clase)),
+            self._generar_test_lote_revertido(nombres, kwargs_crear),
         ]
         return "\n\n".join(parte for parte in partes if parte)
 
@@ -532,6 +708,31 @@ class CrudJsonBlueprint(Blueprint):
             if atributo.nombre != "id"
         )
 
+    def _valor_test_iteracion(self, tipo_original: str, vuelta: int | None = None) -> str:
+        """Valor distinto en cada vuelta del bucle de un test.
+
+        Sin ``vuelta`` devuelve la expresión sobre la variable ``i`` del bucle;
+        con ella, el literal que esa expresión produce en esa vuelta.
+        """
+        tipo = self._tipo_python(tipo_original)
+        if tipo == "int":
+            return "i" if vuelta is None else str(vuelta)
+        if tipo == "float":
+            return "i + 0.5" if vuelta is None else str(vuelta + 0.5)
+        if tipo == "bool":
+            return "i % 2 == 0" if vuelta is None else str(vuelta % 2 == 0)
+        return 'f"valor{i}"' if vuelta is None else f'"valor{vuelta}"'
+
+    def _generar_kwargs_test_iteracion(
+        self, clase: EspecificacionClase, fijos: dict[str, str] | None = None
+    ) -> str:
+        fijos = fijos or {}
+        return ", ".join(
+            f"{atributo.nombre}={fijos.get(atributo.nombre) or self._valor_test_iteracion(atributo.tipo)}"
+            for atributo in clase.atributos
+            if atributo.nombre != "id"
+        )
+
     def _generar_asserts_test(self, clase: EspecificacionClase) -> tuple[str, str]:
         primer = next((a for a in clase.atributos if a.nombre != "id"), None)
         if primer is None:
@@ -627,3 +828,39 @@ class CrudJsonBlueprint(Blueprint):
                 assert repo.listar() == []
             '''
         )
+
+    def _generar_test_lote_revertido(self, nombres: NombresClase, kwargs_crear: str) -> str:
+        return textwrap.dedent(
+            f'''\
+            def test_lote_con_excepcion_no_persiste_cambios(tmp_path) -> None:
+                repo = Repositorio{nombres.nombre_clase}Json(str(tmp_path))
+                existente = repo.crear({nombres.nombre_clase}(id=0{', ' + kwargs_crear if kwargs_crear else ''}))
+
+                with pytest.raises(RuntimeError, match="abortar"):
+                    with repo.lote():
+                        repo.crear({nombres.nombre_clase}(id=0{', ' + kwargs_crear if kwargs_crear else ''}))
+                        repo.eliminar(existente.id)
+                        raise RuntimeError("abortar")
+
+                assert [entidad.id for entidad in repo.listar()] == [existente.id]
+                recargado = Repositorio{nombres.nombre_clase}Json(str(tmp_path))
+                assert [entidad.id for entidad in recargado.listar()] == [existente.id]
+                assert repo.crear({nombres.nombre_clase}(id=0{', ' + kwargs_crear if kwargs_crear else ''})).id == 2
+            '''
+        )
+
+    def _generar_test_paginacion(self, nombres: NombresClase, kwargs_crear: str) -> str:
+        return textwrap.dedent(
+            f'''\
+            def test_listar_pagina_por_id_y_filtros(tmp_path) -> None:
+                repo = Repositorio{nombres.nombre_clase}Json(str(tmp_path))
+                for {'i' if kwargs_crear else '_'} in range(3):
+                    repo.crear({nombres.nombre_clase}(id=0{', ' + kwargs_crear if kwargs_crear else ''}))
+
+                assert [entidad.id for entidad in repo.listar_pagina(2)] == [1, 2]
+                assert [entidad.id for entidad in repo.listar_pagina(2, despues_de_id=2)] == [3]
+                assert [entidad.id for entidad in repo.listar_pagina(5, filtros={{"id": 2}})] == [2]
+                with pytest.raises(ValueError, match="no soportados"):
+                    repo.listar_pagina(5, filtros={{"inexistente": 1}})
+            '''
+        )
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import textwrap
 
+from blueprints.cache_renderizado import huella_clase
 from blueprints.crud_json_v1.blueprint import CrudJsonBlueprint, NombresClase
-from dominio.especificacion import EspecificacionClase, EspecificacionProyecto
+from dominio.especificacion import EspecificacionAtributo, EspecificacionClase, EspecificacionProyecto
 from dominio.plan_generacion import ArchivoGenerado, PlanGeneracion
 
 
@@ -18,45 +19,73 @@ class CrudSqliteBlueprint(CrudJsonBlueprint):
     def version(self) -> str:
         return "1.0.0"
 
-    def generar_plan(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
+    def generar_plan_diferido(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
         self.validar(especificacion)
         archivos: list[ArchivoGenerado] = [ArchivoGenerado("datos/.gitkeep", "")]
 
         for clase in especificacion.clases:
             nombres = self._construir_nombres(clase)
+            huella = huella_clase(clase)
             archivos.extend(
                 [
-                    ArchivoGenerado(f"dominio/entidades/{nombres.nombre_snake}.py", self._contenido_entidad(clase, nombres)),
-                    ArchivoGenerado(
-                        f"aplicacion/puertos/repositorio_{nombres.nombre_snake}.py", self._contenido_puerto(nombres)
+                    self._archivo_renderizado(
+                        f"dominio/entidades/{nombres.nombre_snake}.py",
+                        huella,
+                        self._contenido_entidad,
+                        clase,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
+                        f"aplicacion/puertos/repositorio_{nombres.nombre_snake}.py",
+                        huella,
+                        self._contenido_puerto,
+                        nombres,
+                    ),
+                    self._archivo_renderizado(
                         f"aplicacion/casos_uso/{nombres.nombre_snake}/crear_{nombres.nombre_snake}.py",
-                        self._contenido_caso_uso_crear(clase, nombres),
+                        huella,
+                        self._contenido_caso_uso_crear,
+                        clase,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"aplicacion/casos_uso/{nombres.nombre_snake}/obtener_{nombres.nombre_snake}.py",
-                        self._contenido_caso_uso_obtener(nombres),
+                        huella,
+                        self._contenido_caso_uso_obtener,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"aplicacion/casos_uso/{nombres.nombre_snake}/listar_{nombres.nombre_plural}.py",
-                        self._contenido_caso_uso_listar(nombres),
+                        huella,
+                        self._contenido_caso_uso_listar,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"aplicacion/casos_uso/{nombres.nombre_snake}/actualizar_{nombres.nombre_snake}.py",
-                        self._contenido_caso_uso_actualizar(clase, nombres),
+                        huella,
+                        self._contenido_caso_uso_actualizar,
+                        clase,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"aplicacion/casos_uso/{nombres.nombre_snake}/eliminar_{nombres.nombre_snake}.py",
-                        self._contenido_caso_uso_eliminar(nombres),
+                        huella,
+                        self._contenido_caso_uso_eliminar,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"infraestructura/persistencia/sqlite/repositorio_{nombres.nombre_snake}_sqlite.py",
-                        self._contenido_repositorio_sqlite(clase, nombres),
+                        huella,
+                        self._contenido_repositorio_sqlite,
+                        clase,
+                        nombres,
                     ),
-                    ArchivoGenerado(
+                    self._archivo_renderizado(
                         f"tests/aplicacion/test_crud_{nombres.nombre_snake}.py",
-                        self._contenido_test_crud_sqlite(clase, nombres),
+                        huella,
+                        self._contenido_test_crud_sqlite,
+                        clase,
+                        nombres,
                     ),
                 ]
             )
@@ -117,21 +146,47 @@ class CrudSqliteBlueprint(CrudJsonBlueprint):
             "retorno_crear": retorno_crear,
             "columnas_sql_texto": ",\n                ".join(columnas_sql),
             "conversiones_texto": "\n".join(conversiones),
+            "columnas_tupla": repr(("id", *(atributo.nombre for atributo in atributos_sin_id))),
+            "indices_texto": self._sentencias_indices(clase),
         }
 
+    def _atributos_indexados(self, clase: EspecificacionClase) -> list[EspecificacionAtributo]:
+        return [
+            atributo
+            for atributo in clase.atributos
+            if atributo.nombre != "id" and (getattr(atributo, "indexado", False) or getattr(atributo, "unico", False))
+        ]
+
+    def _sentencias_indices(self, clase: EspecificacionClase) -> str:
+        tabla = self._construir_nombres(clase).nombre_plural
+        sentencias = []
+        for atributo in self._atributos_indexados(clase):
+            tipo_indice = "UNIQUE INDEX" if atributo.unico else "INDEX"
+            sentencias.append(
+                "            conexion.execute(\n"
+                f'                "CREATE {tipo_indice} IF NOT EXISTS idx_{tabla}_{atributo.nombre} '
+                f'ON {tabla} ({atributo.nombre})"\n'
+                "            )"
+            )
+        return "".join(f"\n{sentencia}" for sentencia in sentencias)
+
     def _contenido_repositorio_sqlite(self, clase: EspecificacionClase, nombres: NombresClase) -> str:
         datos = self._datos_repositorio_sqlite(clase)
-        partes = [
-            self._generar_imports_repositorio(nombres),
-            self._generar_definicion_clase(nombres),
+        partes_clase = [
+            self._generar_definicion_clase(nombres, datos),
             self._generar_metodo_guardar(nombres, datos),
             self._generar_metodo_obtener(nombres),
             self._generar_metodo_listar(nombres),
+            self._generar_metodo_listar_pagina(nombres),
             self._generar_metodo_actualizar(nombres, datos),
             self._generar_metodo_eliminar(nombres),
+            self._generar_metodos_masivos(nombres, datos),
+            *self._generar_metodos_busqueda(clase, nombres),
             self._generar_utilidades_repositorio(nombres, datos),
         ]
-        return "\n\n".join(partes)
+        # Dentro de la clase los métodos van separados por una sola línea en blanco.
+        cuerpo_clase = "\n\n".join(parte.rstrip("\n") for parte in partes_clase)
+        return f"{self._generar_imports_repositorio(nombres)}\n\n{cuerpo_clase}"
 
     def _generar_imports_repositorio(self, nombres: NombresClase) -> str:
         return textwrap.dedent(
@@ -140,9 +195,11 @@ class CrudSqliteBlueprint(CrudJsonBlueprint):
 
             from __future__ import annotations
 
+            from collections.abc import Iterable, Mapping
             import logging
             from pathlib import Path
             import sqlite3
+            import threading
 
             from aplicacion.puertos.repositorio_{nombres.nombre_snake} import Repositorio{nombres.nombre_clase}
             from dominio.entidades.{nombres.nombre_snake} import {nombres.nombre_clase}
@@ -151,14 +208,46 @@ class CrudSqliteBlueprint(CrudJsonBlueprint):
             '''
         )
 
-    def _generar_definicion_clase(self, nombres: NombresClase) -> str:
+    def _generar_definicion_clase(self, nombres: NombresClase, datos: dict[str, str]) -> str:
         return textwrap.dedent(
             f'''\
             class Repositorio{nombres.nombre_clase}Sqlite(Repositorio{nombres.nombre_clase}):
+                """Repositorio SQLite con una conexión persistente por hilo.
+
+                Cada conexión usa WAL y reutiliza sus sentencias preparadas; los
+                métodos ``*_muchos`` aplican el lote completo en una transacción.
+                """
+
+                PRAGMAS = (
+                    "PRAGMA journal_mode=WAL",
+                    "PRAGMA synchronous=NORMAL",
+                    "PRAGMA busy_timeout=5000",
+                    "PRAGMA temp_store=MEMORY",
+                    "PRAGMA cache_size=-8000",
+                )
+                COLUMNAS = {datos["columnas_tupla"]}
+
                 def __init__(self, ruta_base: str) -> None:
                     self._ruta_db = Path(ruta_base) / "datos" / "base_datos.db"
                     self._ruta_db.parent.mkdir(parents=True, exist_ok=True)
+                    self._local = threading.local()
+                    self._conexiones: list[sqlite3.Connection] = []
+                    self._candado = threading.Lock()
                     self._asegurar_tabla()
+
+                def __enter__(self) -> Repositorio{nombres.nombre_clase}Sqlite:
+                    return self
+
+                def __exit__(self, *_: object) -> None:
+                    self.cerrar()
+
+                def cerrar(self) -> None:
+                    """Cierra las conexiones abiertas por todos los hilos."""
+                    with self._candado:
+                        conexiones, self._conexiones = self._conexiones, []
+                        self._local = threading.local()
+                    for conexion in conexiones:
+                        conexion.close()
             '''
         )
 
@@ -203,6 +292,32 @@ class CrudSqliteBlueprint(CrudJsonBlueprint):
             LOGGER.exception("Error SQL al listar {nombres.nombre_clase}")
             raise ValueError("Error SQL al listar entidades") from exc'''
 
+    def _generar_metodo_listar_pagina(self, nombres: NombresClase) -> str:
+        return f'''    def listar_pagina(
+        self,
+        limite: int,
+        despues_de_id: int = 0,
+        filtros: Mapping[str, object] | None = None,
+    ) -> list[{nombres.nombre_clase}]:
+        criterios = dict(filtros or {{}})
+        desconocidos = sorted(set(criterios) - set(self.COLUMNAS))
+        if desconocidos:
+            raise ValueError(f"Campos de filtro no soportados: {{', '.join(desconocidos)}}")
+        if limite < 1:
+            raise ValueError("El límite de página debe ser mayor que cero")
+        condiciones = "".join(f" AND {{columna}} = ?" for columna in criterios)
+        consulta = (
+            f"SELECT {{', '.join(self.COLUMNAS)}} FROM {nombres.nombre_plural} "
+            f"WHERE id > ?{{condiciones}} ORDER BY id ASC LIMIT ?"
+        )
+        try:
+            with self._conectar() as conexion:
+                filas = conexion.execute(consulta, (despues_de_id, *criterios.values(), limite)).fetchall()
+            return [self._fila_a_entidad(fila) for fila in filas]
+        except sqlite3.Error as exc:
+            LOGGER.exception("Error SQL al paginar {nombres.nombre_clase} tras id=%s", despues_de_id)
+            raise ValueError("Error SQL al listar entidades") from exc'''
+
     def _generar_metodo_actualizar(self, nombres: NombresClase, datos: dict[str, str]) -> str:
         return f'''    def actualizar(self, entidad: {nombres.nombre_clase}) -> {nombres.nombre_clase}:
         try:
@@ -234,6 +349,131 @@ class CrudSqliteBlueprint(CrudJsonBlueprint):
             LOGGER.exception("Error SQL al eliminar {nombres.nombre_clase} id=%s", entidad_id)
             raise ValueError("Error SQL al eliminar entidad") from exc'''
 
+    def _generar_metodos_masivos(self, nombres: NombresClase, datos: dict[str, str]) -> str:
+        return f'''    def crear_muchos(self, entidades: Iterable[{nombres.nombre_clase}]) -> list[{nombres.nombre_clase}]:
+        """Inserta el lote con un único ``executemany`` dentro de una transacción.
+
+        Mientras dura la transacción nadie más puede escribir, así que los ids
+        asignados son consecutivos y terminan en ``last_insert_rowid()``.
+        """
+        entidades = list(entidades)
+        if not entidades:
+            return []
+        try:
+            with self._conectar() as conexion:
+                conexion.executemany(
+                    {datos["insert_sql"].format(nombres=nombres)},
+                    [{datos["params_crear"]} for entidad in entidades],
+                )
+                ultimo_id = int(conexion.execute("SELECT last_insert_rowid()").fetchone()[0])
+            primer_id = ultimo_id - len(entidades) + 1
+            persistidas = [
+                {nombres.nombre_clase}(id=primer_id + desplazamiento{datos["retorno_crear"]})
+                for desplazamiento, entidad in enumerate(entidades)
+            ]
+            LOGGER.info("{nombres.nombre_clase} creadas en lote: %s", len(persistidas))
+            return persistidas
+        except sqlite3.Error as exc:
+            LOGGER.exception("Error SQL al crear {nombres.nombre_clase} en lote")
+            raise ValueError("Error SQL al crear entidades") from exc
+
+    def actualizar_muchos(self, entidades: Iterable[{nombres.nombre_clase}]) -> list[{nombres.nombre_clase}]:
+        entidades = list(entidades)
+        try:
+            with self._conectar() as conexion:
+                cursor = conexion.executemany(
+                    "UPDATE {nombres.nombre_plural} SET {datos['set_clause']} WHERE id = ?",
+                    [{datos['params_actualizar']} for entidad in entidades],
+                )
+                if cursor.rowcount != len(entidades):
+                    raise ValueError("{nombres.nombre_clase} no encontrado")
+            LOGGER.info("{nombres.nombre_clase} actualizadas en lote: %s", len(entidades))
+            return entidades
+        except sqlite3.Error as exc:
+            LOGGER.exception("Error SQL al actualizar {nombres.nombre_clase} en lote")
+            raise ValueError("Error SQL al actualizar entidades") from exc
+
+    def eliminar_muchos(self, entidad_ids: Iterable[int]) -> None:
+        ids_unicos = list(dict.fromkeys(entidad_ids))
+        try:
+            with self._conectar() as conexion:
+                cursor = conexion.executemany(
+                    "DELETE FROM {nombres.nombre_plural} WHERE id = ?",
+                    [(entidad_id,) for entidad_id in ids_unicos],
+                )
+                if cursor.rowcount != len(ids_unicos):
+                    raise ValueError("{nombres.nombre_clase} no encontrado")
+            LOGGER.info("{nombres.nombre_clase} eliminadas en lote: %s", len(ids_unicos))
+        except sqlite3.Error as exc:
+            LOGGER.exception("Error SQL al eliminar {nombres.nombre_clase} en lote")
+            raise ValueError("Error SQL al eliminar entidades") from exc'''
+
+    def _generar_metodos_busqueda(self, clase: EspecificacionClase, nombres: NombresClase) -> list[str]:
+        """Un ``buscar_por_<atributo>`` por atributo indexado; los únicos devuelven una sola entidad."""
+        columnas = ", ".join(["id", *self._atributos_sin_id(clase)])
+        metodos = []
+        for atributo in self._atributos_indexados(clase):
+            tipo = self._tipo_python(atributo.tipo)
+            consulta = f"SELECT {columnas} FROM {nombres.nombre_plural} WHERE {atributo.nombre} = ?"
+            if atributo.unico:
+                metodos.append(f'''    def buscar_por_{atributo.nombre}(self, {atributo.nombre}: {tipo}) -> {nombres.nombre_clase}:
+        try:
+            with self._conectar() as conexion:
+                fila = conexion.execute("{consulta}", ({atributo.nombre},)).fetchone()
+        except sqlite3.Error as exc:
+            LOGGER.exception("Error SQL al buscar {nombres.nombre_clase} por {atributo.nombre}")
+            raise ValueError("Error SQL al buscar entidad") from exc
+        if fila is None:
+            raise ValueError("{nombres.nombre_clase} no encontrado")
+        return self._fila_a_entidad(fila)''')
+            else:
+                metodos.append(f'''    def buscar_por_{atributo.nombre}(self, {atributo.nombre}: {tipo}) -> list[{nombres.nombre_clase}]:
+        try:
+            with self._conectar() as conexion:
+                filas = conexion.execute("{consulta} ORDER BY id ASC", ({atributo.nombre},)).fetchall()
+            return [self._fila_a_entidad(fila) for fila in filas]
+        except sqlite3.Error as exc:
+            LOGGER.exception("Error SQL al buscar {nombres.nombre_clase} por {atributo.nombre}")
+            raise ValueError("Error SQL al buscar entidades") from exc''')
+        return metodos
+
+    def _generar_tests_busqueda(self, clase: EspecificacionClase, nombres: NombresClase) -> list[str]:
+        """Un test por ``buscar_por_<atributo>``; los valores del resto de campos varían por vuelta."""
+        tests = []
+        for atributo in self._atributos_indexados(clase):
+            if atributo.unico:
+                kwargs = self._generar_kwargs_test_iteracion(clase)
+                esperado = self._valor_test_iteracion(atributo.tipo, vuelta=1)
+                tests.append(textwrap.dedent(
+                    f'''\
+                    def test_buscar_por_{atributo.nombre}_devuelve_una_entidad(tmp_path) -> None:
+                        repo = Repositorio{nombres.nombre_clase}Json(str(tmp_path))
+                        for i in range(2):
+                            repo.crear({nombres.nombre_clase}(id=0, {kwargs}))
+
+                        assert repo.buscar_por_{atributo.nombre}({esperado}).id == 2
+                        repo.eliminar(2)
+                        with pytest.raises(ValueError, match="no encontrado"):
+                            repo.buscar_por_{atributo.nombre}({esperado})
+                    '''
+                ))
+            else:
+                valor = self._valor_test(atributo.tipo)
+                kwargs = self._generar_kwargs_test_iteracion(clase, {atributo.nombre: valor})
+                tests.append(textwrap.dedent(
+                    f'''\
+                    def test_buscar_por_{atributo.nombre}_devuelve_coincidencias(tmp_path) -> None:
+                        repo = Repositorio{nombres.nombre_clase}Json(str(tmp_path))
+                        for i in range(3):
+                            repo.crear({nombres.nombre_clase}(id=0, {kwargs}))
+                        repo.eliminar(2)
+
+                        assert [entidad.id for entidad in repo.buscar_por_{atributo.nombre}({valor})] == [1, 3]
+                        assert repo.buscar_por_{atributo.nombre}({self._valor_test(atributo.tipo, "_otro")}) == []
+                    '''
+                ))
+        return tests
+
     def _generar_utilidades_repositorio(self, nombres: NombresClase, datos: dict[str, str]) -> str:
         return f'''    def _asegurar_tabla(self) -> None:
         LOGGER.info("Creando tabla {nombres.nombre_plural} si no existe")
@@ -244,11 +484,18 @@ class CrudSqliteBlueprint(CrudJsonBlueprint):
                     {datos['columnas_sql_texto']}
                 )
                 """
-            )
+            ){datos['indices_texto']}
 
     def _conectar(self) -> sqlite3.Connection:
-        conexion = sqlite3.connect(self._ruta_db)
-        conexion.row_factory = sqlite3.Row
+        conexion = getattr(self._local, "conexion", None)
+        if conexion is None:
+            conexion = sqlite3.connect(self._ruta_db, check_same_thread=False, cached_statements=256)
+            conexion.row_factory = sqlite3.Row
+            for pragma in self.PRAGMAS:
+                conexion.execute(pragma)
+            with self._candado:
+                self._conexiones.append(conexion)
+                self._local.conexion = conexion
         return conexion
 
     def _fila_a_entidad(self, fila: sqlite3.Row) -> {nombres.nombre_clase}:
@@ -258,8 +505,14 @@ class CrudSqliteBlueprint(CrudJsonBlueprint):
         )'''
 
     def _contenido_test_crud_sqlite(self, clase: EspecificacionClase, nombres: NombresClase) -> str:
-        contenido_json = self._contenido_test_crud(clase, nombres)
+        contenido_json = "\n\n".join(
+            [self._contenido_test_crud(clase, nombres), *self._generar_tests_busqueda(clase, nombres)]
+        )
         return contenido_json.replace(
             f"from infraestructura.persistencia.json.repositorio_{nombres.nombre_snake}_json import Repositorio{nombres.nombre_clase}Json",
             f"from infraestructura.persistencia.sqlite.repositorio_{nombres.nombre_snake}_sqlite import Repositorio{nombres.nombre_clase}Sqlite",
         ).replace(f"Repositorio{nombres.nombre_clase}Json", f"Repositorio{nombres.nombre_clase}Sqlite")
+
+    def _generar_test_lote_revertido(self, nombres: NombresClase, kwargs_crear: str) -> str:
+        # El repositorio SQLite no expone ``lote()``: cada ``*_muchos`` ya es transaccional.
+        return ""
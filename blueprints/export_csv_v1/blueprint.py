@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 import textwrap
 
 from aplicacion.puertos.blueprint import Blueprint
@@ -34,29 +35,32 @@ class ExportCsvBlueprint(Blueprint):
             )
 
     def generar_plan(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
+        return self.generar_plan_diferido(especificacion).materializar()
+
+    def generar_plan_diferido(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
         self.validar(especificacion)
 
         archivos: list[ArchivoGenerado] = [
-            ArchivoGenerado(
+            ArchivoGenerado.diferido(
                 "aplicacion/puertos/exportadores/exportador_tabular_csv.py",
-                self._contenido_puerto_exportador(),
+                self._contenido_puerto_exportador,
             ),
-            ArchivoGenerado(
+            ArchivoGenerado.diferido(
                 "infraestructura/informes/csv/exportador_csv.py",
-                self._contenido_exportador_csv(),
+                self._contenido_exportador_csv,
             ),
-            ArchivoGenerado(
+            ArchivoGenerado.diferido(
                 "tests/infraestructura/test_export_csv.py",
-                self._contenido_test_exportador_csv(),
+                self._contenido_test_exportador_csv,
             ),
         ]
 
         for clase in especificacion.clases:
             nombres = self._construir_nombres(clase)
             archivos.append(
-                ArchivoGenerado(
+                ArchivoGenerado.diferido(
                     f"aplicacion/casos_uso/informes/generar_informe_{nombres.nombre_plural}_csv.py",
-                    self._contenido_caso_uso_informe(clase, nombres),
+                    partial(self._contenido_caso_uso_informe, clase, nombres),
                 )
             )
 
@@ -107,12 +111,16 @@ class ExportCsvBlueprint(Blueprint):
             from __future__ import annotations
 
             from abc import ABC, abstractmethod
+            from collections.abc import Iterable, Sequence
 
 
             class ExportadorTabularCsv(ABC):
                 @abstractmethod
-                def exportar(self, ruta: str, encabezados: list[str], filas: list[list[str]]) -> None:
-                    """Exporta un informe tabular hacia un archivo CSV."""
+                def exportar(self, ruta: str, encabezados: Sequence[str], filas: Iterable[Sequence[str]]) -> None:
+                    """Exporta un informe tabular hacia un archivo CSV.
+
+                    ``filas`` se consume una sola vez y a medida que se escribe.
+                    """
             '''
         )
 
@@ -124,6 +132,7 @@ class ExportCsvBlueprint(Blueprint):
 
             from __future__ import annotations
 
+            from collections.abc import Iterator
             import logging
 
             from aplicacion.puertos.exportadores.exportador_tabular_csv import ExportadorTabularCsv
@@ -133,6 +142,8 @@ class ExportCsvBlueprint(Blueprint):
 
 
             class GenerarInforme{nombres.nombre_clase}Csv:
+                TAMANO_PAGINA = 1000
+
                 def __init__(
                     self,
                     repositorio: Repositorio{nombres.nombre_clase},
@@ -143,14 +154,20 @@ class ExportCsvBlueprint(Blueprint):
                     self._encabezados = {columnas!r}
 
                 def ejecutar(self, ruta_salida: str) -> str:
-                    entidades = self._repositorio.listar()
-                    filas = [
-                        [str(getattr(entidad, columna, "")) for columna in self._encabezados]
-                        for entidad in entidades
-                    ]
-                    self._exportador.exportar(ruta=ruta_salida, encabezados=self._encabezados, filas=filas)
+                    self._exportador.exportar(ruta=ruta_salida, encabezados=self._encabezados, filas=self._filas())
                     LOGGER.info("Informe CSV generado en %s", ruta_salida)
                     return ruta_salida
+
+                def _filas(self) -> Iterator[list[str]]:
+                    """Recorre el repositorio por páginas de id para no cargar la tabla entera."""
+                    despues_de_id = 0
+                    while True:
+                        pagina = self._repositorio.listar_pagina(self.TAMANO_PAGINA, despues_de_id)
+                        for entidad in pagina:
+                            yield [str(getattr(entidad, columna, "")) for columna in self._encabezados]
+                        if len(pagina) < self.TAMANO_PAGINA:
+                            return
+                        despues_de_id = pagina[-1].id
             '''
         )
 
@@ -161,16 +178,46 @@ class ExportCsvBlueprint(Blueprint):
 
             from __future__ import annotations
 
+            from collections.abc import Iterable, Sequence
             import csv
+            import glob
+            import gzip
+            import json
             from pathlib import Path
+            from typing import BinaryIO
 
             from aplicacion.puertos.exportadores.exportador_tabular_csv import ExportadorTabularCsv
 
 
+            '''
+        ) + self._contenido_partes_csv() + textwrap.dedent(
+            '''\
             class ExportadorCsv(ExportadorTabularCsv):
-                def exportar(self, ruta: str, encabezados: list[str], filas: list[list[str]]) -> None:
+                """Exporta a un único CSV o, con límites o compresión, a partes numeradas.
+
+                En modo por partes cada archivo ``<nombre>.partNNNN.csv[.gz]`` repite los
+                encabezados y se abre uno nuevo al llegar a ``max_filas_por_parte`` filas
+                o ``max_bytes_por_parte`` bytes sin comprimir. ``<nombre>.indice.json``
+                registra las filas de cada parte. Las partes de una exportación anterior
+                al mismo destino se eliminan antes de escribir.
+                """
+
+                def __init__(
+                    self,
+                    max_filas_por_parte: int | None = None,
+                    max_bytes_por_parte: int | None = None,
+                    comprimir: bool = False,
+                ) -> None:
+                    self._partes: _EscritorPartesCsv | None = None
+                    if max_filas_por_parte is not None or max_bytes_por_parte is not None or comprimir:
+                        self._partes = _EscritorPartesCsv(max_filas_por_parte, max_bytes_por_parte, comprimir)
+
+                def exportar(self, ruta: str, encabezados: Sequence[str], filas: Iterable[Sequence[str]]) -> None:
                     destino = Path(ruta)
                     destino.parent.mkdir(parents=True, exist_ok=True)
+                    if self._partes is not None:
+                        self._partes.escribir(destino, encabezados, filas)
+                        return
                     with destino.open("w", newline="", encoding="utf-8") as archivo:
                         escritor = csv.writer(archivo, delimiter=",")
                         escritor.writerow(encabezados)
@@ -178,9 +225,84 @@ class ExportCsvBlueprint(Blueprint):
             '''
         )
 
+    def _contenido_partes_csv(self) -> str:
+        return textwrap.dedent(
+            '''\
+            class _ParteCsv:
+                """Archivo de una parte con su propio ``csv.writer``, que escribe en él fila a fila."""
+
+                def __init__(self, ruta: Path, comprimir: bool) -> None:
+                    self.ruta = ruta
+                    self.filas = 0
+                    self.bytes = 0
+                    self._archivo: BinaryIO = gzip.open(ruta, "wb") if comprimir else ruta.open("wb")
+                    self.escritor = csv.writer(self)
+
+                def write(self, texto: str) -> None:
+                    datos = texto.encode("utf-8")
+                    self._archivo.write(datos)
+                    self.bytes += len(datos)
+
+                def cerrar(self) -> None:
+                    self._archivo.close()
+
+
+            class _EscritorPartesCsv:
+                """Reparte las filas en archivos numerados y escribe el índice al terminar."""
+
+                def __init__(self, max_filas: int | None, max_bytes: int | None, comprimir: bool) -> None:
+                    self._max_filas = max_filas
+                    self._max_bytes = max_bytes
+                    self._comprimir = comprimir
+
+                def escribir(self, destino: Path, encabezados: Sequence[str], filas: Iterable[Sequence[str]]) -> None:
+                    patron_partes = f"{glob.escape(destino.stem)}.part[0-9][0-9][0-9][0-9]*.csv*"
+                    for obsoleta in destino.parent.glob(patron_partes):
+                        obsoleta.unlink()
+                    partes = [self._abrir_parte(destino, 1, encabezados)]
+                    try:
+                        for fila in filas:
+                            if self._parte_llena(partes[-1]):
+                                partes[-1].cerrar()
+                                partes.append(self._abrir_parte(destino, len(partes) + 1, encabezados))
+                            partes[-1].escritor.writerow(fila)
+                            partes[-1].filas += 1
+                    finally:
+                        partes[-1].cerrar()
+                    indice = {
+                        "encabezados": list(encabezados),
+                        "comprimido": self._comprimir,
+                        "total_filas": sum(parte.filas for parte in partes),
+                        "partes": [
+                            {"archivo": parte.ruta.name, "filas": parte.filas, "bytes_sin_comprimir": parte.bytes}
+                            for parte in partes
+                        ],
+                    }
+                    ruta_indice = destino.with_name(f"{destino.stem}.indice.json")
+                    ruta_indice.write_text(json.dumps(indice, ensure_ascii=False, indent=2), encoding="utf-8")
+
+                def _abrir_parte(self, destino: Path, numero: int, encabezados: Sequence[str]) -> _ParteCsv:
+                    sufijo = ".csv.gz" if self._comprimir else ".csv"
+                    parte = _ParteCsv(destino.with_name(f"{destino.stem}.part{numero:04d}{sufijo}"), self._comprimir)
+                    parte.escritor.writerow(encabezados)
+                    return parte
+
+                def _parte_llena(self, parte: _ParteCsv) -> bool:
+                    if parte.filas == 0:
+                        return False
+                    if self._max_filas is not None and parte.filas >= self._max_filas:
+                        return True
+                    return self._max_bytes is not None and parte.bytes >= self._max_bytes
+
+
+            '''
+        )
+
     def _contenido_test_exportador_csv(self) -> str:
         return textwrap.dedent(
             '''\
+            import gzip
+            import json
             from pathlib import Path
 
             from infraestructura.informes.csv.exportador_csv import ExportadorCsv
@@ -199,5 +321,31 @@ class ExportCsvBlueprint(Blueprint):
                 contenido = ruta.read_text(encoding="utf-8")
                 assert "id,nombre" in contenido
                 assert "Ana" in contenido
+
+
+            def test_exportador_csv_por_partes_comprimidas_con_indice(tmp_path: Path) -> None:
+                ruta = tmp_path / "clientes.csv"
+
+                ExportadorCsv(max_filas_por_parte=2, comprimir=True).exportar(
+                    ruta=str(ruta),
+                    encabezados=["id", "nombre"],
+                    filas=([str(indice), f"c{indice}"] for indice in range(5)),
+                )
+
+                indice = json.loads((tmp_path / "clientes.indice.json").read_text(encoding="utf-8"))
+                assert [parte["filas"] for parte in indice["partes"]] == [2, 2, 1]
+                assert indice["total_filas"] == 5
+                with gzip.open(tmp_path / "clientes.part0003.csv.gz", "rt", encoding="utf-8") as parte:
+                    assert parte.read().splitlines() == ["id,nombre", "4,c4"]
+
+
+            def test_reexportar_por_partes_elimina_partes_anteriores(tmp_path: Path) -> None:
+                ruta = tmp_path / "clientes.csv"
+                exportador = ExportadorCsv(max_filas_por_parte=2)
+
+                exportador.exportar(str(ruta), ["id"], ([str(indice)] for indice in range(5)))
+                exportador.exportar(str(ruta), ["id"], [["1"]])
+
+                assert sorted(archivo.name for archivo in tmp_path.glob("clientes.part*")) == ["clientes.part0001.csv"]
             '''
         )
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 import textwrap
 
 from aplicacion.puertos.blueprint import Blueprint
@@ -32,29 +33,32 @@ class ExportExcelBlueprint(Blueprint):
             )
 
     def generar_plan(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
+        return self.generar_plan_diferido(especificacion).materializar()
+
+    def generar_plan_diferido(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
         self.validar(especificacion)
 
         archivos: list[ArchivoGenerado] = [
-            ArchivoGenerado(
+            ArchivoGenerado.diferido(
                 "aplicacion/puertos/exportadores/exportador_tabular_excel.py",
-                self._contenido_puerto_exportador(),
+                self._contenido_puerto_exportador,
             ),
-            ArchivoGenerado(
+            ArchivoGenerado.diferido(
                 "infraestructura/informes/excel/exportador_excel_openpyxl.py",
-                self._contenido_exportador_excel(),
+                self._contenido_exportador_excel,
             ),
-            ArchivoGenerado(
+            ArchivoGenerado.diferido(
                 "tests/infraestructura/test_export_excel.py",
-                self._contenido_test_exportador_excel(),
+                self._contenido_test_exportador_excel,
             ),
         ]
 
         for clase in especificacion.clases:
             nombres = self._construir_nombres(clase)
             archivos.append(
-                ArchivoGenerado(
+                ArchivoGenerado.diferido(
                     f"aplicacion/casos_uso/informes/generar_informe_{nombres.nombre_plural}_excel.py",
-                    self._contenido_caso_uso_informe(clase, nombres),
+                    partial(self._contenido_caso_uso_informe, clase, nombres),
                 )
             )
 
@@ -93,12 +97,16 @@ class ExportExcelBlueprint(Blueprint):
             from __future__ import annotations
 
             from abc import ABC, abstractmethod
+            from collections.abc import Iterable, Sequence
 
 
             class ExportadorTabularExcel(ABC):
                 @abstractmethod
-                def exportar(self, ruta: str, encabezados: list[str], filas: list[list[str]]) -> None:
-                    """Exporta un informe tabular hacia una hoja Excel."""
+                def exportar(self, ruta: str, encabezados: Sequence[str], filas: Iterable[Sequence[str]]) -> None:
+                    """Exporta un informe tabular hacia una hoja Excel.
+
+                    ``filas`` se consume una sola vez y a medida que se escribe.
+                    """
             '''
         )
 
@@ -110,6 +118,7 @@ class ExportExcelBlueprint(Blueprint):
 
             from __future__ import annotations
 
+            from collections.abc import Iterator
             import logging
 
             from aplicacion.puertos.exportadores.exportador_tabular_excel import ExportadorTabularExcel
@@ -119,6 +128,8 @@ class ExportExcelBlueprint(Blueprint):
 
 
             class GenerarInforme{nombres.nombre_clase}Excel:
+                TAMANO_PAGINA = 1000
+
                 def __init__(
                     self,
                     repositorio: Repositorio{nombres.nombre_clase},
@@ -129,14 +140,20 @@ class ExportExcelBlueprint(Blueprint):
                     self._encabezados = {columnas!r}
 
                 def ejecutar(self, ruta_salida: str) -> str:
-                    entidades = self._repositorio.listar()
-                    filas = [
-                        [str(getattr(entidad, columna, "")) for columna in self._encabezados]
-                        for entidad in entidades
-                    ]
-                    self._exportador.exportar(ruta=ruta_salida, encabezados=self._encabezados, filas=filas)
+                    self._exportador.exportar(ruta=ruta_salida, encabezados=self._encabezados, filas=self._filas())
                     LOGGER.info("Informe Excel generado en %s", ruta_salida)
                     return ruta_salida
+
+                def _filas(self) -> Iterator[list[str]]:
+                    """Recorre el repositorio por páginas de id para no cargar la tabla entera."""
+                    despues_de_id = 0
+                    while True:
+                        pagina = self._repositorio.listar_pagina(self.TAMANO_PAGINA, despues_de_id)
+                        for entidad in pagina:
+                            yield [str(getattr(entidad, columna, "")) for columna in self._encabezados]
+                        if len(pagina) < self.TAMANO_PAGINA:
+                            return
+                        despues_de_id = pagina[-1].id
             '''
         )
 
@@ -147,6 +164,7 @@ class ExportExcelBlueprint(Blueprint):
 
             from __future__ import annotations
 
+            from collections.abc import Iterable, Sequence
             from pathlib import Path
 
             from openpyxl import Workbook
@@ -155,13 +173,14 @@ class ExportExcelBlueprint(Blueprint):
 
 
             class ExportadorExcelOpenpyxl(ExportadorTabularExcel):
-                def exportar(self, ruta: str, encabezados: list[str], filas: list[list[str]]) -> None:
+                """Escribe en modo ``write_only``: cada fila se serializa al añadirse."""
+
+                def exportar(self, ruta: str, encabezados: Sequence[str], filas: Iterable[Sequence[str]]) -> None:
                     destino = Path(ruta)
                     destino.parent.mkdir(parents=True, exist_ok=True)
 
-                    libro = Workbook()
-                    hoja = libro.active
-                    hoja.title = "Informe"
+                    libro = Workbook(write_only=True)
+                    hoja = libro.create_sheet("Informe")
                     hoja.append(encabezados)
                     for fila in filas:
                         hoja.append(fila)
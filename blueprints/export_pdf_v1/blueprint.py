@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 import textwrap
 
 from aplicacion.puertos.blueprint import Blueprint
@@ -32,29 +33,32 @@ class ExportPdfBlueprint(Blueprint):
             )
 
     def generar_plan(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
+        return self.generar_plan_diferido(especificacion).materializar()
+
+    def generar_plan_diferido(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
         self.validar(especificacion)
 
         archivos: list[ArchivoGenerado] = [
-            ArchivoGenerado(
+            ArchivoGenerado.diferido(
                 "aplicacion/puertos/exportadores/exportador_tabular_pdf.py",
-                self._contenido_puerto_exportador(),
+                self._contenido_puerto_exportador,
             ),
-            ArchivoGenerado(
+            ArchivoGenerado.diferido(
                 "infraestructura/informes/pdf/exportador_pdf_reportlab.py",
-                self._contenido_exportador_pdf(),
+                self._contenido_exportador_pdf,
             ),
-            ArchivoGenerado(
+            ArchivoGenerado.diferido(
                 "tests/infraestructura/test_export_pdf.py",
-                self._contenido_test_exportador_pdf(),
+                self._contenido_test_exportador_pdf,
             ),
         ]
 
         for clase in especificacion.clases:
             nombres = self._construir_nombres(clase)
             archivos.append(
-                ArchivoGenerado(
+                ArchivoGenerado.diferido(
                     f"aplicacion/casos_uso/informes/generar_informe_{nombres.nombre_plural}_pdf.py",
-                    self._contenido_caso_uso_informe(clase, nombres),
+                    partial(self._contenido_caso_uso_informe, clase, nombres),
                 )
             )
 
@@ -93,12 +97,18 @@ class ExportPdfBlueprint(Blueprint):
             from __future__ import annotations
 
             from abc import ABC, abstractmethod
+            from collections.abc import Iterable, Sequence
 
 
             class ExportadorTabularPdf(ABC):
                 @abstractmethod
-                def exportar(self, ruta: str, encabezados: list[str], filas: list[list[str]], titulo: str) -> None:
-                    """Exporta un informe tabular hacia un PDF básico."""
+                def exportar(
+                    self, ruta: str, encabezados: Sequence[str], filas: Iterable[Sequence[str]], titulo: str
+                ) -> None:
+                    """Exporta un informe tabular hacia un PDF básico.
+
+                    ``filas`` se consume una sola vez y a medida que se escribe.
+                    """
             '''
         )
 
@@ -111,6 +121,7 @@ class ExportPdfBlueprint(Blueprint):
 
             from __future__ import annotations
 
+            from collections.abc import Iterator
             import logging
 
             from aplicacion.puertos.exportadores.exportador_tabular_pdf import ExportadorTabularPdf
@@ -120,6 +131,8 @@ class ExportPdfBlueprint(Blueprint):
 
 
             class GenerarInforme{nombres.nombre_clase}Pdf:
+                TAMANO_PAGINA = 1000
+
                 def __init__(
                     self,
                     repositorio: Repositorio{nombres.nombre_clase},
@@ -131,19 +144,25 @@ class ExportPdfBlueprint(Blueprint):
                     self._titulo = {titulo!r}
 
                 def ejecutar(self, ruta_salida: str) -> str:
-                    entidades = self._repositorio.listar()
-                    filas = [
-                        [str(getattr(entidad, columna, "")) for columna in self._encabezados]
-                        for entidad in entidades
-                    ]
                     self._exportador.exportar(
                         ruta=ruta_salida,
                         encabezados=self._encabezados,
-                        filas=filas,
+                        filas=self._filas(),
                         titulo=self._titulo,
                     )
                     LOGGER.info("Informe PDF generado en %s", ruta_salida)
                     return ruta_salida
+
+                def _filas(self) -> Iterator[list[str]]:
+                    """Recorre el repositorio por páginas de id para no cargar la tabla entera."""
+                    despues_de_id = 0
+                    while True:
+                        pagina = self._repositorio.listar_pagina(self.TAMANO_PAGINA, despues_de_id)
+                        for entidad in pagina:
+                            yield [str(getattr(entidad, columna, "")) for columna in self._encabezados]
+                        if len(pagina) < self.TAMANO_PAGINA:
+                            return
+                        despues_de_id = pagina[-1].id
             '''
         )
 
@@ -154,6 +173,7 @@ class ExportPdfBlueprint(Blueprint):
 
             from __future__ import annotations
 
+            from collections.abc import Iterable, Sequence
             from pathlib import Path
 
             from reportlab.lib.pagesizes import A4
@@ -163,37 +183,39 @@ class ExportPdfBlueprint(Blueprint):
 
 
             class ExportadorPdfReportlab(ExportadorTabularPdf):
-                def exportar(self, ruta: str, encabezados: list[str], filas: list[list[str]], titulo: str) -> None:
+                """Dibuja las filas según llegan y cierra cada página al llenarse."""
+
+                MARGEN_X = 40
+                SALTO_LINEA = 18
+
+                def exportar(
+                    self, ruta: str, encabezados: Sequence[str], filas: Iterable[Sequence[str]], titulo: str
+                ) -> None:
                     destino = Path(ruta)
                     destino.parent.mkdir(parents=True, exist_ok=True)
 
                     documento = canvas.Canvas(str(destino), pagesize=A4)
-                    ancho, alto = A4
-                    margen_x = 40
+                    _, alto = A4
                     y = alto - 50
-                    salto_linea = 18
 
                     documento.setFont("Helvetica-Bold", 12)
-                    documento.drawString(margen_x, y, titulo)
-                    y -= salto_linea * 2
-
-                    documento.setFont("Helvetica-Bold", 10)
-                    documento.drawString(margen_x, y, " | ".join(encabezados))
-                    y -= salto_linea
+                    documento.drawString(self.MARGEN_X, y, titulo)
+                    y = self._dibujar_encabezados(documento, encabezados, y - self.SALTO_LINEA * 2)
 
-                    documento.setFont("Helvetica", 10)
                     for fila in filas:
                         if y < 50:
                             documento.showPage()
-                            y = alto - 50
-                            documento.setFont("Helvetica-Bold", 10)
-                            documento.drawString(margen_x, y, " | ".join(encabezados))
-                            y -= salto_linea
-                            documento.setFont("Helvetica", 10)
-                        documento.drawString(margen_x, y, " | ".join(fila))
-                        y -= salto_linea
+                            y = self._dibujar_encabezados(documento, encabezados, alto - 50)
+                        documento.drawString(self.MARGEN_X, y, " | ".join(fila))
+                        y -= self.SALTO_LINEA
 
                     documento.save()
+
+                def _dibujar_encabezados(self, documento: canvas.Canvas, encabezados: Sequence[str], y: float) -> float:
+                    documento.setFont("Helvetica-Bold", 10)
+                    documento.drawString(self.MARGEN_X, y, " | ".join(encabezados))
+                    documento.setFont("Helvetica", 10)
+                    return y - self.SALTO_LINEA
             '''
         )
 
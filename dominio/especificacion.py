@@ -7,16 +7,25 @@ import re
 from uuid import uuid4
 
 from dominio.errores import ErrorValidacionDominio
+from dominio.indice_unicidad import IndiceUnicidad, ListaVersionada, adoptar_lista
 
 PATRON_SEMVER = re.compile(r"^\d+\.\d+\.\d+$")
 PATRON_PASCAL_CASE = re.compile(r"^[A-Z][A-Za-z0-9]*$")
 
+
+def _nombre_de(elemento: EspecificacionAtributo | EspecificacionClase) -> str:
+    return elemento.nombre
+
+
 @dataclass
 class EspecificacionAtributo:
     """Representa un atributo de una clase en el constructor dinámico.
 
     Nota de coherencia: cuando ``obligatorio=True`` y ``valor_por_defecto=None``
     el estado es válido; indica que el atributo deberá proporcionarse explícitamente.
+
+    ``indexado`` y ``unico`` piden un índice de búsqueda sobre el atributo;
+    ``unico`` además impide valores repetidos.
     """
 
     nombre: str
@@ -24,6 +33,8 @@ class EspecificacionAtributo:
     obligatorio: bool
     valor_por_defecto: str | None = None
     id_interno: str = field(default_factory=lambda: str(uuid4()))
+    indexado: bool = False
+    unico: bool = False
 
     def __post_init__(self) -> None:
         if not self.id_interno.strip():
@@ -41,7 +52,7 @@ class EspecificacionClase:
     """Representa una clase del dominio que será generada dinámicamente."""
 
     nombre: str
-    atributos: list[EspecificacionAtributo] = field(default_factory=list)
+    atributos: list[EspecificacionAtributo] = field(default_factory=ListaVersionada)
     id_interno: str = field(default_factory=lambda: str(uuid4()))
 
     def __post_init__(self) -> None:
@@ -53,18 +64,19 @@ class EspecificacionClase:
             raise ErrorValidacionDominio("El nombre de la clase no puede contener espacios.")
         if not PATRON_PASCAL_CASE.match(self.nombre):
             raise ErrorValidacionDominio("El nombre de la clase debe estar en formato PascalCase.")
+        self.atributos = adoptar_lista(self.atributos)
+        self._indice_nombres: IndiceUnicidad[EspecificacionAtributo] = IndiceUnicidad(_nombre_de)
         self._validar_atributos_duplicados()
 
     def _validar_atributos_duplicados(self) -> None:
-        nombres = [atributo.nombre for atributo in self.atributos]
-        duplicados = {nombre for nombre in nombres if nombres.count(nombre) > 1}
+        duplicados = self._indice_nombres.sincronizar(self.atributos).duplicadas()
         if duplicados:
             raise ErrorValidacionDominio(
                 f"La clase contiene atributos duplicados: {sorted(duplicados)}"
             )
 
     def agregar_atributo(self, atributo: EspecificacionAtributo) -> None:
-        if any(item.nombre == atributo.nombre for item in self.atributos):
+        if self._indice_nombres.sincronizar(self.atributos).contiene(atributo.nombre):
             raise ErrorValidacionDominio(
                 f"Ya existe un atributo con nombre '{atributo.nombre}'."
             )
@@ -80,7 +92,9 @@ class EspecificacionClase:
 
     def eliminar_atributo(self, id_interno: str) -> None:
         atributo = self.obtener_atributo(id_interno)
+        indice = self._indice_nombres.sincronizar(self.atributos)
         self.atributos.remove(atributo)
+        indice.retirar(atributo)
 
     def editar_atributo(
         self,
@@ -89,7 +103,10 @@ class EspecificacionClase:
         tipo: str,
         obligatorio: bool,
         valor_por_defecto: str | None,
+        indexado: bool | None = None,
+        unico: bool | None = None,
     ) -> EspecificacionAtributo:
+        """Sustituye el atributo; ``indexado``/``unico`` en ``None`` conservan el valor actual."""
         atributo_original = self.obtener_atributo(id_interno)
         candidato = EspecificacionAtributo(
             id_interno=id_interno,
@@ -97,16 +114,18 @@ class EspecificacionClase:
             tipo=tipo,
             obligatorio=obligatorio,
             valor_por_defecto=valor_por_defecto,
+            indexado=atributo_original.indexado if indexado is None else indexado,
+            unico=atributo_original.unico if unico is None else unico,
         )
-        if any(
-            item.nombre == candidato.nombre and item.id_interno != id_interno
-            for item in self.atributos
-        ):
+        indice_nombres = self._indice_nombres.sincronizar(self.atributos)
+        propias = 1 if atributo_original.nombre == candidato.nombre else 0
+        if indice_nombres.ocurrencias(candidato.nombre) > propias:
             raise ErrorValidacionDominio(
                 f"Ya existe un atributo con nombre '{candidato.nombre}'."
             )
         indice = self.atributos.index(atributo_original)
         self.atributos[indice] = candidato
+        indice_nombres.reemplazar(atributo_original, candidato)
         return candidato
 
 
@@ -118,7 +137,11 @@ class EspecificacionProyecto:
     ruta_destino: str
     descripcion: str | None = None
     version: str = "0.1.0"
-    clases: list[EspecificacionClase] = field(default_factory=list)
+    clases: list[EspecificacionClase] = field(default_factory=ListaVersionada)
+
+    def __post_init__(self) -> None:
+        self.clases = adoptar_lista(self.clases)
+        self._indice_nombres: IndiceUnicidad[EspecificacionClase] = IndiceUnicidad(_nombre_de)
 
     def validar(self) -> None:
         """Valida la especificación del proyecto y falla si hay datos inválidos."""
@@ -131,15 +154,14 @@ class EspecificacionProyecto:
         if not PATRON_SEMVER.match(self.version):
             raise ErrorValidacionDominio("La versión debe cumplir el formato X.Y.Z.")
 
-        nombres = [clase.nombre for clase in self.clases]
-        duplicadas = {nombre for nombre in nombres if nombres.count(nombre) > 1}
+        duplicadas = self._indice_nombres.sincronizar(self.clases).duplicadas()
         if duplicadas:
             raise ErrorValidacionDominio(
                 f"La especificación contiene clases duplicadas: {sorted(duplicadas)}"
             )
 
     def agregar_clase(self, clase: EspecificacionClase) -> None:
-        if any(item.nombre == clase.nombre for item in self.clases):
+        if self._indice_nombres.sincronizar(self.clases).contiene(clase.nombre):
             raise ErrorValidacionDominio(f"Ya existe una clase con nombre '{clase.nombre}'.")
         self.clases.append(clase)
 
@@ -151,7 +173,9 @@ class EspecificacionProyecto:
 
     def eliminar_clase(self, id_interno: str) -> None:
         clase = self.obtener_clase(id_interno)
+        indice = self._indice_nombres.sincronizar(self.clases)
         self.clases.remove(clase)
+        indice.retirar(clase)
 
     def renombrar_clase(self, id_interno: str, nuevo_nombre: str) -> EspecificacionClase:
         clase = self.obtener_clase(id_interno)
@@ -160,15 +184,15 @@ class EspecificacionProyecto:
             nombre=nuevo_nombre,
             atributos=clase.atributos.copy(),
         )
-        if any(
-            item.nombre == candidato.nombre and item.id_interno != id_interno
-            for item in self.clases
-        ):
+        indice_nombres = self._indice_nombres.sincronizar(self.clases)
+        propias = 1 if clase.nombre == candidato.nombre else 0
+        if indice_nombres.ocurrencias(candidato.nombre) > propias:
             raise ErrorValidacionDominio(
                 f"Ya existe una clase con nombre '{candidato.nombre}'."
             )
         indice = self.clases.index(clase)
         self.clases[indice] = candidato
+        indice_nombres.reemplazar(clase, candidato)
         return candidato
 
     def listar_clases(self) -> list[EspecificacionClase]:
@@ -0,0 +1,147 @@
+"""Índice incremental de claves para detectar duplicados en agregados del dominio."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Generic, SupportsIndex, TypeVar
+
+T = TypeVar("T")
+
+
+class ListaVersionada(list[T]):
+    """Lista que cuenta las modificaciones que no son crecer por el final.
+
+    ``append``/``extend``/``+=`` no cuentan: el índice puede indexar solo la
+    cola nueva. Sustituir, insertar, borrar o reordenar incrementa
+    ``modificaciones`` y obliga al índice a reconstruirse.
+    """
+
+    def __init__(self, elementos: Iterable[T] = ()) -> None:
+        super().__init__(elementos)
+        self.modificaciones = 0
+
+    def __setitem__(self, posicion: Any, valor: Any) -> None:
+        self.modificaciones += 1
+        super().__setitem__(posicion, valor)
+
+    def __delitem__(self, posicion: SupportsIndex | slice) -> None:
+        self.modificaciones += 1
+        super().__delitem__(posicion)
+
+    def __imul__(self, veces: SupportsIndex) -> ListaVersionada[T]:
+        self.modificaciones += 1
+        super().__imul__(veces)
+        return self
+
+    def insert(self, posicion: SupportsIndex, valor: T) -> None:
+        self.modificaciones += 1
+        super().insert(posicion, valor)
+
+    def pop(self, posicion: SupportsIndex = -1) -> T:
+        self.modificaciones += 1
+        return super().pop(posicion)
+
+    def remove(self, valor: T) -> None:
+        self.modificaciones += 1
+        super().remove(valor)
+
+    def clear(self) -> None:
+        self.modificaciones += 1
+        super().clear()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self.modificaciones += 1
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self.modificaciones += 1
+        super().reverse()
+
+
+def adoptar_lista(elementos: Iterable[T]) -> list[T]:
+    """Conserva la lista recibida para que los cambios del llamador lleguen al agregado.
+
+    Solo los iterables que no son ``list`` se copian, y a una ``ListaVersionada``.
+    """
+    return elementos if isinstance(elementos, list) else ListaVersionada(elementos)
+
+
+class IndiceUnicidad(Generic[T]):
+    """Cuenta las claves de una lista del agregado y expone sus duplicados.
+
+    Solo indexa la cola nueva si la lista es la misma (se guarda una
+    referencia, no su ``id``), no encogió y lo ya indexado sigue igual: en una
+    ``ListaVersionada`` porque su contador de modificaciones no avanzó; en una
+    lista normal porque el último elemento indexado sigue en su posición. Si
+    no, reconstruye el índice completo en O(n). Una lista normal no delata una
+    sustitución en mitad de la lista; los agregados sustituyen con sus propios
+    métodos. Las claves de los elementos no deben mutar en sitio.
+    """
+
+    def __init__(self, extraer_clave: Callable[[T], str]) -> None:
+        self._extraer_clave = extraer_clave
+        self._conteo: Counter[str] = Counter()
+        self._duplicadas: set[str] = set()
+        self._lista: Sequence[T] | None = None
+        self._modificaciones: int | None = None
+        self._indexados = 0
+        self._ultimo: T | None = None
+
+    def sincronizar(self, elementos: Sequence[T]) -> IndiceUnicidad[T]:
+        if not self._vigente(elementos):
+            self._conteo = Counter()
+            self._duplicadas = set()
+            self._lista = elementos
+            self._indexados = 0
+        for elemento in elementos[self._indexados :]:
+            self._sumar(self._extraer_clave(elemento))
+        self._indexados = len(elementos)
+        self._aceptar_modificacion()
+        return self
+
+    def _vigente(self, elementos: Sequence[T]) -> bool:
+        if elementos is not self._lista or len(elementos) < self._indexados:
+            return False
+        modificaciones = getattr(elementos, "modificaciones", None)
+        if modificaciones is not None:
+            return modificaciones == self._modificaciones
+        return self._indexados == 0 or elementos[self._indexados - 1] is self._ultimo
+
+    def contiene(self, clave: str) -> bool:
+        return self._conteo[clave] > 0
+
+    def ocurrencias(self, clave: str) -> int:
+        return self._conteo[clave]
+
+    def duplicadas(self) -> set[str]:
+        return set(self._duplicadas)
+
+    def retirar(self, elemento: T) -> None:
+        """Descuenta un elemento que el agregado acaba de eliminar de la lista indexada."""
+        self._restar(self._extraer_clave(elemento))
+        self._indexados -= 1
+        self._aceptar_modificacion()
+
+    def reemplazar(self, anterior: T, nuevo: T) -> None:
+        """Actualiza el índice tras sustituir un elemento en su misma posición."""
+        self._restar(self._extraer_clave(anterior))
+        self._sumar(self._extraer_clave(nuevo))
+        self._aceptar_modificacion()
+
+    def _aceptar_modificacion(self) -> None:
+        """La última modificación de la lista ya está reflejada en el índice."""
+        self._modificaciones = getattr(self._lista, "modificaciones", None)
+        self._ultimo = self._lista[self._indexados - 1] if self._lista is not None and self._indexados else None
+
+    def _sumar(self, clave: str) -> None:
+        self._conteo[clave] += 1
+        if self._conteo[clave] > 1:
+            self._duplicadas.add(clave)
+
+    def _restar(self, clave: str) -> None:
+        self._conteo[clave] -= 1
+        if self._conteo[clave] <= 1:
+            self._duplicadas.discard(clave)
+        if self._conteo[clave] <= 0:
+            del self._conteo[clave]
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from dominio.especificacion import ErrorValidacionDominio
+from dominio.indice_unicidad import IndiceUnicidad, adoptar_lista
 
 
 @dataclass(frozen=True)
@@ -22,6 +23,10 @@ class EntradaManifest:
             raise ErrorValidacionDominio("El hash SHA256 es obligatorio en el manifest.")
 
 
+def _ruta_de(entrada: EntradaManifest) -> str:
+    return entrada.ruta_relativa
+
+
 @dataclass
 class ManifestProyecto:
     """Representa la metadata de generación del proyecto."""
@@ -33,8 +38,9 @@ class ManifestProyecto:
     opciones: dict[str, Any]
 
     def __post_init__(self) -> None:
-        rutas = [entrada.ruta_relativa for entrada in self.archivos]
-        duplicadas = {ruta for ruta in rutas if rutas.count(ruta) > 1}
+        self.archivos = adoptar_lista(self.archivos)
+        self._indice_rutas: IndiceUnicidad[EntradaManifest] = IndiceUnicidad(_ruta_de)
+        duplicadas = self._indice_rutas.sincronizar(self.archivos).duplicadas()
         if duplicadas:
             raise ErrorValidacionDominio(
                 f"El manifest contiene rutas duplicadas: {sorted(duplicadas)}"
@@ -2,24 +2,67 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
 
 from dominio.especificacion import ErrorValidacionDominio
+from dominio.indice_unicidad import IndiceUnicidad, ListaVersionada, adoptar_lista
 
 
 @dataclass(frozen=True)
 class ArchivoGenerado:
-    """Representa un archivo a crear dentro del plan de generación."""
+    """Representa un archivo a crear dentro del plan de generación.
+
+    En modo diferido ``contenido_texto`` es ``None`` y el texto se produce con
+    ``renderizador`` solo al llamar a ``renderizar``; la ruta se conoce siempre.
+    """
 
     ruta_relativa: str
-    contenido_texto: str
+    contenido_texto: str | None = None
+    renderizador: Callable[[], str] | None = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if (self.contenido_texto is None) == (self.renderizador is None):
+            raise ErrorValidacionDominio(
+                f"El archivo '{self.ruta_relativa}' requiere exactamente uno entre contenido y renderizador."
+            )
+
+    @classmethod
+    def diferido(cls, ruta_relativa: str, renderizador: Callable[[], str]) -> ArchivoGenerado:
+        """Crea un archivo cuyo contenido se renderiza al escribirlo."""
+        return cls(ruta_relativa, renderizador=renderizador)
+
+    @property
+    def es_diferido(self) -> bool:
+        return self.contenido_texto is None
+
+    def renderizar(self) -> str:
+        """Retorna el contenido, invocando el renderizador si es diferido."""
+        if self.contenido_texto is not None:
+            return self.contenido_texto
+        assert self.renderizador is not None
+        return self.renderizador()
+
+    def materializar(self) -> ArchivoGenerado:
+        """Retorna una copia con el contenido ya renderizado."""
+        if not self.es_diferido:
+            return self
+        return replace(self, contenido_texto=self.renderizar(), renderizador=None)
+
+
+def _ruta_de(archivo: ArchivoGenerado) -> str:
+    return archivo.ruta_relativa
 
 
 @dataclass
 class PlanGeneracion:
     """Lista de archivos que serán generados para construir un proyecto base."""
 
-    archivos: list[ArchivoGenerado] = field(default_factory=list)
+    archivos: list[ArchivoGenerado] = field(default_factory=ListaVersionada)
+
+    def __post_init__(self) -> None:
+        self.archivos = adoptar_lista(self.archivos)
+        self._indice_rutas: IndiceUnicidad[ArchivoGenerado] = IndiceUnicidad(_ruta_de)
 
     def agregar_archivo(self, archivo: ArchivoGenerado) -> None:
         """Agrega un archivo al plan actual."""
@@ -31,14 +74,36 @@ class PlanGeneracion:
         plan_fusionado.validar_sin_conflictos()
         return plan_fusionado
 
+    def incorporar(self, otro_plan: PlanGeneracion) -> None:
+        """Anexa en sitio los archivos de otro plan validando solo las rutas nuevas.
+
+        Equivale a ``fusionar`` sin copiar el plan acumulado, de modo que
+        componer k planes cuesta O(total de archivos). Si hay conflictos el
+        plan actual no se modifica.
+        """
+        indice = self._indice_rutas.sincronizar(self.archivos)
+        rutas_nuevas = IndiceUnicidad(_ruta_de).sincronizar(otro_plan.archivos)
+        rutas_duplicadas = indice.duplicadas() | rutas_nuevas.duplicadas()
+        rutas_duplicadas.update(
+            archivo.ruta_relativa for archivo in otro_plan.archivos if indice.contiene(archivo.ruta_relativa)
+        )
+        if rutas_duplicadas:
+            raise ErrorValidacionDominio(
+                f"El plan contiene rutas duplicadas: {sorted(rutas_duplicadas)}"
+            )
+        self.archivos.extend(otro_plan.archivos)
+
+    def materializar(self) -> PlanGeneracion:
+        """Retorna un plan equivalente con todos los contenidos renderizados."""
+        return PlanGeneracion(archivos=[archivo.materializar() for archivo in self.archivos])
+
     def obtener_rutas(self) -> list[str]:
         """Retorna todas las rutas relativas incluidas en el plan."""
         return [archivo.ruta_relativa for archivo in self.archivos]
 
     def validar_sin_conflictos(self) -> None:
         """Valida que no existan rutas duplicadas en el plan."""
-        rutas = self.obtener_rutas()
-        rutas_duplicadas = {ruta for ruta in rutas if rutas.count(ruta) > 1}
+        rutas_duplicadas = self._indice_rutas.sincronizar(self.archivos).duplicadas()
         if rutas_duplicadas:
             raise ErrorValidacionDominio(
                 f"El plan contiene rutas duplicadas: {sorted(rutas_duplicadas)}"
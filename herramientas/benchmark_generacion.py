@@ -0,0 +1,366 @@
+"""Benchmark reproducible de la generación con presets sintéticos.
+
+Cada escenario combina un tamaño de especificación (clases x atributos) con
+una combinación válida de blueprints y recorre el pipeline real:
+``CrearPlanDesdeBlueprints``, ``EjecutarPlan`` (con ``GenerarManifest``) y
+los dos auditores. Los resultados se escriben en JSON y pueden compararse
+contra una línea base para detectar regresiones::
+
+    python -m herramientas.benchmark_generacion --salida bench.json
+    python -m herramientas.benchmark_generacion --rapido --linea-base bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from itertools import combinations, product
+import json
+import logging
+import multiprocessing
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+from time import perf_counter
+from typing import Any
+
+from aplicacion.casos_uso.auditar_proyecto_generado import AuditarProyectoGenerado
+from aplicacion.casos_uso.auditoria.auditar_proyecto_generado import (
+    AuditarProyectoGenerado as AuditarProyectoGeneradoArquitectura,
+)
+from aplicacion.casos_uso.crear_plan_desde_blueprints import CrearPlanDesdeBlueprints
+from aplicacion.casos_uso.ejecutar_plan import EjecutarPlan
+from aplicacion.casos_uso.generar_manifest import GenerarManifest
+from aplicacion.casos_uso.validar_compatibilidad_blueprints import ValidarCompatibilidadBlueprints
+from aplicacion.puertos.ejecutor_procesos import EjecutorProcesos, ResultadoProceso
+from aplicacion.servicios.trazado import Trazador, activar_trazador
+from dominio.especificacion import EspecificacionAtributo, EspecificacionClase, EspecificacionProyecto
+from infraestructura.blueprints.metadata_registry import obtener_metadata_blueprints
+from infraestructura.calculadora_hash_real import CalculadoraHashReal
+from infraestructura.repositorio_blueprints_en_disco import RepositorioBlueprintsEnDisco
+from infraestructura.sistema_archivos_real import HILOS_ESCRITURA_POR_DEFECTO, SistemaArchivosReal
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+LOGGER = logging.getLogger(__name__)
+
+VERSION_FORMATO = 1
+BLUEPRINT_BASE = "base_clean_arch"
+TIPOS_SINTETICOS = ("str", "int", "float", "bool")
+CLASES_POR_DEFECTO = (1, 10, 100, 1000)
+ATRIBUTOS_POR_DEFECTO = (1, 10, 50)
+CLASES_RAPIDO = (1, 10)
+ATRIBUTOS_RAPIDO = (1, 10)
+TOLERANCIA_POR_DEFECTO = 0.25
+SEGUNDOS_MINIMOS_COMPARABLES = 0.05
+
+# Métrica -> True si un valor mayor es peor.
+METRICAS_COMPARADAS = {
+    "segundos_total": True,
+    "rss_pico_kb": True,
+    "archivos_por_segundo": False,
+}
+
+
+@dataclass(frozen=True)
+class Escenario:
+    clases: int
+    atributos: int
+    blueprints: tuple[str, ...]
+
+    @property
+    def identificador(self) -> str:
+        return f"c{self.clases}_a{self.atributos}_{'+'.join(self.blueprints)}"
+
+
+@dataclass
+class ResultadoEscenario:
+    escenario: str
+    clases: int
+    atributos: int
+    blueprints: list[str]
+    archivos: int
+    segundos_total: float
+    archivos_por_segundo: float
+    rss_pico_kb: int | None
+    etapas: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Regresion:
+    escenario: str
+    metrica: str
+    linea_base: float
+    actual: float
+    variacion: float
+
+
+class _EjecutorProcesosOmitido(EjecutorProcesos):
+    """Evita lanzar el pytest del proyecto generado: se mide el generador, no sus tests."""
+
+    def ejecutar(self, comando: list[str], cwd: str) -> ResultadoProceso:
+        return ResultadoProceso(codigo_salida=0, stdout="", stderr="")
+
+
+def construir_especificacion_sintetica(clases: int, atributos: int, ruta_destino: str) -> EspecificacionProyecto:
+    """Especificación determinista: mismos nombres y tipos en cada ejecución."""
+    especificacion = EspecificacionProyecto(
+        nombre_proyecto=f"benchmark_c{clases}_a{atributos}",
+        ruta_destino=ruta_destino,
+        descripcion="Preset sintético de benchmark",
+    )
+    for indice_clase in range(clases):
+        especificacion.agregar_clase(
+            EspecificacionClase(
+                nombre=f"Entidad{indice_clase:04d}",
+                atributos=[
+                    EspecificacionAtributo(
+                        nombre=f"campo_{indice_atributo:02d}",
+                        tipo=TIPOS_SINTETICOS[indice_atributo % len(TIPOS_SINTETICOS)],
+                        obligatorio=indice_atributo % 2 == 0,
+                    )
+                    for indice_atributo in range(atributos)
+                ],
+            )
+        )
+    return especificacion
+
+
+def combinaciones_blueprints(nombres: list[str] | None = None) -> list[tuple[str, ...]]:
+    """Todas las combinaciones con el blueprint base que la validación declarativa acepta."""
+    metadata = obtener_metadata_blueprints()
+    disponibles = nombres or [
+        blueprint.nombre() for blueprint in RepositorioBlueprintsEnDisco("blueprints").listar_blueprints()
+    ]
+    opcionales = sorted(nombre for nombre in disponibles if nombre != BLUEPRINT_BASE)
+    validador = ValidarCompatibilidadBlueprints(metadata)
+    combinaciones: list[tuple[str, ...]] = []
+    for tamano in range(len(opcionales) + 1):
+        for extra in combinations(opcionales, tamano):
+            candidata = (BLUEPRINT_BASE, *extra)
+            if validador.ejecutar(list(candidata), hay_clases=True).es_valido:
+                combinaciones.append(candidata)
+    return combinaciones
+
+
+def construir_escenarios(
+    clases: tuple[int, ...],
+    atributos: tuple[int, ...],
+    combinaciones: list[tuple[str, ...]],
+) -> list[Escenario]:
+    return [
+        Escenario(numero_clases, numero_atributos, combinacion)
+        for numero_clases, numero_atributos, combinacion in product(clases, atributos, combinaciones)
+    ]
+
+
+def rss_pico_kb() -> int | None:
+    """Pico de memoria residente del proceso en KiB; ``None`` si la plataforma no lo expone."""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico // 1024 if sys.platform == "darwin" else pico
+
+
+def ejecutar_escenario(escenario: Escenario, repeticiones: int = 1) -> ResultadoEscenario:
+    """Ejecuta el escenario ``repeticiones`` veces en frío y reporta la mediana de los tiempos."""
+    mediciones = [_medir_escenario(escenario) for _ in range(max(1, repeticiones))]
+    etapas = {
+        etapa: round(statistics.median(medicion[1][etapa] for medicion in mediciones), 6)
+        for etapa in mediciones[0][1]
+    }
+    archivos = mediciones[0][0]
+    segundos_total = round(statistics.median(medicion[2] for medicion in mediciones), 6)
+    return ResultadoEscenario(
+        escenario=escenario.identificador,
+        clases=escenario.clases,
+        atributos=escenario.atributos,
+        blueprints=list(escenario.blueprints),
+        archivos=archivos,
+        segundos_total=segundos_total,
+        archivos_por_segundo=round(archivos / segundos_total, 2) if segundos_total > 0 else 0.0,
+        rss_pico_kb=rss_pico_kb(),
+        etapas=etapas,
+    )
+
+
+def _medir_escenario(escenario: Escenario) -> tuple[int, dict[str, float], float]:
+    """Mide cada etapa sin caché de renderizado; escritura y manifest se separan con los spans de ``EjecutarPlan``."""
+    calculadora_hash = CalculadoraHashReal()
+    crear_plan = CrearPlanDesdeBlueprints(RepositorioBlueprintsEnDisco("blueprints"), plan_diferido=True)
+    ejecutar_plan = EjecutarPlan(
+        SistemaArchivosReal(max_hilos_escritura=HILOS_ESCRITURA_POR_DEFECTO),
+        generador_manifest=GenerarManifest(calculadora_hash),
+    )
+    auditor = AuditarProyectoGenerado(_EjecutorProcesosOmitido(), calculadora_hash=calculadora_hash)
+    auditor_arquitectura = AuditarProyectoGeneradoArquitectura()
+    blueprints = list(escenario.blueprints)
+
+    with tempfile.TemporaryDirectory(prefix="benchmark_generacion_") as temporal:
+        destino = str(Path(temporal) / "proyecto")
+        especificacion = construir_especificacion_sintetica(escenario.clases, escenario.atributos, destino)
+        trazador = Trazador()
+        inicio = perf_counter()
+        with activar_trazador(trazador):
+            plan = crear_plan.ejecutar(especificacion, blueprints)
+            fin_plan = perf_counter()
+            archivos = ejecutar_plan.ejecutar(plan, destino, blueprints_usados=blueprints)
+            fin_ejecucion = perf_counter()
+        auditor.ejecutar(destino, blueprints_usados=blueprints)
+        fin_auditoria = perf_counter()
+        auditor_arquitectura.auditar(destino)
+        fin = perf_counter()
+
+    duraciones_spans = {span.nombre: span.duracion_ns / 1_000_000_000 for span in trazador.spans}
+    etapas = {
+        "crear_plan": fin_plan - inicio,
+        "ejecutar_plan": fin_ejecucion - fin_plan,
+        "escribir_lote": duraciones_spans.get("escribir_lote", 0.0),
+        "generar_manifest": duraciones_spans.get("generar_manifest", 0.0),
+        "auditoria": fin_auditoria - fin_ejecucion,
+        "auditoria_arquitectura": fin - fin_auditoria,
+    }
+    return len(archivos), etapas, fin - inicio
+
+
+def ejecutar_benchmark(
+    escenarios: list[Escenario],
+    repeticiones: int = 1,
+    aislar_procesos: bool = True,
+) -> list[ResultadoEscenario]:
+    """Ejecuta los escenarios en orden.
+
+    Con ``aislar_procesos`` cada escenario corre en un proceso nuevo, así el
+    pico de RSS y las cachés de módulo no arrastran los escenarios previos.
+    Sin aislar, ``rss_pico_kb`` es el pico acumulado del proceso.
+    """
+    resultados: list[ResultadoEscenario] = []
+    for escenario in escenarios:
+        LOGGER.info("Escenario %s", escenario.identificador)
+        if aislar_procesos:
+            resultado = _ejecutar_en_proceso_nuevo(escenario, repeticiones)
+        else:
+            resultado = ejecutar_escenario(escenario, repeticiones)
+        LOGGER.info(
+            "  %s archivos en %s s (%s archivos/s, RSS pico %s KiB)",
+            resultado.archivos,
+            f"{resultado.segundos_total:.3f}",
+            f"{resultado.archivos_por_segundo:.1f}",
+            resultado.rss_pico_kb,
+        )
+        resultados.append(resultado)
+    return resultados
+
+
+def _ejecutar_en_proceso_nuevo(escenario: Escenario, repeticiones: int) -> ResultadoEscenario:
+    contexto = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=contexto) as pool:
+        return pool.submit(ejecutar_escenario, escenario, repeticiones).result()
+
+
+def construir_informe(resultados: list[ResultadoEscenario]) -> dict[str, Any]:
+    return {
+        "version": VERSION_FORMATO,
+        "entorno": {
+            "python": platform.python_version(),
+            "implementacion": platform.python_implementation(),
+            "plataforma": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "escenarios": [asdict(resultado) for resultado in resultados],
+    }
+
+
+def comparar_con_linea_base(
+    informe: dict[str, Any],
+    linea_base: dict[str, Any],
+    tolerancia: float = TOLERANCIA_POR_DEFECTO,
+) -> list[Regresion]:
+    """Métricas que empeoran más de ``tolerancia`` (fracción) respecto a la línea base.
+
+    Solo se comparan escenarios presentes en ambos informes. Los tiempos por
+    debajo de ``SEGUNDOS_MINIMOS_COMPARABLES`` se ignoran por ruido.
+    """
+    base_por_escenario = {entrada["escenario"]: entrada for entrada in linea_base.get("escenarios", [])}
+    regresiones: list[Regresion] = []
+    for actual in informe.get("escenarios", []):
+        base = base_por_escenario.get(actual["escenario"])
+        if base is None or base["segundos_total"] < SEGUNDOS_MINIMOS_COMPARABLES:
+            continue
+        for metrica, mayor_es_peor in METRICAS_COMPARADAS.items():
+            regresion = _evaluar_metrica(
+                actual["escenario"], metrica, base.get(metrica), actual.get(metrica), mayor_es_peor
+            )
+            if regresion is not None and abs(regresion.variacion) > tolerancia:
+                regresiones.append(regresion)
+    return regresiones
+
+
+def _evaluar_metrica(
+    escenario: str, metrica: str, valor_base: float | None, valor_actual: float | None, mayor_es_peor: bool
+) -> Regresion | None:
+    if not valor_base or valor_actual is None:
+        return None
+    variacion = (valor_actual - valor_base) / valor_base
+    empeora = variacion > 0 if mayor_es_peor else variacion < 0
+    if not empeora:
+        return None
+    return Regresion(escenario, metrica, valor_base, valor_actual, round(variacion, 4))
+
+
+def _parsear_argumentos(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark de generación con presets sintéticos")
+    parser.add_argument("--salida", type=Path, required=True, help="Ruta del informe JSON")
+    parser.add_argument("--linea-base", type=Path, help="Informe previo contra el que detectar regresiones")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA_POR_DEFECTO, help="Fracción admitida")
+    parser.add_argument("--clases", type=int, nargs="+", help="Número de clases por escenario")
+    parser.add_argument("--atributos", type=int, nargs="+", help="Número de atributos por clase")
+    parser.add_argument(
+        "--blueprints",
+        nargs="+",
+        help="Blueprints candidatos; se prueban todas sus combinaciones válidas",
+    )
+    parser.add_argument("--repeticiones", type=int, default=1, help="Se reporta la mediana")
+    parser.add_argument("--rapido", action="store_true", help="Matriz reducida para CI")
+    parser.add_argument("--sin-aislar", action="store_true", help="Ejecuta todo en el proceso actual")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parsear_argumentos(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(name)s:%(message)s")
+    clases = tuple(args.clases or (CLASES_RAPIDO if args.rapido else CLASES_POR_DEFECTO))
+    atributos = tuple(args.atributos or (ATRIBUTOS_RAPIDO if args.rapido else ATRIBUTOS_POR_DEFECTO))
+    escenarios = construir_escenarios(clases, atributos, combinaciones_blueprints(args.blueprints))
+
+    resultados = ejecutar_benchmark(escenarios, args.repeticiones, aislar_procesos=not args.sin_aislar)
+    informe = construir_informe(resultados)
+    args.salida.parent.mkdir(parents=True, exist_ok=True)
+    args.salida.write_text(json.dumps(informe, ensure_ascii=False, indent=2), encoding="utf-8")
+    LOGGER.info("Informe de benchmark escrito en %s", args.salida)
+
+    if args.linea_base is None:
+        return 0
+    linea_base = json.loads(args.linea_base.read_text(encoding="utf-8"))
+    regresiones = comparar_con_linea_base(informe, linea_base, args.tolerancia)
+    for regresion in regresiones:
+        LOGGER.error(
+            "Regresión en %s: %s %s -> %s (%s)",
+            regresion.escenario,
+            regresion.metrica,
+            regresion.linea_base,
+            regresion.actual,
+            f"{regresion.variacion:+.1%}",
+        )
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
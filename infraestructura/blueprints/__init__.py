@@ -1,5 +1,6 @@
 """Servicios de blueprints en infraestructura."""
 
 from .metadata_registry import obtener_metadata_blueprints
+from .registro_blueprints import RegistroBlueprints
 
-__all__ = ["obtener_metadata_blueprints"]
+__all__ = ["RegistroBlueprints", "obtener_metadata_blueprints"]
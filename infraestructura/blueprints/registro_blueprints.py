@@ -0,0 +1,129 @@
+"""Registro indexado de clases de blueprint con importación perezosa por carpeta."""
+
+from __future__ import annotations
+
+import importlib
+import logging
+from pathlib import Path
+import time
+
+from aplicacion.puertos.blueprint import Blueprint
+
+LOGGER = logging.getLogger(__name__)
+
+HuellaDirectorio = tuple[tuple[str, int], ...]
+
+TTL_HUELLA_SEGUNDOS = 2.0
+
+
+class RegistroBlueprints:
+    """Indexa las carpetas de blueprints una vez y mantiene un mapa ``nombre -> clase``.
+
+    Solo se importa el módulo de la carpeta necesaria para resolver un nombre
+    (``crud_sqlite`` se busca primero en ``crud_sqlite`` y ``crud_sqlite_v*``).
+    La huella de ``mtime`` del directorio raíz y de cada carpeta se recalcula
+    como mucho una vez cada ``ttl_segundos``, al llamar a ``invalidar`` o
+    cuando un nombre no se encuentra; si cambió, el índice se reconstruye.
+    Una carpeta cuyo módulo falla al importarse sigue pendiente, de modo que
+    cada consulta vuelve a intentarlo y propaga el error.
+    """
+
+    def __init__(self, ruta_blueprints: Path, ttl_segundos: float = TTL_HUELLA_SEGUNDOS) -> None:
+        self._ruta_blueprints = ruta_blueprints
+        self._ttl_segundos = ttl_segundos
+        self._huella: HuellaDirectorio | None = None
+        self._huella_vigente_hasta = 0.0
+        self._modulos_pendientes: dict[str, str] = {}
+        self._clases_por_carpeta: dict[str, type[Blueprint] | None] = {}
+        self._clases_por_nombre: dict[str, type[Blueprint]] = {}
+
+    def invalidar(self) -> None:
+        """Fuerza a recalcular la huella en la próxima consulta."""
+        self._huella_vigente_hasta = 0.0
+
+    def resolver_clase(self, nombre: str) -> type[Blueprint] | None:
+        """Retorna la clase del blueprint ``nombre`` importando lo mínimo posible."""
+        self._refrescar_si_cambio()
+        clase = self._buscar_clase(nombre)
+        if clase is None and self._refrescar_si_cambio(forzar=True):
+            clase = self._buscar_clase(nombre)
+        return clase
+
+    def _buscar_clase(self, nombre: str) -> type[Blueprint] | None:
+        if nombre in self._clases_por_nombre:
+            return self._clases_por_nombre[nombre]
+
+        candidatas = [carpeta for carpeta in self._modulos_pendientes if self._es_candidata(carpeta, nombre)]
+        restantes = [carpeta for carpeta in self._modulos_pendientes if carpeta not in candidatas]
+        for carpeta in [*candidatas, *restantes]:
+            self._importar_carpeta(carpeta)
+            if nombre in self._clases_por_nombre:
+                return self._clases_por_nombre[nombre]
+        return None
+
+    def listar_clases(self) -> list[type[Blueprint]]:
+        """Importa todas las carpetas pendientes y retorna las clases en orden de carpeta."""
+        self._refrescar_si_cambio()
+        for carpeta in list(self._modulos_pendientes):
+            self._importar_carpeta(carpeta)
+        return [
+            clase
+            for _, clase in sorted(self._clases_por_carpeta.items())
+            if clase is not None
+        ]
+
+    def _refrescar_si_cambio(self, forzar: bool = False) -> bool:
+        """Recalcula la huella si caducó (o con ``forzar``); retorna si el índice se reconstruyó."""
+        ahora = time.monotonic()
+        if not forzar and self._huella is not None and ahora < self._huella_vigente_hasta:
+            return False
+        self._huella_vigente_hasta = ahora + self._ttl_segundos
+        huella = self._calcular_huella()
+        if huella == self._huella:
+            return False
+        if self._huella is not None:
+            LOGGER.info("Cambios detectados en '%s', reindexando blueprints.", self._ruta_blueprints)
+            importlib.invalidate_caches()
+        self._huella = huella
+        self._clases_por_carpeta = {}
+        self._clases_por_nombre = {}
+        self._modulos_pendientes = {
+            carpeta: f"{self._ruta_blueprints.name}.{carpeta}.blueprint"
+            for carpeta, _ in huella[1:]
+            if (self._ruta_blueprints / carpeta / "blueprint.py").exists()
+        }
+        return True
+
+    def _calcular_huella(self) -> HuellaDirectorio:
+        if not self._ruta_blueprints.exists():
+            return ()
+        carpetas = sorted(
+            (carpeta.name, carpeta.stat().st_mtime_ns)
+            for carpeta in self._ruta_blueprints.iterdir()
+            if carpeta.is_dir() and not carpeta.name.startswith("__")
+        )
+        return (("", self._ruta_blueprints.stat().st_mtime_ns), *carpetas)
+
+    def _importar_carpeta(self, carpeta: str) -> None:
+        clase = _resolver_clase_en_modulo(self._modulos_pendientes[carpeta])
+        del self._modulos_pendientes[carpeta]
+        self._clases_por_carpeta[carpeta] = clase
+        if clase is not None:
+            self._clases_por_nombre.setdefault(clase().nombre(), clase)
+
+    @staticmethod
+    def _es_candidata(carpeta: str, nombre: str) -> bool:
+        return carpeta == nombre or carpeta.startswith(f"{nombre}_v")
+
+
+def _resolver_clase_en_modulo(modulo: str) -> type[Blueprint] | None:
+    modulo_obj = importlib.import_module(modulo)
+    for atributo in vars(modulo_obj).values():
+        if (
+            isinstance(atributo, type)
+            and issubclass(atributo, Blueprint)
+            and atributo is not Blueprint
+            and atributo.__module__ == modulo
+        ):
+            return atributo
+    return None
@@ -1,13 +1,36 @@
-"""Puntos de entrada de bootstrap por contexto de presentación."""
+"""Puntos de entrada de bootstrap por contexto de presentación.
+
+Los bootstrap por contexto se resuelven de forma diferida: importar
+``configurar_logging`` o ``bootstrap_cli`` no arrastra el ensamblado de la GUI.
+"""
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from importlib import import_module
+
+from infraestructura.logging_config import (
+    NIVELES_RESUMEN,
+    configurar_logging,
+    configurar_logging_proceso,
+    reenviar_logs_de_procesos,
+)
+
+_EXPORTS = {
+    "ContenedorCli": "bootstrap_cli",
+    "construir_contenedor_cli": "bootstrap_cli",
+    "ContenedorGui": "bootstrap_gui",
+    "construir_contenedor_gui": "bootstrap_gui",
+}
+
 
-from infraestructura.logging_config import configurar_logging
+def __getattr__(nombre: str) -> object:
+    modulo_relativo = _EXPORTS.get(nombre)
+    if modulo_relativo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
 
-from .bootstrap_cli import ContenedorCli, construir_contenedor_cli
-from .bootstrap_gui import ContenedorGui, construir_contenedor_gui
+    modulo = import_module(f".{modulo_relativo}", package=__name__)
+    return getattr(modulo, nombre)
 
 
 @dataclass(frozen=True)
@@ -28,6 +51,8 @@ class ContenedorAplicacion:
 
 def construir_contenedor_aplicacion() -> ContenedorAplicacion:
     """Construye un contenedor legado desde los bootstrap por contexto."""
+    from .bootstrap_cli import construir_contenedor_cli
+    from .bootstrap_gui import construir_contenedor_gui
 
     contenedor_cli = construir_contenedor_cli()
     contenedor_gui = construir_contenedor_gui()
@@ -46,11 +71,14 @@ def construir_contenedor_aplicacion() -> ContenedorAplicacion:
 
 
 __all__ = [
+    "NIVELES_RESUMEN",
     "ContenedorAplicacion",
     "ContenedorCli",
     "ContenedorGui",
     "configurar_logging",
+    "configurar_logging_proceso",
     "construir_contenedor_aplicacion",
     "construir_contenedor_cli",
     "construir_contenedor_gui",
+    "reenviar_logs_de_procesos",
 ]
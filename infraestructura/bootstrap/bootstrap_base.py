@@ -13,12 +13,17 @@ from aplicacion.casos_uso.presets import CargarPresetProyecto, GuardarPresetProy
 from aplicacion.casos_uso.seguridad import GuardarCredencial
 from infraestructura.calculadora_hash_real import CalculadoraHashReal
 from infraestructura.ejecutor_procesos_subprocess import EjecutorProcesosSubprocess
-from infraestructura.manifest_en_disco import EscritorManifestSeguro, LectorManifestEnDisco
-from infraestructura.plugins.descubridor_plugins import DescubridorPlugins
+from infraestructura.manifest_en_disco import CacheEstadoManifestEnDisco, EscritorManifestSeguro, LectorManifestEnDisco
+from infraestructura.plugins.descubridor_plugins import RUTA_CACHE_CATALOGO_POR_DEFECTO, DescubridorPlugins
 from infraestructura.presets.repositorio_presets_json import RepositorioPresetsJson
 from infraestructura.repositorio_blueprints_en_disco import RepositorioBlueprintsEnDisco
 from infraestructura.seguridad import SelectorRepositorioCredenciales
-from infraestructura.sistema_archivos_real import SistemaArchivosReal
+from infraestructura.sistema_archivos_real import (
+    HILOS_ESCRITURA_POR_DEFECTO,
+    MODO_DURABILIDAD_POR_DEFECTO,
+    ModoDurabilidad,
+    SistemaArchivosReal,
+)
 
 
 @dataclass(frozen=True)
@@ -28,6 +33,7 @@ class PuertosInfraestructura:
     calculadora_hash: CalculadoraHashReal
     lector_manifest: LectorManifestEnDisco
     escritor_manifest: EscritorManifestSeguro
+    cache_estado_manifest: CacheEstadoManifestEnDisco
     ejecutor_procesos: EjecutorProcesosSubprocess
 
 
@@ -49,13 +55,19 @@ class AdaptadoresAplicacion:
     guardar_credencial: GuardarCredencial
 
 
-def _construir_puertos_infraestructura() -> PuertosInfraestructura:
+def _construir_puertos_infraestructura(
+    modo_durabilidad: ModoDurabilidad = MODO_DURABILIDAD_POR_DEFECTO,
+) -> PuertosInfraestructura:
     return PuertosInfraestructura(
-        sistema_archivos=SistemaArchivosReal(),
-        descubridor_plugins=DescubridorPlugins("plugins"),
+        sistema_archivos=SistemaArchivosReal(
+            max_hilos_escritura=HILOS_ESCRITURA_POR_DEFECTO,
+            modo_durabilidad=modo_durabilidad,
+        ),
+        descubridor_plugins=DescubridorPlugins("plugins", ruta_cache_catalogo=RUTA_CACHE_CATALOGO_POR_DEFECTO),
         calculadora_hash=CalculadoraHashReal(),
         lector_manifest=LectorManifestEnDisco(),
         escritor_manifest=EscritorManifestSeguro(),
+        cache_estado_manifest=CacheEstadoManifestEnDisco(),
         ejecutor_procesos=EjecutorProcesosSubprocess(),
     )
 
@@ -74,6 +86,7 @@ def _construir_adaptadores_aplicacion(
     crear_plan_desde_blueprints = CrearPlanDesdeBlueprints(
         repositorios.repositorio_blueprints,
         descubridor_plugins=puertos.descubridor_plugins,
+        plan_diferido=True,
     )
     generar_manifest = GenerarManifest(puertos.calculadora_hash)
 
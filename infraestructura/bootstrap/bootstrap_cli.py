@@ -1,91 +1,197 @@
-"""Bootstrap de dependencias para el contexto CLI."""
+"""Bootstrap de dependencias para el contexto CLI.
+
+Cada caso de uso se ensambla, e importa su módulo, la primera vez que se
+accede a él: ``validar-preset`` no carga la generación ni los auditores, y
+``auditar`` no carga los blueprints. Los puertos compartidos también son
+perezosos y se construyen una sola vez por contenedor.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
 
-from aplicacion.casos_uso.actualizar_manifest_patch import ActualizarManifestPatch
-from aplicacion.casos_uso.auditar_finalizacion_proyecto import AuditarFinalizacionProyecto
-from aplicacion.casos_uso.auditar_proyecto_generado import AuditarProyectoGenerado
-from aplicacion.casos_uso.auditoria.auditar_proyecto_generado import AuditarProyectoGenerado as AuditarProyectoGeneradoArquitectura
-from aplicacion.casos_uso.crear_plan_desde_blueprints import CrearPlanDesdeBlueprints
-from aplicacion.casos_uso.crear_plan_patch_desde_blueprints import CrearPlanPatchDesdeBlueprints
-from aplicacion.casos_uso.ejecutar_plan import EjecutarPlan
-from aplicacion.casos_uso.generacion.generar_proyecto_mvp import GenerarProyectoMvp
-from aplicacion.casos_uso.generar_manifest import GenerarManifest
-from aplicacion.casos_uso.presets import CargarPresetProyecto
-from aplicacion.casos_uso.validar_compatibilidad_blueprints import ValidarCompatibilidadBlueprints
-from infraestructura.blueprints.metadata_registry import obtener_metadata_blueprints
-from infraestructura.manifest.generador_manifest import GeneradorManifest
-from infraestructura.planificador_blueprints_real import PlanificadorBlueprintsReal
+# ``MODOS_DURABILIDAD`` se reexporta para que la CLI no dependa de infraestructura fuera de bootstrap.
+from infraestructura.sistema_archivos_real import MODO_DURABILIDAD_POR_DEFECTO, MODOS_DURABILIDAD, ModoDurabilidad
 
-from .bootstrap_base import _construir_puertos_infraestructura, _construir_repositorios_infraestructura
+if TYPE_CHECKING:
+    from aplicacion.casos_uso.actualizar_manifest_patch import ActualizarManifestPatch
+    from aplicacion.casos_uso.auditar_finalizacion_proyecto import AuditarFinalizacionProyecto
+    from aplicacion.casos_uso.auditar_proyecto_generado import AuditarProyectoGenerado
+    from aplicacion.casos_uso.crear_plan_desde_blueprints import CrearPlanDesdeBlueprints
+    from aplicacion.casos_uso.crear_plan_patch_desde_blueprints import CrearPlanPatchDesdeBlueprints
+    from aplicacion.casos_uso.ejecutar_plan import EjecutarPlan
+    from aplicacion.casos_uso.generacion.generar_proyecto_mvp import GenerarProyectoMvp
+    from aplicacion.casos_uso.presets import CargarPresetProyecto
+    from aplicacion.casos_uso.sincronizar_proyecto import SincronizarProyecto
+    from infraestructura.calculadora_hash_real import CalculadoraHashReal
+    from infraestructura.ejecutor_procesos_subprocess import EjecutorProcesosSubprocess
+    from infraestructura.manifest_en_disco import (
+        CacheEstadoManifestEnDisco,
+        EscritorManifestSeguro,
+        LectorManifestEnDisco,
+    )
+    from infraestructura.sistema_archivos_real import SistemaArchivosReal
 
 
-@dataclass(frozen=True)
 class ContenedorCli:
-    """Casos de uso requeridos por la interfaz CLI."""
+    """Casos de uso requeridos por la interfaz CLI, construidos bajo demanda."""
 
-    crear_plan_desde_blueprints: CrearPlanDesdeBlueprints
-    crear_plan_patch_desde_blueprints: CrearPlanPatchDesdeBlueprints
-    ejecutar_plan: EjecutarPlan
-    actualizar_manifest_patch: ActualizarManifestPatch
-    cargar_preset_proyecto: CargarPresetProyecto
-    generar_proyecto_mvp: GenerarProyectoMvp
-    auditar_proyecto: AuditarProyectoGenerado
-    auditar_finalizacion_proyecto: AuditarFinalizacionProyecto
+    def __init__(self, modo_durabilidad: ModoDurabilidad = MODO_DURABILIDAD_POR_DEFECTO) -> None:
+        self._modo_durabilidad = modo_durabilidad
 
+    @cached_property
+    def crear_plan_desde_blueprints(self) -> CrearPlanDesdeBlueprints:
+        from aplicacion.casos_uso.crear_plan_desde_blueprints import CrearPlanDesdeBlueprints
+        from infraestructura.plugins.descubridor_plugins import RUTA_CACHE_CATALOGO_POR_DEFECTO, DescubridorPlugins
+        from infraestructura.repositorio_blueprints_en_disco import RepositorioBlueprintsEnDisco
 
-def construir_contenedor_cli() -> ContenedorCli:
-    """Construye un contenedor mínimo para ejecución por línea de comandos."""
+        return CrearPlanDesdeBlueprints(
+            RepositorioBlueprintsEnDisco("blueprints"),
+            descubridor_plugins=DescubridorPlugins("plugins", ruta_cache_catalogo=RUTA_CACHE_CATALOGO_POR_DEFECTO),
+            plan_diferido=True,
+        )
 
-    puertos = _construir_puertos_infraestructura()
-    repositorios = _construir_repositorios_infraestructura()
+    @cached_property
+    def crear_plan_patch_desde_blueprints(self) -> CrearPlanPatchDesdeBlueprints:
+        from aplicacion.casos_uso.crear_plan_patch_desde_blueprints import CrearPlanPatchDesdeBlueprints
 
-    crear_plan_desde_blueprints = CrearPlanDesdeBlueprints(
-        repositorios.repositorio_blueprints,
-        descubridor_plugins=puertos.descubridor_plugins,
-    )
-    generar_manifest = GenerarManifest(puertos.calculadora_hash)
-    ejecutar_plan = EjecutarPlan(
-        sistema_archivos=puertos.sistema_archivos,
-        generador_manifest=generar_manifest,
-    )
+        return CrearPlanPatchDesdeBlueprints(
+            lector_manifest=self._lector_manifest,
+            crear_plan_desde_blueprints=self.crear_plan_desde_blueprints,
+        )
 
-    auditor_proyecto = AuditarProyectoGenerado(puertos.ejecutor_procesos)
-    auditor_arquitectura = AuditarProyectoGeneradoArquitectura()
-    metadata_blueprints = obtener_metadata_blueprints()
-
-    return ContenedorCli(
-        crear_plan_desde_blueprints=crear_plan_desde_blueprints,
-        crear_plan_patch_desde_blueprints=CrearPlanPatchDesdeBlueprints(
-            lector_manifest=puertos.lector_manifest,
-            crear_plan_desde_blueprints=crear_plan_desde_blueprints,
-        ),
-        ejecutar_plan=ejecutar_plan,
-        actualizar_manifest_patch=ActualizarManifestPatch(
-            lector_manifest=puertos.lector_manifest,
-            escritor_manifest=puertos.escritor_manifest,
-            calculadora_hash=puertos.calculadora_hash,
-        ),
-        cargar_preset_proyecto=CargarPresetProyecto(repositorios.repositorio_presets),
-        generar_proyecto_mvp=GenerarProyectoMvp(
-            crear_plan_desde_blueprints=crear_plan_desde_blueprints,
-            ejecutar_plan=ejecutar_plan,
-            sistema_archivos=puertos.sistema_archivos,
-            generador_manifest=GeneradorManifest(),
-        ),
-        auditar_proyecto=auditor_proyecto,
-        auditar_finalizacion_proyecto=AuditarFinalizacionProyecto(
-            planificador_blueprints=PlanificadorBlueprintsReal(crear_plan_desde_blueprints),
-            generar_proyecto_mvp=GenerarProyectoMvp(
-                crear_plan_desde_blueprints=crear_plan_desde_blueprints,
-                ejecutar_plan=ejecutar_plan,
-                sistema_archivos=puertos.sistema_archivos,
-                generador_manifest=GeneradorManifest(),
+    @cached_property
+    def ejecutar_plan(self) -> EjecutarPlan:
+        from aplicacion.casos_uso.ejecutar_plan import EjecutarPlan
+        from aplicacion.casos_uso.generar_manifest import GenerarManifest
+
+        return EjecutarPlan(
+            sistema_archivos=self._sistema_archivos,
+            generador_manifest=GenerarManifest(self._calculadora_hash),
+        )
+
+    @cached_property
+    def actualizar_manifest_patch(self) -> ActualizarManifestPatch:
+        from aplicacion.casos_uso.actualizar_manifest_patch import ActualizarManifestPatch
+
+        return ActualizarManifestPatch(
+            lector_manifest=self._lector_manifest,
+            escritor_manifest=self._escritor_manifest,
+            calculadora_hash=self._calculadora_hash,
+        )
+
+    @cached_property
+    def sincronizar_proyecto(self) -> SincronizarProyecto:
+        from aplicacion.casos_uso.auditoria.verificador_hashes_manifest import VerificadorHashesManifest
+        from aplicacion.casos_uso.sincronizar_proyecto import SincronizarProyecto
+
+        return SincronizarProyecto(
+            lector_manifest=self._lector_manifest,
+            escritor_manifest=self._escritor_manifest,
+            crear_plan_desde_blueprints=self.crear_plan_desde_blueprints,
+            ejecutar_plan=self.ejecutar_plan,
+            verificador_hashes=VerificadorHashesManifest(
+                self._calculadora_hash, cache_estado=self._cache_estado_manifest
             ),
-            auditor_arquitectura=auditor_arquitectura,
-            ejecutor_procesos=puertos.ejecutor_procesos,
-            validador_compatibilidad_blueprints=ValidarCompatibilidadBlueprints(metadata_blueprints),
-        ),
-    )
+        )
+
+    @cached_property
+    def cargar_preset_proyecto(self) -> CargarPresetProyecto:
+        from aplicacion.casos_uso.presets import CargarPresetProyecto
+        from infraestructura.presets.repositorio_presets_json import RepositorioPresetsJson
+
+        return CargarPresetProyecto(RepositorioPresetsJson())
+
+    @cached_property
+    def generar_proyecto_mvp(self) -> GenerarProyectoMvp:
+        return self._construir_generar_proyecto_mvp()
+
+    @cached_property
+    def auditar_proyecto(self) -> AuditarProyectoGenerado:
+        from aplicacion.casos_uso.auditar_proyecto_generado import AuditarProyectoGenerado
+
+        return AuditarProyectoGenerado(
+            self._ejecutor_procesos,
+            calculadora_hash=self._calculadora_hash,
+            cache_estado_manifest=self._cache_estado_manifest,
+        )
+
+    @cached_property
+    def auditar_finalizacion_proyecto(self) -> AuditarFinalizacionProyecto:
+        from aplicacion.casos_uso.auditar_finalizacion_proyecto import AuditarFinalizacionProyecto
+        from aplicacion.casos_uso.auditoria.auditar_proyecto_generado import (
+            AuditarProyectoGenerado as AuditarProyectoGeneradoArquitectura,
+        )
+        from aplicacion.casos_uso.validar_compatibilidad_blueprints import ValidarCompatibilidadBlueprints
+        from infraestructura.blueprints.metadata_registry import obtener_metadata_blueprints
+        from infraestructura.planificador_blueprints_real import PlanificadorBlueprintsReal
+
+        return AuditarFinalizacionProyecto(
+            planificador_blueprints=PlanificadorBlueprintsReal(self.crear_plan_desde_blueprints),
+            generar_proyecto_mvp=self._construir_generar_proyecto_mvp(),
+            auditor_arquitectura=AuditarProyectoGeneradoArquitectura(),
+            ejecutor_procesos=self._ejecutor_procesos,
+            validador_compatibilidad_blueprints=ValidarCompatibilidadBlueprints(obtener_metadata_blueprints()),
+        )
+
+    def _construir_generar_proyecto_mvp(self) -> GenerarProyectoMvp:
+        from aplicacion.casos_uso.generacion.generar_proyecto_mvp import GenerarProyectoMvp
+        from infraestructura.manifest.generador_manifest import GeneradorManifest
+
+        return GenerarProyectoMvp(
+            crear_plan_desde_blueprints=self.crear_plan_desde_blueprints,
+            ejecutar_plan=self.ejecutar_plan,
+            sistema_archivos=self._sistema_archivos,
+            generador_manifest=GeneradorManifest(),
+            preparacion_aislada=True,
+        )
+
+    @cached_property
+    def _sistema_archivos(self) -> SistemaArchivosReal:
+        from infraestructura.sistema_archivos_real import HILOS_ESCRITURA_POR_DEFECTO, SistemaArchivosReal
+
+        return SistemaArchivosReal(
+            max_hilos_escritura=HILOS_ESCRITURA_POR_DEFECTO,
+            modo_durabilidad=self._modo_durabilidad,
+        )
+
+    @cached_property
+    def _calculadora_hash(self) -> CalculadoraHashReal:
+        from infraestructura.calculadora_hash_real import CalculadoraHashReal
+
+        return CalculadoraHashReal()
+
+    @cached_property
+    def _lector_manifest(self) -> LectorManifestEnDisco:
+        from infraestructura.manifest_en_disco import LectorManifestEnDisco
+
+        return LectorManifestEnDisco()
+
+    @cached_property
+    def _escritor_manifest(self) -> EscritorManifestSeguro:
+        from infraestructura.manifest_en_disco import EscritorManifestSeguro
+
+        return EscritorManifestSeguro()
+
+    @cached_property
+    def _cache_estado_manifest(self) -> CacheEstadoManifestEnDisco:
+        from infraestructura.manifest_en_disco import CacheEstadoManifestEnDisco
+
+        return CacheEstadoManifestEnDisco()
+
+    @cached_property
+    def _ejecutor_procesos(self) -> EjecutorProcesosSubprocess:
+        from infraestructura.ejecutor_procesos_subprocess import EjecutorProcesosSubprocess
+
+        return EjecutorProcesosSubprocess()
+
+
+def construir_contenedor_cli(modo_durabilidad: ModoDurabilidad = MODO_DURABILIDAD_POR_DEFECTO) -> ContenedorCli:
+    """Construye un contenedor mínimo para ejecución por línea de comandos.
+
+    No importa ni instancia nada: cada subcomando paga solo los proveedores que usa.
+    ``modo_durabilidad`` se aplica al sistema de archivos de todas las escrituras.
+    """
+
+    return ContenedorCli(modo_durabilidad)
@@ -30,10 +30,14 @@ class ContenedorGui:
     metadata_blueprints: dict[str, DtoBlueprintMetadata]
 
 
-def construir_contenedor_gui() -> ContenedorGui:
-    """Construye un contenedor mínimo para ejecución en wizard gráfico."""
+def construir_contenedor_gui(emitir_traza: bool = False) -> ContenedorGui:
+    """Construye un contenedor mínimo para ejecución en wizard gráfico.
 
-    puertos = _construir_puertos_infraestructura()
+    Con ``emitir_traza`` cada generación escribe ``<proyecto>.traza.json``.
+    """
+
+    # El wizard genera una vez y el usuario espera conservar el resultado: se prioriza durabilidad.
+    puertos = _construir_puertos_infraestructura(modo_durabilidad="duradera")
     repositorios = _construir_repositorios_infraestructura()
     adaptadores = _construir_adaptadores_aplicacion(puertos=puertos, repositorios=repositorios)
 
@@ -44,6 +48,8 @@ def construir_contenedor_gui() -> ContenedorGui:
             sistema_archivos=puertos.sistema_archivos,
             generador_manifest=GeneradorManifest(),
             auditor=AuditarProyectoGenerado(),
+            emitir_traza=emitir_traza,
+            preparacion_aislada=True,
         ),
         guardar_preset_proyecto=adaptadores.guardar_preset_proyecto,
         cargar_preset_proyecto=adaptadores.cargar_preset_proyecto,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import hashlib
+from pathlib import Path
 
 from aplicacion.puertos.calculadora_hash import CalculadoraHash
 
@@ -11,8 +12,9 @@ class CalculadoraHashReal(CalculadoraHash):
     """Calcula hashes SHA256 leyendo bytes del sistema de archivos."""
 
     def calcular_sha256(self, ruta_absoluta: str) -> str:
-        digestor = hashlib.sha256()
         with open(ruta_absoluta, "rb") as archivo:
-            for bloque in iter(lambda: archivo.read(8192), b""):
-                digestor.update(bloque)
-        return digestor.hexdigest()
+            return hashlib.file_digest(archivo, "sha256").hexdigest()
+
+    def calcular_hash_archivo(self, ruta: Path) -> str:
+        """Implementa ``CalculadoraHashPuerto`` para la auditoría de manifest."""
+        return self.calcular_sha256(str(ruta))
@@ -2,15 +2,37 @@
 
 from __future__ import annotations
 
-from logging.handlers import RotatingFileHandler
+import atexit
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import logging
+import multiprocessing
+from multiprocessing.queues import Queue as ColaProcesos
 from pathlib import Path
+import queue
 import re
 import sys
 
+# Bucles calientes que en ejecución normal solo dejan su línea de resumen.
+NIVELES_RESUMEN: dict[str, int | str] = {
+    "aplicacion.casos_uso.ejecutar_plan": logging.INFO,
+    "aplicacion.casos_uso.generar_manifest": logging.INFO,
+    "aplicacion.casos_uso.actualizar_manifest_patch": logging.INFO,
+}
+
+_TIPOS_SIN_SECRETOS = (int, float, bool, type(None))
+
+_listener_activo: QueueListener | None = None
+
 
 class FiltroSecretos(logging.Filter):
-    """Oculta valores sensibles en mensajes y argumentos de log."""
+    """Oculta valores sensibles en mensajes y argumentos de log.
+
+    La expresión regular solo se aplica cuando el texto contiene alguna
+    palabra sensible; los argumentos numéricos y los que no cambian se
+    conservan tal cual, así que los formatos ``%d``/``%f`` siguen siendo válidos.
+    """
 
     PALABRAS_SENSIBLES = ("password", "secret", "token", "api_key", "clave")
 
@@ -22,16 +44,62 @@ class FiltroSecretos(logging.Filter):
     def _sanitizar(self, texto: str) -> str:
         return self._patron.sub(lambda m: f"{m.group('k')}=***", texto)
 
+    def _contiene_palabra_sensible(self, texto: str) -> bool:
+        minusculas = texto.lower()
+        return any(palabra in minusculas for palabra in self.PALABRAS_SENSIBLES)
+
+    def _sanitizar_valor(self, valor: object) -> object:
+        if isinstance(valor, _TIPOS_SIN_SECRETOS):
+            return valor
+        texto = valor if isinstance(valor, str) else str(valor)
+        return self._sanitizar(texto) if self._contiene_palabra_sensible(texto) else valor
+
     def filter(self, record: logging.LogRecord) -> bool:
-        record.msg = self._sanitizar(str(record.msg))
-        if record.args:
+        record.msg = self._sanitizar_valor(record.msg)
+        if not record.args:
+            return True
+        if isinstance(record.args, Mapping):
+            record.args = {clave: self._sanitizar_valor(valor) for clave, valor in record.args.items()}
+        else:
             args = record.args if isinstance(record.args, tuple) else (record.args,)
-            record.args = tuple(self._sanitizar(str(arg)) for arg in args)
+            record.args = tuple(self._sanitizar_valor(arg) for arg in args)
         return True
 
 
-def configurar_logging(ruta_logs: str) -> None:
-    """Configura logging para seguimiento y errores críticos con rotación."""
+def _crear_handler_rotativo(
+    ruta: Path, nivel: int, copias: int, formato: logging.Formatter, filtro: logging.Filter
+) -> RotatingFileHandler:
+    handler = RotatingFileHandler(ruta, maxBytes=1_000_000, backupCount=copias, encoding="utf-8")
+    handler.setLevel(nivel)
+    handler.setFormatter(formato)
+    handler.addFilter(filtro)
+    return handler
+
+
+def detener_logging() -> None:
+    """Vacía la cola del logging asíncrono y cierra sus archivos, si está activo."""
+    global _listener_activo
+    if _listener_activo is None:
+        return
+    listener, _listener_activo = _listener_activo, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def configurar_logging(
+    ruta_logs: str,
+    *,
+    asincrono: bool = False,
+    niveles: Mapping[str, int | str] | None = None,
+) -> None:
+    """Configura logging para seguimiento y errores críticos con rotación.
+
+    Con ``asincrono`` el logger raíz solo encola los registros y un hilo
+    ``QueueListener`` escribe, sanitiza y rota los archivos; la cola se vacía
+    al salir del proceso o con ``detener_logging``. ``niveles`` fija el nivel
+    de loggers concretos (p. ej. ``NIVELES_RESUMEN``) sin tocar el raíz.
+    """
     directorio_logs = Path(ruta_logs)
     directorio_logs.mkdir(parents=True, exist_ok=True)
 
@@ -43,29 +111,20 @@ def configurar_logging(ruta_logs: str) -> None:
     logger_raiz = logging.getLogger()
     logger_raiz.setLevel(logging.DEBUG)
     logger_raiz.handlers.clear()
+    detener_logging()
 
-    seguimiento_handler = RotatingFileHandler(
-        directorio_logs / "seguimiento.log",
-        maxBytes=1_000_000,
-        backupCount=3,
-        encoding="utf-8",
-    )
-    seguimiento_handler.setLevel(logging.DEBUG)
-    seguimiento_handler.setFormatter(formato)
-    seguimiento_handler.addFilter(filtro_secretos)
-
-    crashes_handler = RotatingFileHandler(
-        directorio_logs / "crashes.log",
-        maxBytes=1_000_000,
-        backupCount=5,
-        encoding="utf-8",
+    handlers = (
+        _crear_handler_rotativo(directorio_logs / "seguimiento.log", logging.DEBUG, 3, formato, filtro_secretos),
+        _crear_handler_rotativo(directorio_logs / "crashes.log", logging.ERROR, 5, formato, filtro_secretos),
     )
-    crashes_handler.setLevel(logging.ERROR)
-    crashes_handler.setFormatter(formato)
-    crashes_handler.addFilter(filtro_secretos)
+    if asincrono:
+        _activar_cola(logger_raiz, handlers)
+    else:
+        for handler in handlers:
+            logger_raiz.addHandler(handler)
 
-    logger_raiz.addHandler(seguimiento_handler)
-    logger_raiz.addHandler(crashes_handler)
+    for nombre_logger, nivel in (niveles or {}).items():
+        logging.getLogger(nombre_logger).setLevel(nivel)
 
     def capturar_excepcion_global(
         exctype: type[BaseException], value: BaseException, traceback
@@ -79,3 +138,56 @@ def configurar_logging(ruta_logs: str) -> None:
         )
 
     sys.excepthook = capturar_excepcion_global
+
+
+def _activar_cola(logger_raiz: logging.Logger, handlers: tuple[logging.Handler, ...]) -> None:
+    global _listener_activo
+    cola: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(cola, *handlers, respect_handler_level=True)
+    listener.start()
+    _listener_activo = listener
+    logger_raiz.addHandler(QueueHandler(cola))
+
+
+class _ReenvioAlLogger(logging.Handler):
+    """Entrega cada registro recibido de un proceso hijo al logger homónimo de este proceso."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+@contextmanager
+def reenviar_logs_de_procesos() -> Iterator[ColaProcesos]:
+    """Cola para que los procesos hijos registren a través de este proceso.
+
+    Los workers no pueden usar los handlers del padre: tras un ``fork`` heredan
+    el ``QueueHandler`` del modo asíncrono sin su ``QueueListener`` y, con
+    ``spawn``, no tienen ninguno. Un listener local reenvía lo que llega por la
+    cola a los handlers ya configurados aquí, que sanitizan y rotan como
+    siempre. Al salir se procesan los registros pendientes.
+    """
+    cola: ColaProcesos = multiprocessing.get_context().Queue()
+    listener = QueueListener(cola, _ReenvioAlLogger())
+    listener.start()
+    try:
+        yield cola
+    finally:
+        listener.stop()
+        cola.close()
+        cola.join_thread()
+
+
+def configurar_logging_proceso(cola: ColaProcesos, niveles: Mapping[str, int | str] | None = None) -> None:
+    """Inicializador de workers: todos sus registros van a ``cola`` (ver ``reenviar_logs_de_procesos``)."""
+    global _listener_activo
+    # El listener heredado por ``fork`` pertenece al padre; su hilo no existe en este proceso.
+    _listener_activo = None
+    logger_raiz = logging.getLogger()
+    logger_raiz.handlers.clear()
+    logger_raiz.setLevel(logging.DEBUG)
+    logger_raiz.addHandler(QueueHandler(cola))
+    for nombre_logger, nivel in (niveles or {}).items():
+        logging.getLogger(nombre_logger).setLevel(nivel)
+
+
+atexit.register(detener_logging)
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 from dataclasses import asdict
 import json
+import logging
 from pathlib import Path
 import tempfile
+from typing import Any
 
-from aplicacion.puertos.manifest import EscritorManifest, LectorManifest
+from aplicacion.puertos.manifest import CacheEstadoManifest, EscritorManifest, EstadoArchivoManifest, LectorManifest
 from dominio.manifest import EntradaManifest, ManifestProyecto
 
+LOGGER = logging.getLogger(__name__)
+
 
 class LectorManifestEnDisco(LectorManifest):
     """Lee manifest.json desde un proyecto generado."""
@@ -44,16 +48,52 @@ class EscritorManifestSeguro(EscritorManifest):
             "opciones": manifest.opciones,
         }
 
-        descriptor, ruta_temporal = tempfile.mkstemp(
-            dir=str(ruta_proyecto_path),
-            prefix=".manifest.",
-            suffix=".tmp",
-        )
-        ruta_temporal_path = Path(ruta_temporal)
+        _escribir_json_atomico(ruta_proyecto_path, ruta_manifest, payload, indent=2)
+
+
+class CacheEstadoManifestEnDisco(CacheEstadoManifest):
+    """Guarda el caché de ``stat`` en ``.manifest.stat.json``, junto a manifest.json.
+
+    Un sidecar ausente, corrupto o de otra versión equivale a un caché vacío:
+    la verificación vuelve a hashear todo y lo regenera.
+    """
+
+    NOMBRE_ARCHIVO = ".manifest.stat.json"
+    VERSION_FORMATO = 1
+
+    def cargar(self, ruta_proyecto: str) -> dict[str, EstadoArchivoManifest]:
+        ruta_cache = Path(ruta_proyecto) / self.NOMBRE_ARCHIVO
         try:
-            with open(descriptor, "w", encoding="utf-8", closefd=True) as archivo_temp:
-                json.dump(payload, archivo_temp, ensure_ascii=False, indent=2)
-            ruta_temporal_path.replace(ruta_manifest)
-        finally:
-            if ruta_temporal_path.exists():
-                ruta_temporal_path.unlink()
+            payload = json.loads(ruta_cache.read_text(encoding="utf-8"))
+            if payload.get("version") != self.VERSION_FORMATO:
+                return {}
+            return {ruta: EstadoArchivoManifest(**estado) for ruta, estado in payload["archivos"].items()}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return {}
+
+    def guardar(self, ruta_proyecto: str, estados: dict[str, EstadoArchivoManifest]) -> None:
+        ruta_proyecto_path = Path(ruta_proyecto)
+        payload = {
+            "version": self.VERSION_FORMATO,
+            "archivos": {ruta: asdict(estado) for ruta, estado in sorted(estados.items())},
+        }
+        try:
+            _escribir_json_atomico(ruta_proyecto_path, ruta_proyecto_path / self.NOMBRE_ARCHIVO, payload)
+        except OSError as exc:
+            LOGGER.warning("No se pudo guardar el caché de estado del manifest en %s: %s", ruta_proyecto, exc)
+
+
+def _escribir_json_atomico(directorio: Path, destino: Path, payload: Any, indent: int | None = None) -> None:
+    descriptor, ruta_temporal = tempfile.mkstemp(
+        dir=str(directorio),
+        prefix=".manifest.",
+        suffix=".tmp",
+    )
+    ruta_temporal_path = Path(ruta_temporal)
+    try:
+        with open(descriptor, "w", encoding="utf-8", closefd=True) as archivo_temp:
+            json.dump(payload, archivo_temp, ensure_ascii=False, indent=indent)
+        ruta_temporal_path.replace(destino)
+    finally:
+        if ruta_temporal_path.exists():
+            ruta_temporal_path.unlink()
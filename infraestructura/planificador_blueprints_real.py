@@ -12,5 +12,4 @@ class PlanificadorBlueprintsReal(PlanificadorBlueprintPuerto):
         self._crear_plan = crear_plan_desde_blueprints
 
     def obtener_rutas_generadas(self, blueprint_id: str, especificacion: EspecificacionProyecto) -> set[str]:
-        plan = self._crear_plan.ejecutar(especificacion, [blueprint_id])
-        return set(plan.obtener_rutas())
+        return set(self._crear_plan.obtener_rutas(especificacion, blueprint_id))
@@ -0,0 +1,199 @@
+"""Cachés de metadata y templates de plugins indexadas por huella de disco."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+import json
+import logging
+from pathlib import Path
+import tempfile
+import time
+from typing import Any
+
+from dominio.plan_generacion import ArchivoGenerado
+from infraestructura.plugins.metadata_plugin import MetadataPlugin
+
+LOGGER = logging.getLogger(__name__)
+
+CAMPOS_REQUERIDOS = ["nombre", "version", "descripcion", "compatible_con", "capas", "requiere"]
+VERSION_FORMATO_CACHE = 1
+TTL_HUELLA_TEMPLATES_SEGUNDOS = 2.0
+
+HuellaArchivo = tuple[int, int]
+SnapshotTemplates = tuple[ArchivoGenerado, ...]
+
+
+class CatalogoPlugins:
+    """Cachea la metadata de cada plugin por ruta y huella ``(mtime_ns, tamaño)`` de su blueprint.json.
+
+    Con ``ruta_cache`` el catálogo se persiste en disco para reutilizarlo
+    entre procesos; sin ella vive solo en memoria.
+    """
+
+    def __init__(self, ruta_cache: Path | None = None) -> None:
+        self._ruta_cache = ruta_cache
+        self._entradas: dict[str, tuple[HuellaArchivo, MetadataPlugin | None]] | None = None
+        self._modificado = False
+
+    def obtener(self, ruta_plugin: Path) -> MetadataPlugin | None:
+        """Retorna la metadata del plugin, releyendo blueprint.json solo si cambió su huella."""
+        archivo_blueprint = ruta_plugin / "blueprint.json"
+        if not archivo_blueprint.exists():
+            LOGGER.warning("Plugin ignorado sin blueprint.json: %s", ruta_plugin)
+            return None
+
+        estado = archivo_blueprint.stat()
+        huella = (estado.st_mtime_ns, estado.st_size)
+        entradas = self._obtener_entradas()
+        clave = str(ruta_plugin)
+        if clave in entradas and entradas[clave][0] == huella:
+            return entradas[clave][1]
+
+        metadata = _cargar_metadata(ruta_plugin, archivo_blueprint)
+        entradas[clave] = (huella, metadata)
+        self._modificado = True
+        return metadata
+
+    def guardar(self) -> None:
+        """Persiste el catálogo si hay ruta de caché y cambios pendientes.
+
+        Es una optimización: si el disco falla se registra y el catálogo sigue en memoria.
+        """
+        if self._ruta_cache is None or not self._modificado or self._entradas is None:
+            return
+        payload = {
+            "version": VERSION_FORMATO_CACHE,
+            "entradas": {
+                clave: {
+                    "mtime_ns": huella[0],
+                    "tamano": huella[1],
+                    "metadata": None if metadata is None else _serializar_metadata(metadata),
+                }
+                for clave, (huella, metadata) in self._entradas.items()
+            },
+        }
+        try:
+            _escribir_json_atomico(self._ruta_cache, payload)
+        except OSError as exc:
+            LOGGER.warning("No se pudo guardar la caché de plugins en %s: %s", self._ruta_cache, exc)
+            return
+        self._modificado = False
+
+    def _obtener_entradas(self) -> dict[str, tuple[HuellaArchivo, MetadataPlugin | None]]:
+        if self._entradas is None:
+            self._entradas = self._leer_cache_disco()
+        return self._entradas
+
+    def _leer_cache_disco(self) -> dict[str, tuple[HuellaArchivo, MetadataPlugin | None]]:
+        if self._ruta_cache is None or not self._ruta_cache.exists():
+            return {}
+        try:
+            payload = json.loads(self._ruta_cache.read_text(encoding="utf-8"))
+            if payload.get("version") != VERSION_FORMATO_CACHE:
+                return {}
+            return {
+                clave: (
+                    (int(entrada["mtime_ns"]), int(entrada["tamano"])),
+                    _deserializar_metadata(entrada["metadata"]),
+                )
+                for clave, entrada in payload["entradas"].items()
+            }
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError, AttributeError) as exc:
+            LOGGER.warning("Caché de plugins ignorada en %s: %s", self._ruta_cache, exc)
+            return {}
+
+
+class CacheTemplatesPlugin:
+    """Mantiene snapshots inmutables de ``templates/`` reutilizables entre generaciones.
+
+    La huella del árbol se calcula solo con ``stat`` y como mucho una vez cada
+    ``ttl_segundos`` (o tras ``invalidar``); los contenidos se releen
+    únicamente cuando algún archivo cambia, aparece o desaparece.
+    """
+
+    def __init__(self, ttl_segundos: float = TTL_HUELLA_TEMPLATES_SEGUNDOS) -> None:
+        self._ttl_segundos = ttl_segundos
+        self._snapshots: dict[Path, tuple[tuple[tuple[str, int, int], ...], SnapshotTemplates]] = {}
+        self._vigente_hasta: dict[Path, float] = {}
+
+    def invalidar(self) -> None:
+        """Fuerza a recalcular la huella de todos los árboles en la próxima consulta."""
+        self._vigente_hasta.clear()
+
+    def obtener(self, ruta_templates: Path) -> SnapshotTemplates:
+        ahora = time.monotonic()
+        cacheado = self._snapshots.get(ruta_templates)
+        if cacheado is not None and ahora < self._vigente_hasta.get(ruta_templates, 0.0):
+            return cacheado[1]
+        self._vigente_hasta[ruta_templates] = ahora + self._ttl_segundos
+
+        archivos = sorted(
+            (archivo.relative_to(ruta_templates).as_posix(), archivo)
+            for archivo in ruta_templates.rglob("*")
+            if archivo.is_file()
+        )
+        huella: list[tuple[str, int, int]] = []
+        for ruta_relativa, archivo in archivos:
+            estado = archivo.stat()
+            huella.append((ruta_relativa, estado.st_mtime_ns, estado.st_size))
+        if cacheado is not None and cacheado[0] == tuple(huella):
+            return cacheado[1]
+
+        snapshot = tuple(
+            ArchivoGenerado(ruta_relativa=ruta_relativa, contenido_texto=archivo.read_text(encoding="utf-8"))
+            for ruta_relativa, archivo in archivos
+        )
+        self._snapshots[ruta_templates] = (tuple(huella), snapshot)
+        return snapshot
+
+
+def _cargar_metadata(ruta_plugin: Path, archivo_blueprint: Path) -> MetadataPlugin | None:
+    try:
+        payload = json.loads(archivo_blueprint.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError) as exc:
+        LOGGER.warning("Plugin inválido en %s: %s", ruta_plugin, exc)
+        return None
+
+    faltantes = [clave for clave in CAMPOS_REQUERIDOS if clave not in payload]
+    if faltantes:
+        LOGGER.warning("Plugin inválido '%s': faltan campos %s", ruta_plugin.name, faltantes)
+        return None
+
+    try:
+        return MetadataPlugin(
+            nombre=str(payload["nombre"]),
+            version=str(payload["version"]),
+            descripcion=str(payload["descripcion"]),
+            compatible_con=[str(item) for item in payload["compatible_con"]],
+            capas=[str(item) for item in payload["capas"]],
+            requiere=[str(item) for item in payload["requiere"]],
+            ruta_plugin=ruta_plugin,
+        )
+    except TypeError as exc:
+        LOGGER.warning("Plugin inválido '%s': %s", ruta_plugin.name, exc)
+        return None
+
+
+def _escribir_json_atomico(ruta: Path, payload: dict[str, Any]) -> None:
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, ruta_temporal = tempfile.mkstemp(dir=str(ruta.parent), prefix=f".{ruta.name}.", suffix=".tmp")
+    ruta_temporal_path = Path(ruta_temporal)
+    try:
+        with open(descriptor, "w", encoding="utf-8", closefd=True) as archivo_temp:
+            json.dump(payload, archivo_temp, ensure_ascii=False)
+        ruta_temporal_path.replace(ruta)
+    finally:
+        if ruta_temporal_path.exists():
+            ruta_temporal_path.unlink()
+
+
+def _serializar_metadata(metadata: MetadataPlugin) -> dict[str, Any]:
+    datos = asdict(metadata)
+    datos["ruta_plugin"] = str(metadata.ruta_plugin)
+    return datos
+
+
+def _deserializar_metadata(datos: dict[str, Any] | None) -> MetadataPlugin | None:
+    if datos is None:
+        return None
+    return MetadataPlugin(**{**datos, "ruta_plugin": Path(datos["ruta_plugin"])})
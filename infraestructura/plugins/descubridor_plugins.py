@@ -2,36 +2,26 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-import json
 import logging
 from pathlib import Path
 
 from aplicacion.puertos.blueprint import Blueprint
 from dominio.especificacion import EspecificacionProyecto
-from dominio.plan_generacion import ArchivoGenerado, PlanGeneracion
+from dominio.plan_generacion import PlanGeneracion
+from infraestructura.plugins.catalogo_plugins import CacheTemplatesPlugin, CatalogoPlugins
+from infraestructura.plugins.metadata_plugin import MetadataPlugin
 
 LOGGER = logging.getLogger(__name__)
 
-
-@dataclass(frozen=True)
-class MetadataPlugin:
-    """Metadata normalizada de un plugin externo."""
-
-    nombre: str
-    version: str
-    descripcion: str
-    compatible_con: list[str]
-    capas: list[str]
-    requiere: list[str]
-    ruta_plugin: Path
+RUTA_CACHE_CATALOGO_POR_DEFECTO = "configuracion/cache/catalogo_plugins.json"
 
 
 class BlueprintPluginExterno(Blueprint):
     """Blueprint dinámico generado desde estructura de plugin en disco."""
 
-    def __init__(self, metadata: MetadataPlugin) -> None:
+    def __init__(self, metadata: MetadataPlugin, cache_templates: CacheTemplatesPlugin | None = None) -> None:
         self._metadata = metadata
+        self._cache_templates = cache_templates or CacheTemplatesPlugin()
 
     @property
     def metadata(self) -> MetadataPlugin:
@@ -48,33 +38,54 @@ class BlueprintPluginExterno(Blueprint):
 
     def generar_plan(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
         self.validar(especificacion)
+        snapshot = self._cache_templates.obtener(self._ruta_templates())
+        if not snapshot:
+            raise ValueError(f"El plugin '{self._metadata.nombre}' no contiene templates requeridos.")
+
+        plan = PlanGeneracion(archivos=list(snapshot))
+        plan.validar_sin_conflictos()
+        return plan
+
+    def obtener_rutas(self, especificacion: EspecificacionProyecto) -> list[str]:
+        """Lista los templates del plugin sin leer su contenido."""
+        self.validar(especificacion)
+        ruta_templates = self._ruta_templates()
+        rutas = sorted(
+            archivo.relative_to(ruta_templates).as_posix() for archivo in ruta_templates.rglob("*") if archivo.is_file()
+        )
+        if not rutas:
+            raise ValueError(f"El plugin '{self._metadata.nombre}' no contiene templates requeridos.")
+        return rutas
+
+    def _ruta_templates(self) -> Path:
         ruta_templates = self._metadata.ruta_plugin / "templates"
         if not ruta_templates.exists() or not ruta_templates.is_dir():
             raise ValueError(
                 f"El plugin '{self._metadata.nombre}' no contiene carpeta templates/."
             )
-
-        archivos: list[ArchivoGenerado] = []
-        for archivo in ruta_templates.rglob("*"):
-            if not archivo.is_file():
-                continue
-            ruta_relativa = archivo.relative_to(ruta_templates).as_posix()
-            contenido = archivo.read_text(encoding="utf-8")
-            archivos.append(ArchivoGenerado(ruta_relativa=ruta_relativa, contenido_texto=contenido))
-
-        if not archivos:
-            raise ValueError(f"El plugin '{self._metadata.nombre}' no contiene templates requeridos.")
-
-        plan = PlanGeneracion(archivos=archivos)
-        plan.validar_sin_conflictos()
-        return plan
+        return ruta_templates
 
 
 class DescubridorPlugins:
-    """Gestiona descubrimiento y carga segura de plugins externos."""
+    """Gestiona descubrimiento y carga segura de plugins externos.
+
+    La metadata se cachea por huella de blueprint.json (opcionalmente en
+    ``ruta_cache_catalogo``) y los templates se comparten como snapshot
+    inmutable entre todos los blueprints cargados por esta instancia.
+    ``cargar_plugin`` resuelve por nombre contra el último listado y solo
+    revalida el blueprint.json del plugin pedido; si no lo encuentra, relista.
+    """
 
-    def __init__(self, ruta_plugins: str = "plugins") -> None:
+    def __init__(self, ruta_plugins: str = "plugins", ruta_cache_catalogo: str | None = None) -> None:
         self._ruta_plugins = Path(ruta_plugins)
+        self._catalogo = CatalogoPlugins(Path(ruta_cache_catalogo) if ruta_cache_catalogo else None)
+        self._cache_templates = CacheTemplatesPlugin()
+        self._plugins_por_nombre: dict[str, MetadataPlugin] | None = None
+
+    def invalidar(self) -> None:
+        """Descarta el índice por nombre y obliga a recalcular la huella de los templates."""
+        self._plugins_por_nombre = None
+        self._cache_templates.invalidar()
 
     def listar_plugins(self) -> list[MetadataPlugin]:
         plugins: list[MetadataPlugin] = []
@@ -84,46 +95,30 @@ class DescubridorPlugins:
         for carpeta in self._ruta_plugins.iterdir():
             if not carpeta.is_dir() or carpeta.name.startswith("__"):
                 continue
-            metadata = self._cargar_metadata(carpeta)
+            metadata = self._catalogo.obtener(carpeta)
             if metadata is None:
                 continue
             plugins.append(metadata)
+        self._catalogo.guardar()
+        self._plugins_por_nombre = {plugin.nombre: plugin for plugin in plugins}
         return sorted(plugins, key=lambda plugin: plugin.nombre)
 
     def cargar_plugin(self, nombre: str) -> BlueprintPluginExterno:
-        for metadata in self.listar_plugins():
-            if metadata.nombre == nombre:
-                return BlueprintPluginExterno(metadata)
-        raise ValueError(f"Plugin no encontrado: {nombre}")
-
-    def _cargar_metadata(self, ruta_plugin: Path) -> MetadataPlugin | None:
-        archivo_blueprint = ruta_plugin / "blueprint.json"
-        if not archivo_blueprint.exists():
-            LOGGER.warning("Plugin ignorado sin blueprint.json: %s", ruta_plugin)
+        metadata = self._buscar_en_indice(nombre)
+        if metadata is None:
+            self.listar_plugins()
+            metadata = self._buscar_en_indice(nombre)
+        if metadata is None:
+            raise ValueError(f"Plugin no encontrado: {nombre}")
+        return BlueprintPluginExterno(metadata, self._cache_templates)
+
+    def _buscar_en_indice(self, nombre: str) -> MetadataPlugin | None:
+        if self._plugins_por_nombre is None or nombre not in self._plugins_por_nombre:
             return None
-
-        try:
-            payload = json.loads(archivo_blueprint.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError) as exc:
-            LOGGER.warning("Plugin inválido en %s: %s", ruta_plugin, exc)
+        metadata = self._catalogo.obtener(self._plugins_por_nombre[nombre].ruta_plugin)
+        if metadata is None or metadata.nombre != nombre:
             return None
+        return metadata
 
-        requeridos = ["nombre", "version", "descripcion", "compatible_con", "capas", "requiere"]
-        faltantes = [clave for clave in requeridos if clave not in payload]
-        if faltantes:
-            LOGGER.warning("Plugin inválido '%s': faltan campos %s", ruta_plugin.name, faltantes)
-            return None
 
-        try:
-            return MetadataPlugin(
-                nombre=str(payload["nombre"]),
-                version=str(payload["version"]),
-                descripcion=str(payload["descripcion"]),
-                compatible_con=[str(item) for item in payload["compatible_con"]],
-                capas=[str(item) for item in payload["capas"]],
-                requiere=[str(item) for item in payload["requiere"]],
-                ruta_plugin=ruta_plugin,
-            )
-        except TypeError as exc:
-            LOGGER.warning("Plugin inválido '%s': %s", ruta_plugin.name, exc)
-            return None
+__all__ = ["RUTA_CACHE_CATALOGO_POR_DEFECTO", "BlueprintPluginExterno", "DescubridorPlugins", "MetadataPlugin"]
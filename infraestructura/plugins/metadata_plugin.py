@@ -0,0 +1,19 @@
+"""Metadata normalizada de plugins externos de blueprints."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class MetadataPlugin:
+    """Metadata normalizada de un plugin externo."""
+
+    nombre: str
+    version: str
+    descripcion: str
+    compatible_con: list[str]
+    capas: list[str]
+    requiere: list[str]
+    ruta_plugin: Path
@@ -81,6 +81,8 @@ class RepositorioPresetsJson(AlmacenPresets):
                                 "tipo": atributo.tipo,
                                 "obligatorio": atributo.obligatorio,
                                 "valor_por_defecto": atributo.valor_por_defecto,
+                                "indexado": atributo.indexado,
+                                "unico": atributo.unico,
                             }
                             for atributo in clase.atributos
                         ],
@@ -111,6 +113,8 @@ class RepositorioPresetsJson(AlmacenPresets):
                                     tipo=atributo_payload["tipo"],
                                     obligatorio=atributo_payload["obligatorio"],
                                     valor_por_defecto=atributo_payload.get("valor_por_defecto"),
+                                    indexado=bool(atributo_payload.get("indexado", False)),
+                                    unico=bool(atributo_payload.get("unico", False)),
                                 )
                                 for atributo_payload in clase_payload.get("atributos", [])
                             ],
@@ -2,30 +2,177 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import os
 from pathlib import Path
-import tempfile
+import secrets
+from typing import Literal
 
-from aplicacion.puertos.sistema_archivos import SistemaArchivos
+from aplicacion.puertos.sistema_archivos import ContenidoArchivo, SistemaArchivos, resolver_contenido
+
+HILOS_ESCRITURA_POR_DEFECTO = 8
+
+ModoDurabilidad = Literal["rapida", "atomica", "duradera"]
+MODOS_DURABILIDAD: tuple[ModoDurabilidad, ...] = ("rapida", "atomica", "duradera")
+MODO_DURABILIDAD_POR_DEFECTO: ModoDurabilidad = "atomica"
+
+_FLAGS_ESCRITURA = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+_EscrituraArchivo = Callable[[Path, str], str]
 
 
 class SistemaArchivosReal(SistemaArchivos):
-    """Escribe archivos y crea directorios usando el sistema de archivos local."""
+    """Escribe archivos y crea directorios usando el sistema de archivos local.
+
+    ``modo_durabilidad`` fija el compromiso entre velocidad y seguridad:
+
+    - ``rapida``: escribe directamente en la ruta final, sin temporal.
+    - ``atomica``: temporal en el mismo directorio + ``os.replace``.
+    - ``duradera``: como ``atomica`` con ``fsync`` de cada archivo y un
+      ``fsync`` por directorio al terminar el lote.
+
+    Las escrituras usan ``os.open``/``os.write`` sobre bytes ya codificados
+    y el SHA256 se calcula sobre esos mismos bytes, sin relectura. Con
+    ``max_hilos_escritura`` mayor que 1 los lotes se escriben sobre un pool
+    de hilos acotado; los contenidos diferidos se renderizan dentro de la
+    tarea de cada archivo. ``escribir_lote_directo`` nunca usa temporal:
+    solo para áreas de preparación.
+    """
 
-    def escribir_texto_atomico(self, ruta_absoluta: str, contenido: str) -> None:
+    def __init__(
+        self,
+        max_hilos_escritura: int = 1,
+        modo_durabilidad: ModoDurabilidad = MODO_DURABILIDAD_POR_DEFECTO,
+    ) -> None:
+        if modo_durabilidad not in MODOS_DURABILIDAD:
+            raise ValueError(
+                f"Modo de durabilidad no soportado: {modo_durabilidad}. Opciones: {', '.join(MODOS_DURABILIDAD)}"
+            )
+        self._max_hilos_escritura = max(1, max_hilos_escritura)
+        self._modo_durabilidad = modo_durabilidad
+        self._sincronizar = modo_durabilidad == "duradera"
+
+    @property
+    def modo_durabilidad(self) -> ModoDurabilidad:
+        return self._modo_durabilidad
+
+    def escribir_texto_atomico(self, ruta_absoluta: str, contenido: str) -> str:
+        """Escribe un archivo suelto; el directorio padre se crea solo si falta."""
         ruta_destino = Path(ruta_absoluta)
-        self.asegurar_directorio(str(ruta_destino.parent))
+        escribir = self._escritura_segun_modo()
+        try:
+            hash_sha = escribir(ruta_destino, contenido)
+        except FileNotFoundError:
+            self.asegurar_directorio(str(ruta_destino.parent))
+            hash_sha = escribir(ruta_destino, contenido)
+        self._sincronizar_directorios([ruta_absoluta])
+        return hash_sha
+
+    def escribir_lote_atomico(
+        self,
+        escrituras: Sequence[tuple[str, ContenidoArchivo]],
+        al_escribir: Callable[[str], None] | None = None,
+    ) -> list[str]:
+        return self._escribir_lote(escrituras, al_escribir, self._escritura_segun_modo())
+
+    def escribir_lote_directo(
+        self,
+        escrituras: Sequence[tuple[str, ContenidoArchivo]],
+        al_escribir: Callable[[str], None] | None = None,
+    ) -> list[str]:
+        return self._escribir_lote(escrituras, al_escribir, self._escribir_directo)
 
-        descriptor, ruta_temporal = tempfile.mkstemp(
-            dir=str(ruta_destino.parent), prefix=f".{ruta_destino.name}.", suffix=".tmp"
-        )
-        ruta_temporal_path = Path(ruta_temporal)
+    def sincronizar_directorio(self, ruta_absoluta: str) -> None:
+        if not self._sincronizar or os.name == "nt":
+            return
+        descriptor = os.open(ruta_absoluta, os.O_RDONLY)
         try:
-            with open(descriptor, "w", encoding="utf-8", closefd=True) as archivo_temp:
-                archivo_temp.write(contenido)
-            ruta_temporal_path.replace(ruta_destino)
+            os.fsync(descriptor)
         finally:
-            if ruta_temporal_path.exists():
-                ruta_temporal_path.unlink()
+            os.close(descriptor)
 
     def asegurar_directorio(self, ruta_absoluta: str) -> None:
         Path(ruta_absoluta).mkdir(parents=True, exist_ok=True)
+
+    def _escritura_segun_modo(self) -> _EscrituraArchivo:
+        return self._escribir_directo if self._modo_durabilidad == "rapida" else self._escribir_con_temporal
+
+    def _escribir_lote(
+        self,
+        escrituras: Sequence[tuple[str, ContenidoArchivo]],
+        al_escribir: Callable[[str], None] | None,
+        escribir: _EscrituraArchivo,
+    ) -> list[str]:
+        hilos = min(self._max_hilos_escritura, len(escrituras))
+        if hilos <= 1:
+            hashes = [
+                self._escribir_y_notificar(ruta_absoluta, contenido, al_escribir, escribir)
+                for ruta_absoluta, contenido in escrituras
+            ]
+        else:
+            hashes = self._escribir_lote_en_pool(escrituras, al_escribir, escribir, hilos)
+        self._sincronizar_directorios(ruta for ruta, _ in escrituras)
+        return hashes
+
+    def _escribir_lote_en_pool(
+        self,
+        escrituras: Sequence[tuple[str, ContenidoArchivo]],
+        al_escribir: Callable[[str], None] | None,
+        escribir: _EscrituraArchivo,
+        hilos: int,
+    ) -> list[str]:
+        with ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="escritura") as pool:
+            futuros = [
+                pool.submit(self._escribir_y_notificar, ruta_absoluta, contenido, al_escribir, escribir)
+                for ruta_absoluta, contenido in escrituras
+            ]
+            try:
+                return [futuro.result() for futuro in futuros]
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _escribir_y_notificar(
+        ruta_absoluta: str,
+        contenido: ContenidoArchivo,
+        al_escribir: Callable[[str], None] | None,
+        escribir: _EscrituraArchivo,
+    ) -> str:
+        hash_sha = escribir(Path(ruta_absoluta), resolver_contenido(contenido))
+        if al_escribir is not None:
+            al_escribir(ruta_absoluta)
+        return hash_sha
+
+    def _escribir_directo(self, ruta_destino: Path, contenido: str) -> str:
+        datos = contenido.encode("utf-8")
+        self._volcar(os.open(ruta_destino, _FLAGS_ESCRITURA | os.O_TRUNC, 0o666), datos)
+        return hashlib.sha256(datos).hexdigest()
+
+    def _escribir_con_temporal(self, ruta_destino: Path, contenido: str) -> str:
+        datos = contenido.encode("utf-8")
+        ruta_temporal = ruta_destino.with_name(f".{ruta_destino.name}.{secrets.token_hex(4)}.tmp")
+        descriptor = os.open(ruta_temporal, _FLAGS_ESCRITURA | os.O_EXCL, 0o666)
+        try:
+            self._volcar(descriptor, datos)
+            os.replace(ruta_temporal, ruta_destino)
+        except BaseException:
+            ruta_temporal.unlink(missing_ok=True)
+            raise
+        return hashlib.sha256(datos).hexdigest()
+
+    def _volcar(self, descriptor: int, datos: bytes) -> None:
+        """Escribe todos los bytes (``os.write`` puede ser parcial) y cierra el descriptor."""
+        try:
+            vista = memoryview(datos)
+            while vista:
+                vista = vista[os.write(descriptor, vista):]
+            if self._sincronizar:
+                os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    def _sincronizar_directorios(self, rutas_archivos: Iterable[str]) -> None:
+        """Un ``fsync`` por directorio padre para que las entradas nuevas sobrevivan a un corte."""
+        for directorio in dict.fromkeys(os.path.dirname(ruta) for ruta in rutas_archivos):
+            self.sincronizar_directorio(directorio or ".")
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import argparse
 import logging
 import sys
 
 from PySide6.QtWidgets import QApplication
 
-from infraestructura.bootstrap import configurar_logging
+from infraestructura.bootstrap import NIVELES_RESUMEN, configurar_logging
 from infraestructura.bootstrap.bootstrap_gui import construir_contenedor_gui
 from presentacion.wizard.wizard_generador import WizardGeneradorProyectos
 
@@ -19,12 +20,21 @@ def _capturar_excepciones_qt(exctype: type[BaseException], value: BaseException,
     sys.__excepthook__(exctype, value, tb)
 
 
+def _parsear_opciones(argv: list[str]) -> argparse.Namespace:
+    """Lee las opciones propias; el resto de argumentos se deja a Qt."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--perfil", action="store_true", help="Escribe <proyecto>.traza.json en cada generación")
+    opciones, _ = parser.parse_known_args(argv)
+    return opciones
+
+
 def main() -> int:
-    configurar_logging("logs")
+    configurar_logging("logs", asincrono=True, niveles=NIVELES_RESUMEN)
     sys.excepthook = _capturar_excepciones_qt
 
     LOGGER.info("Inicializando aplicación PySide6 en modo wizard")
-    contenedor = construir_contenedor_gui()
+    opciones = _parsear_opciones(sys.argv[1:])
+    contenedor = construir_contenedor_gui(emitir_traza=opciones.perfil)
     app = QApplication(sys.argv)
     wizard = WizardGeneradorProyectos(
         generar_proyecto=contenedor.generar_proyecto_mvp,
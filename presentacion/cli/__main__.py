@@ -1,14 +1,19 @@
-"""CLI alternativa para ejecutar generación, validación de presets y auditoría."""
+"""CLI alternativa para ejecutar generación, validación de presets y auditoría.
+
+Los módulos de cada subcomando se importan dentro de su manejador y el
+contenedor resuelve sus casos de uso al primer acceso, así el arranque solo
+paga lo que el subcomando elegido necesita.
+"""
 
 from __future__ import annotations
 
 import argparse
+from functools import partial
 import logging
+
 from aplicacion.errores import ErrorAplicacion, ErrorAuditoria
-from infraestructura.bootstrap import configurar_logging
-from infraestructura.bootstrap.bootstrap_cli import construir_contenedor_cli
-from presentacion.cli.comando_auditar_finalizacion import ejecutar_comando_auditar_finalizacion
-from presentacion.cli.comandos.comando_generar import ejecutar_comando_generar
+from infraestructura.bootstrap import NIVELES_RESUMEN, configurar_logging
+from infraestructura.bootstrap.bootstrap_cli import MODOS_DURABILIDAD, construir_contenedor_cli
 
 LOGGER = logging.getLogger(__name__)
 
@@ -20,19 +25,62 @@ def construir_parser() -> argparse.ArgumentParser:
     generar = subparsers.add_parser("generar", help="Genera un proyecto desde preset")
     generar.add_argument("--preset", required=True, help="Nombre del preset (sin .json)")
     generar.add_argument("--destino", required=True, help="Ruta destino del proyecto")
-    generar.add_argument("--patch", action="store_true", help="Fuerza ejecución en modo patch")
+    modo_incremental = generar.add_mutually_exclusive_group()
+    modo_incremental.add_argument("--patch", action="store_true", help="Fuerza ejecución en modo patch")
+    modo_incremental.add_argument(
+        "--sincronizar",
+        action="store_true",
+        help="Regenera escribiendo solo archivos cuyo hash difiere del manifest o que faltan en disco",
+    )
+    generar.add_argument(
+        "--restaurar-editados",
+        action="store_true",
+        help="Con --sincronizar, reescribe también los archivos editados a mano que ya no coinciden con el manifest",
+    )
     generar.add_argument(
         "--blueprint",
         action="append",
         default=[],
         help="Blueprint a aplicar (repetible, soporta internos y plugins)",
     )
+    generar.add_argument(
+        "--perfil",
+        action="store_true",
+        help="Mide cada etapa, escribe <destino>.traza.json y muestra un resumen",
+    )
+    _agregar_argumento_durabilidad(generar)
+
+    generar_lote = subparsers.add_parser("generar-lote", help="Genera varios presets reutilizando el contenedor")
+    generar_lote.add_argument(
+        "--presets",
+        required=True,
+        help="Directorio con presets *.json o manifest JSON con la lista de presets",
+    )
+    generar_lote.add_argument("--destino-base", required=True, help="Directorio base de los proyectos generados")
+    generar_lote.add_argument(
+        "--procesos",
+        type=int,
+        default=0,
+        help="Procesos concurrentes (0 = número de CPUs)",
+    )
+    generar_lote.add_argument(
+        "--sincronizar",
+        action="store_true",
+        help="Escribe solo archivos cuyo hash difiere del manifest de cada proyecto",
+    )
+
+    _agregar_argumento_durabilidad(generar_lote)
 
     validar = subparsers.add_parser("validar-preset", help="Valida un preset")
     validar.add_argument("--preset", required=True, help="Nombre del preset (sin .json)")
 
     auditar = subparsers.add_parser("auditar", help="Audita un proyecto")
     auditar.add_argument("--proyecto", required=True, help="Ruta del proyecto generado")
+    auditar.add_argument(
+        "--verificacion-completa",
+        action="store_true",
+        help="Rehashea todos los archivos del manifest ignorando el caché de estado",
+    )
 
     auditar_finalizacion = subparsers.add_parser(
         "auditar-finalizacion", help="Ejecuta auditoría E2E desde preset hasta sandbox"
@@ -46,10 +94,34 @@ def construir_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _agregar_argumento_durabilidad(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--durabilidad",
+        choices=MODOS_DURABILIDAD,
+        default=None,
+        help="rapida: escritura directa; atomica (defecto): temporal + replace; duradera: además fsync",
+    )
+
+
+def _opciones_contenedor(args: argparse.Namespace) -> dict[str, str]:
+    durabilidad = getattr(args, "durabilidad", None)
+    return {} if durabilidad is None else {"modo_durabilidad": durabilidad}
+
+
 def _ejecutar_generar(args: argparse.Namespace, contenedor) -> int:
+    from presentacion.cli.comandos.comando_generar import ejecutar_comando_generar
+
     return ejecutar_comando_generar(args, contenedor)
 
 
+def _ejecutar_generar_lote(args: argparse.Namespace, contenedor) -> int:
+    from presentacion.cli.comandos.comando_generar_lote import ejecutar_comando_generar_lote
+
+    return ejecutar_comando_generar_lote(
+        args, contenedor, partial(construir_contenedor_cli, **_opciones_contenedor(args))
+    )
+
+
 def _ejecutar_validar_preset(args: argparse.Namespace, contenedor) -> int:
     contenedor.cargar_preset_proyecto.ejecutar(args.preset)
     LOGGER.info("Preset válido: %s", args.preset)
@@ -57,7 +129,9 @@ def _ejecutar_validar_preset(args: argparse.Namespace, contenedor) -> int:
 
 
 def _ejecutar_auditar(args: argparse.Namespace, contenedor) -> int:
-    resultado = contenedor.auditar_proyecto.ejecutar(args.proyecto)
+    resultado = contenedor.auditar_proyecto.ejecutar(
+        args.proyecto, verificacion_completa=getattr(args, "verificacion_completa", False)
+    )
     if not resultado.valido:
         raise ErrorAuditoria("Auditoría rechazada: " + "; ".join(resultado.lista_errores))
     LOGGER.info("Auditoría aprobada: %s", resultado.resumen)
@@ -65,23 +139,27 @@ def _ejecutar_auditar(args: argparse.Namespace, contenedor) -> int:
 
 
 def _ejecutar_auditar_finalizacion(args: argparse.Namespace, contenedor) -> int:
+    from presentacion.cli.comando_auditar_finalizacion import ejecutar_comando_auditar_finalizacion
+
     return ejecutar_comando_auditar_finalizacion(args, contenedor)
 
 
 def main(argv: list[str] | None = None) -> int:
-    configurar_logging("logs")
     parser = construir_parser()
     args = parser.parse_args(argv)
-    contenedor = construir_contenedor_cli()
+    configurar_logging("logs", asincrono=True, niveles=NIVELES_RESUMEN)
+    contenedor = construir_contenedor_cli(**_opciones_contenedor(args))
+    manejadores = {
+        "generar": _ejecutar_generar,
+        "generar-lote": _ejecutar_generar_lote,
+        "validar-preset": _ejecutar_validar_preset,
+        "auditar": _ejecutar_auditar,
+        "auditar-finalizacion": _ejecutar_auditar_finalizacion,
+    }
     try:
-        if args.comando == "generar":
-            return _ejecutar_generar(args, contenedor)
-        if args.comando == "validar-preset":
-            return _ejecutar_validar_preset(args, contenedor)
-        if args.comando == "auditar":
-            return _ejecutar_auditar(args, contenedor)
-        if args.comando == "auditar-finalizacion":
-            return _ejecutar_auditar_finalizacion(args, contenedor)
+        manejador = manejadores.get(args.comando)
+        if manejador is not None:
+            return manejador(args, contenedor)
         parser.error("Comando no soportado")
     except (ErrorAplicacion, FileNotFoundError, ValueError) as exc:
         LOGGER.error("Error de ejecución CLI: %s", exc)
@@ -13,6 +13,7 @@ from typing import Any
 from aplicacion.dtos.proyecto.dto_atributo import DtoAtributo
 from aplicacion.dtos.proyecto.dto_clase import DtoClase
 from aplicacion.dtos.proyecto.dto_proyecto_entrada import DtoProyectoEntrada
+from aplicacion.servicios.trazado import Trazador, activar_trazador, ruta_traza_junto_a, span
 
 LOGGER = logging.getLogger(__name__)
 
@@ -28,25 +29,33 @@ class _ContextoGenerar:
 class ResultadoGeneracion:
     ruta_destino: str
     modo_patch: bool
+    resumen_sincronizacion: str | None = None
 
 
 def ejecutar_comando_generar(args: argparse.Namespace, contenedor_cli: Any) -> int:
-    contexto = _resolver_preset(args, contenedor_cli.cargar_preset_proyecto)
-    entrada = _construir_entrada(args, contexto.entrada)
-    resultado = _ejecutar_generacion(
-        dto=entrada,
-        caso_de_uso=SimpleNamespace(
-            crear_plan_desde_blueprints=contenedor_cli.crear_plan_desde_blueprints,
-            crear_plan_patch_desde_blueprints=contenedor_cli.crear_plan_patch_desde_blueprints,
-            ejecutar_plan=contenedor_cli.ejecutar_plan,
-            actualizar_manifest_patch=contenedor_cli.actualizar_manifest_patch,
-            metadata=contexto.metadata,
-            blueprints_preset=contexto.blueprints_preset,
-            blueprints_argumento=list(args.blueprint or []),
-            forzar_patch=bool(args.patch),
-        ),
-    )
+    trazador = Trazador() if getattr(args, "perfil", False) else None
+    with activar_trazador(trazador), span("generar", preset=args.preset):
+        contexto = _resolver_preset(args, contenedor_cli.cargar_preset_proyecto)
+        entrada = _construir_entrada(args, contexto.entrada)
+        resultado = _ejecutar_generacion(
+            dto=entrada,
+            caso_de_uso=SimpleNamespace(
+                crear_plan_desde_blueprints=contenedor_cli.crear_plan_desde_blueprints,
+                crear_plan_patch_desde_blueprints=contenedor_cli.crear_plan_patch_desde_blueprints,
+                ejecutar_plan=contenedor_cli.ejecutar_plan,
+                actualizar_manifest_patch=contenedor_cli.actualizar_manifest_patch,
+                sincronizar_proyecto=getattr(contenedor_cli, "sincronizar_proyecto", None),
+                metadata=contexto.metadata,
+                blueprints_preset=contexto.blueprints_preset,
+                blueprints_argumento=list(args.blueprint or []),
+                forzar_patch=bool(args.patch),
+                sincronizar=bool(getattr(args, "sincronizar", False)),
+                restaurar_editados=bool(getattr(args, "restaurar_editados", False)),
+            ),
+        )
     _renderizar_resultado(resultado)
+    if trazador is not None:
+        _emitir_perfil(trazador, resultado.ruta_destino)
     return 0
 
 
@@ -66,6 +75,8 @@ def _resolver_preset(args: argparse.Namespace, servicio_presets: Any) -> _Contex
                         nombre=atributo.nombre,
                         tipo=atributo.tipo,
                         obligatorio=atributo.obligatorio,
+                        indexado=atributo.indexado,
+                        unico=atributo.unico,
                     )
                     for atributo in clase.atributos
                 ],
@@ -93,7 +104,19 @@ def _construir_entrada(args: argparse.Namespace, preset_dto: DtoProyectoEntrada)
 def _ejecutar_generacion(dto: DtoProyectoEntrada, caso_de_uso: Any) -> ResultadoGeneracion:
     blueprints_objetivo = caso_de_uso.blueprints_argumento or caso_de_uso.blueprints_preset
     ruta_manifest = Path(dto.ruta_destino) / "manifest.json"
-    modo_patch = caso_de_uso.forzar_patch or bool(ruta_manifest.exists())
+    if caso_de_uso.sincronizar and ruta_manifest.exists():
+        resultado = caso_de_uso.sincronizar_proyecto.ejecutar(
+            dto,
+            dto.ruta_destino,
+            blueprints=blueprints_objetivo,
+            version_generador=Path("VERSION").read_text(encoding="utf-8").strip(),
+            opciones=caso_de_uso.metadata,
+            restaurar_editados=caso_de_uso.restaurar_editados,
+        )
+        return ResultadoGeneracion(
+            ruta_destino=dto.ruta_destino, modo_patch=False, resumen_sincronizacion=resultado.resumen()
+        )
+    modo_patch = not caso_de_uso.sincronizar and (caso_de_uso.forzar_patch or bool(ruta_manifest.exists()))
 
     if modo_patch:
         plan = caso_de_uso.crear_plan_patch_desde_blueprints.ejecutar(dto, dto.ruta_destino)
@@ -116,7 +139,18 @@ def _ejecutar_generacion(dto: DtoProyectoEntrada, caso_de_uso: Any) -> Resultado
 
 
 def _renderizar_resultado(resultado: ResultadoGeneracion) -> None:
+    if resultado.resumen_sincronizacion is not None:
+        LOGGER.info("Sincronización aplicada en %s (%s)", resultado.ruta_destino, resultado.resumen_sincronizacion)
+        return
     if resultado.modo_patch:
         LOGGER.info("Patch aplicado en %s", resultado.ruta_destino)
         return
     LOGGER.info("Generación completada en %s", resultado.ruta_destino)
+
+
+def _emitir_perfil(trazador: Trazador, ruta_destino: str) -> None:
+    ruta_traza = ruta_traza_junto_a(ruta_destino)
+    ruta_traza.write_text(trazador.a_json(), encoding="utf-8")
+    LOGGER.info("Perfil de generación (traza completa en %s):", ruta_traza)
+    for linea in trazador.resumen():
+        LOGGER.info("  %s", linea)
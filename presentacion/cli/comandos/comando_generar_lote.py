@@ -0,0 +1,184 @@
+"""Comando CLI para generar varios presets en un solo proceso o pool de procesos."""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import pickle
+import sys
+from time import perf_counter
+from typing import Any, TextIO
+
+from aplicacion.errores import ErrorAplicacion
+from aplicacion.servicios.cache_renderizado import CacheRenderizado, activar_cache_renderizado
+from infraestructura.bootstrap import NIVELES_RESUMEN, configurar_logging_proceso, reenviar_logs_de_procesos
+from presentacion.cli.comandos.comando_generar import ejecutar_comando_generar
+
+LOGGER = logging.getLogger(__name__)
+
+FabricaContenedor = Callable[[], Any]
+
+_CONTENEDOR_PROCESO: Any = None
+_CACHE_PROCESO: CacheRenderizado | None = None
+
+# Errores por preset que no detienen el lote; cualquier otro es un defecto y se propaga.
+_ERRORES_PRESET = (ErrorAplicacion, OSError, ValueError)
+# Fallos del pool al entregar el resultado de una tarea (worker caído o resultado no serializable).
+_ERRORES_POOL = (BrokenProcessPool, pickle.PicklingError)
+
+
+@dataclass(frozen=True)
+class TareaLote:
+    preset: str
+    destino: str
+    sincronizar: bool = False
+
+
+@dataclass(frozen=True)
+class ResultadoProyectoLote:
+    preset: str
+    destino: str
+    exito: bool
+    duracion_segundos: float
+    error: str | None = None
+
+
+def ejecutar_comando_generar_lote(
+    args: argparse.Namespace,
+    contenedor_cli: Any,
+    fabrica_contenedor: FabricaContenedor,
+    salida: TextIO | None = None,
+) -> int:
+    """Genera cada preset del lote; un preset fallido no detiene a los demás.
+
+    Solo se aíslan los errores de aplicación, E/S y validación de cada preset
+    y la caída de un worker; un error de programación se propaga.
+
+    Con un solo proceso se reutiliza ``contenedor_cli``; con más, cada worker
+    construye su contenedor una vez mediante ``fabrica_contenedor``. Cada
+    proceso comparte entre sus presets una caché de renderizado acotada en
+    bytes que se descarta al terminar el lote. La tabla
+    de resultados por preset se escribe en ``salida`` (stdout por defecto).
+    """
+    tareas = _resolver_tareas(Path(args.presets), Path(args.destino_base), bool(args.sincronizar))
+    if not tareas:
+        raise ValueError(f"No se encontraron presets en {args.presets}")
+
+    procesos = max(1, min(args.procesos or os.cpu_count() or 1, len(tareas)))
+    inicio = perf_counter()
+    if procesos == 1:
+        with activar_cache_renderizado(CacheRenderizado()):
+            resultados = [_generar_proyecto(tarea, contenedor_cli) for tarea in tareas]
+    else:
+        resultados = _generar_en_pool(tareas, procesos, fabrica_contenedor)
+    _renderizar_resumen(resultados, perf_counter() - inicio, salida or sys.stdout)
+    return 0 if all(resultado.exito for resultado in resultados) else 1
+
+
+def _resolver_tareas(origen: Path, destino_base: Path, sincronizar: bool) -> list[TareaLote]:
+    if origen.is_dir():
+        return [
+            TareaLote(str(ruta), str(destino_base / ruta.stem), sincronizar)
+            for ruta in sorted(origen.glob("*.json"))
+        ]
+    return [
+        TareaLote(preset, destino or str(destino_base / Path(preset).stem), sincronizar)
+        for preset, destino in _leer_manifest_lote(origen)
+    ]
+
+
+def _leer_manifest_lote(origen: Path) -> list[tuple[str, str | None]]:
+    """Lee una lista JSON de presets: rutas sueltas u objetos ``{"preset", "destino"}``."""
+    try:
+        entradas = json.loads(origen.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Manifest de lote inválido '{origen}': {exc.msg}") from exc
+    if not isinstance(entradas, list):
+        raise ValueError(f"El manifest de lote '{origen}' debe ser una lista de presets.")
+
+    normalizadas = [{"preset": entrada} if isinstance(entrada, str) else entrada for entrada in entradas]
+    invalidas = [entrada for entrada in normalizadas if not isinstance(entrada, dict) or "preset" not in entrada]
+    if invalidas:
+        raise ValueError(f"Entradas de lote inválidas en '{origen}': {invalidas!r}")
+    return [(str(entrada["preset"]), entrada.get("destino")) for entrada in normalizadas]
+
+
+def _generar_en_pool(
+    tareas: list[TareaLote], procesos: int, fabrica_contenedor: FabricaContenedor
+) -> list[ResultadoProyectoLote]:
+    with reenviar_logs_de_procesos() as cola_logs, ProcessPoolExecutor(
+        max_workers=procesos,
+        initializer=_inicializar_proceso,
+        initargs=(fabrica_contenedor, cola_logs),
+    ) as pool:
+        futuros = [(tarea, pool.submit(_generar_en_proceso, tarea)) for tarea in tareas]
+        resultados: list[ResultadoProyectoLote] = []
+        for tarea, futuro in futuros:
+            try:
+                resultados.append(futuro.result())
+            except _ERRORES_POOL as exc:
+                LOGGER.error("Fallo del proceso generando preset %s: %s", tarea.preset, exc, exc_info=exc)
+                resultados.append(ResultadoProyectoLote(tarea.preset, tarea.destino, False, 0.0, _describir(exc)))
+        return resultados
+
+
+def _inicializar_proceso(fabrica_contenedor: FabricaContenedor, cola_logs: Any) -> None:
+    global _CONTENEDOR_PROCESO, _CACHE_PROCESO
+    configurar_logging_proceso(cola_logs, NIVELES_RESUMEN)
+    _CONTENEDOR_PROCESO = fabrica_contenedor()
+    _CACHE_PROCESO = CacheRenderizado()
+
+
+def _generar_en_proceso(tarea: TareaLote) -> ResultadoProyectoLote:
+    with activar_cache_renderizado(_CACHE_PROCESO):
+        return _generar_proyecto(tarea, _CONTENEDOR_PROCESO)
+
+
+def _generar_proyecto(tarea: TareaLote, contenedor_cli: Any) -> ResultadoProyectoLote:
+    inicio = perf_counter()
+    args = argparse.Namespace(
+        preset=tarea.preset,
+        destino=tarea.destino,
+        patch=False,
+        sincronizar=tarea.sincronizar,
+        blueprint=[],
+    )
+    try:
+        ejecutar_comando_generar(args, contenedor_cli)
+    except _ERRORES_PRESET as exc:
+        LOGGER.error("Fallo generando preset %s: %s", tarea.preset, exc)
+        return ResultadoProyectoLote(tarea.preset, tarea.destino, False, perf_counter() - inicio, _describir(exc))
+    return ResultadoProyectoLote(tarea.preset, tarea.destino, True, perf_counter() - inicio)
+
+
+def _describir(exc: BaseException) -> str:
+    return str(exc) if isinstance(exc, _ERRORES_PRESET) else f"{type(exc).__name__}: {exc}"
+
+
+def _renderizar_resumen(resultados: list[ResultadoProyectoLote], duracion_total: float, salida: TextIO) -> None:
+    filas = [
+        (
+            resultado.preset,
+            "OK" if resultado.exito else "ERROR",
+            f"{resultado.duracion_segundos:.2f}",
+            resultado.destino if resultado.exito else resultado.error or "",
+        )
+        for resultado in resultados
+    ]
+    encabezados = ("PRESET", "ESTADO", "SEGUNDOS", "DESTINO / ERROR")
+    anchos = [max(len(fila[columna]) for fila in [encabezados, *filas]) for columna in range(3)]
+    for fila in [encabezados, *filas]:
+        celdas = [valor.ljust(ancho) for valor, ancho in zip(fila, anchos)]
+        salida.write("  ".join([*celdas, fila[3]]).rstrip() + "\n")
+
+    fallidos = sum(1 for resultado in resultados if not resultado.exito)
+    linea_total = f"Lote completado: {len(resultados)} proyectos, {fallidos} fallidos, {duracion_total:.2f} s"
+    salida.write(linea_total + "\n")
+    LOGGER.info(linea_total)
@@ -13,3 +13,5 @@ class DtoVistaAtributo:
     tipo: str
     obligatorio: bool = False
     valor_por_defecto: str = ""
+    indexado: bool = False
+    unico: bool = False
@@ -17,6 +17,8 @@ def mapear_clase_dominio_a_dto_vista(clase_dominio: EspecificacionClase) -> DtoV
                 tipo=atributo.tipo,
                 obligatorio=atributo.obligatorio,
                 valor_por_defecto=atributo.valor_por_defecto or "",
+                indexado=atributo.indexado,
+                unico=atributo.unico,
             )
             for atributo in clase_dominio.atributos
         ],
@@ -34,6 +36,8 @@ def mapear_dto_vista_a_clase_dominio(dto: DtoVistaClase) -> EspecificacionClase:
                 tipo=atributo.tipo,
                 obligatorio=atributo.obligatorio,
                 valor_por_defecto=atributo.valor_por_defecto or None,
+                indexado=atributo.indexado,
+                unico=atributo.unico,
             )
             for atributo in dto.atributos
         ],
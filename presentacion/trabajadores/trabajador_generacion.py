@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 import logging
 from pathlib import Path
 
@@ -39,10 +40,18 @@ class TrabajadorGeneracionMvp(QRunnable):
         mensaje_ux: MensajeUxError = mapear_error_a_mensaje_ux(exc, id_incidente, self._ruta_logs)
         self.senales.error.emit(mensaje_ux)
 
+    def _notificar_escritura(self, completados: int, total: int) -> None:
+        self.senales.progreso.emit(f"Escribiendo archivos ({completados}/{total})...")
+
+    def _entrada_con_progreso(self) -> GenerarProyectoMvpEntrada:
+        if not isinstance(self._entrada, GenerarProyectoMvpEntrada):
+            return self._entrada
+        return replace(self._entrada, notificar_progreso=self._notificar_escritura)
+
     def run(self) -> None:
         try:
             self.senales.progreso.emit("Construyendo plan desde blueprints...")
-            salida = self._caso_uso.ejecutar(self._entrada)
+            salida = self._caso_uso.ejecutar(self._entrada_con_progreso())
             self.senales.progreso.emit("Proyecto generado correctamente.")
             if not salida.valido:
                 detalle = "\n".join(salida.errores) if salida.errores else "Sin detalles adicionales"
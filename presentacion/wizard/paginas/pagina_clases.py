@@ -47,8 +47,8 @@ class PaginaClases(QWizardPage):
         self._boton_anadir_clase = QPushButton("Añadir clase")
         self._boton_eliminar_clase = QPushButton("Eliminar clase")
 
-        self._tabla_atributos = QTableWidget(0, 3)
-        self._tabla_atributos.setHorizontalHeaderLabels(["Nombre", "Tipo", "Obligatorio"])
+        self._tabla_atributos = QTableWidget(0, 5)
+        self._tabla_atributos.setHorizontalHeaderLabels(["Nombre", "Tipo", "Obligatorio", "Indexado", "Único"])
         self._tabla_atributos.horizontalHeader().setStretchLastSection(True)
         self._tabla_atributos.setEditTriggers(QTableWidget.NoEditTriggers)
         self._tabla_atributos.setSelectionBehavior(QTableWidget.SelectRows)
@@ -58,6 +58,8 @@ class PaginaClases(QWizardPage):
         self._combo_tipo_atributo = QComboBox()
         self._combo_tipo_atributo.addItems(self.TIPOS_ATRIBUTO)
         self._checkbox_obligatorio = QCheckBox("Obligatorio")
+        self._checkbox_indexado = QCheckBox("Indexado")
+        self._checkbox_unico = QCheckBox("Único")
         self._boton_anadir_atributo = QPushButton("Añadir atributo")
         self._boton_eliminar_atributo = QPushButton("Eliminar atributo")
 
@@ -88,6 +90,8 @@ class PaginaClases(QWizardPage):
         fila_controles_atributo.addWidget(self._campo_nombre_atributo)
         fila_controles_atributo.addWidget(self._combo_tipo_atributo)
         fila_controles_atributo.addWidget(self._checkbox_obligatorio)
+        fila_controles_atributo.addWidget(self._checkbox_indexado)
+        fila_controles_atributo.addWidget(self._checkbox_unico)
         fila_controles_atributo.addWidget(self._boton_anadir_atributo)
         panel_derecho.addLayout(fila_controles_atributo)
         panel_derecho.addWidget(self._boton_eliminar_atributo)
@@ -109,6 +113,8 @@ class PaginaClases(QWizardPage):
             self._campo_nombre_atributo,
             self._combo_tipo_atributo,
             self._checkbox_obligatorio,
+            self._checkbox_indexado,
+            self._checkbox_unico,
             self._boton_anadir_atributo,
             self._boton_eliminar_atributo,
         ]
@@ -161,9 +167,18 @@ class PaginaClases(QWizardPage):
             nombre_atributo=self._campo_nombre_atributo.text(),
             tipo=self._combo_tipo_atributo.currentText(),
             obligatorio=self._checkbox_obligatorio.isChecked(),
+            indexado=self._checkbox_indexado.isChecked(),
+            unico=self._checkbox_unico.isChecked(),
         )
 
-    def anadir_atributo(self, nombre_atributo: str, tipo: str, obligatorio: bool) -> bool:
+    def anadir_atributo(
+        self,
+        nombre_atributo: str,
+        tipo: str,
+        obligatorio: bool,
+        indexado: bool = False,
+        unico: bool = False,
+    ) -> bool:
         clase, indice_clase = self._clase_seleccionada()
         if clase is None:
             return False
@@ -178,12 +193,14 @@ class PaginaClases(QWizardPage):
 
         atributos = [
             *clase.atributos,
-            DtoAtributo(nombre=nombre_limpio, tipo=tipo, obligatorio=obligatorio),
+            DtoAtributo(nombre=nombre_limpio, tipo=tipo, obligatorio=obligatorio, indexado=indexado, unico=unico),
         ]
         self._clases_dto[indice_clase] = DtoClase(nombre=clase.nombre, atributos=atributos)
         self._renderizar_atributos(self._clases_dto[indice_clase])
         self._campo_nombre_atributo.clear()
         self._checkbox_obligatorio.setChecked(False)
+        self._checkbox_indexado.setChecked(False)
+        self._checkbox_unico.setChecked(False)
         return True
 
     def eliminar_atributo_seleccionado(self) -> bool:
@@ -270,9 +287,10 @@ class PaginaClases(QWizardPage):
             self._tabla_atributos.insertRow(fila)
             self._tabla_atributos.setItem(fila, 0, QTableWidgetItem(atributo.nombre))
             self._tabla_atributos.setItem(fila, 1, QTableWidgetItem(atributo.tipo))
-            item_obligatorio = QTableWidgetItem("Sí" if atributo.obligatorio else "No")
-            item_obligatorio.setTextAlignment(Qt.AlignCenter)
-            self._tabla_atributos.setItem(fila, 2, item_obligatorio)
+            for columna, marcado in enumerate((atributo.obligatorio, atributo.indexado, atributo.unico), start=2):
+                item_marca = QTableWidgetItem("Sí" if marcado else "No")
+                item_marca.setTextAlignment(Qt.AlignCenter)
+                self._tabla_atributos.setItem(fila, columna, item_marca)
 
     def _calcular_estado_complete_ui(self) -> bool:
         return self._lista_clases.count() > 0
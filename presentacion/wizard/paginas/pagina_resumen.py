@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from PySide6.QtWidgets import QTextEdit, QVBoxLayout, QWizardPage
 
-from aplicacion.dtos.proyecto import DtoClase
+from aplicacion.dtos.proyecto import DtoAtributo, DtoClase
 
 
 class PaginaResumen(QWizardPage):
@@ -73,9 +73,15 @@ class PaginaResumen(QWizardPage):
                 continue
 
             for atributo in clase.atributos:
-                texto = f"  - {atributo.nombre}: {atributo.tipo}"
-                if atributo.obligatorio:
-                    texto += " (obligatorio)"
-                bloques.append(texto)
+                bloques.append(f"  - {atributo.nombre}: {atributo.tipo}{self._marcas_atributo(atributo)}")
 
         return "\n".join(bloques)
+
+    @staticmethod
+    def _marcas_atributo(atributo: DtoAtributo) -> str:
+        marcas = ["obligatorio"] if atributo.obligatorio else []
+        if atributo.unico:
+            marcas.append("único")
+        elif atributo.indexado:
+            marcas.append("indexado")
+        return "".join(f" ({marca})" for marca in marcas)
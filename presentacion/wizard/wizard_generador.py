@@ -333,6 +333,8 @@ class WizardGeneradorProyectos(QWizard):
                     nombre=atributo.nombre,
                     tipo=atributo.tipo,
                     obligatorio=atributo.obligatorio,
+                    indexado=atributo.indexado,
+                    unico=atributo.unico,
                 )
                 for atributo in getattr(clase, "atributos", [])
             ]
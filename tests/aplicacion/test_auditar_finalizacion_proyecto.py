@@ -70,7 +70,8 @@ def test_conflicto_preflight_falla_y_no_escribe_proyecto(tmp_path: Path) -> None
         DtoAuditoriaFinalizacionEntrada(
             ruta_preset=str(preset),
             ruta_salida_auditoria=str(tmp_path / "auditoria" / "manual"),
-        )
+        ),
+        ruta_evidencias=str(tmp_path / "evidencias"),
     )
 
     assert any(etapa.nombre == "Preflight conflictos de rutas" and etapa.estado == "FAIL" for etapa in salida.etapas)
@@ -92,7 +93,8 @@ def test_camino_feliz_genera_manifest_y_smoke_pass(tmp_path: Path) -> None:
         DtoAuditoriaFinalizacionEntrada(
             ruta_preset=str(preset),
             ruta_salida_auditoria=str(tmp_path / "auditoria" / "ok"),
-        )
+        ),
+        ruta_evidencias=str(tmp_path / "evidencias"),
     )
 
     assert (Path(salida.ruta_sandbox) / "Demo" / "manifest.json").exists()
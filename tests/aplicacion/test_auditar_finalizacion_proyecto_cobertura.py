@@ -56,7 +56,8 @@ def test_carga_preset_inexistente_registra_fallo_io(tmp_path: Path) -> None:
         DtoAuditoriaFinalizacionEntrada(
             ruta_preset=str(tmp_path / "missing.json"),
             ruta_salida_auditoria=str(tmp_path / "sandbox"),
-        )
+        ),
+        ruta_evidencias=str(tmp_path / "evidencias"),
     )
     etapa = next(et for et in salida.etapas if et.nombre == "Carga preset")
     assert etapa.estado == "FAIL"
@@ -71,7 +72,8 @@ def test_generacion_fallida_corta_pipeline(tmp_path: Path) -> None:
     )
     caso = AuditarFinalizacionProyecto(CrearPlanSimple(), GeneradorFalla(), AuditorDummy(), EjecutorDummy())
     salida = caso.ejecutar(
-        DtoAuditoriaFinalizacionEntrada(ruta_preset=str(preset), ruta_salida_auditoria=str(tmp_path / "sandbox"))
+        DtoAuditoriaFinalizacionEntrada(ruta_preset=str(preset), ruta_salida_auditoria=str(tmp_path / "sandbox")),
+        ruta_evidencias=str(tmp_path / "evidencias"),
     )
     assert any(et.nombre == "Generación sandbox" and et.estado == "FAIL" for et in salida.etapas)
     assert any(et.nombre == "Smoke test" and et.estado == "SKIP" for et in salida.etapas)
@@ -85,7 +87,8 @@ def test_smoke_compileall_fail_clasifica_io(tmp_path: Path) -> None:
     )
     caso = AuditarFinalizacionProyecto(CrearPlanSimple(), GeneradorConManifest(), AuditorDummy(), EjecutorCompileFail())
     salida = caso.ejecutar(
-        DtoAuditoriaFinalizacionEntrada(ruta_preset=str(preset), ruta_salida_auditoria=str(tmp_path / "sandbox"))
+        DtoAuditoriaFinalizacionEntrada(ruta_preset=str(preset), ruta_salida_auditoria=str(tmp_path / "sandbox")),
+        ruta_evidencias=str(tmp_path / "evidencias"),
     )
     etapa = next(et for et in salida.etapas if et.nombre == "Smoke test")
     assert etapa.estado == "FAIL"
@@ -92,3 +92,26 @@ def test_auditar_proyecto_limite_manifest_sin_archivos(tmp_path: Path) -> None:
     ).ejecutar(str(tmp_path))
 
     assert resultado.valido is True
+
+
+def test_auditar_proyecto_reporta_todas_las_entradas_inconsistentes(tmp_path: Path) -> None:
+    _crear_estructura_minima(tmp_path)
+    entradas = []
+    for nombre in ["a.txt", "b.txt", "c.txt"]:
+        (tmp_path / nombre).write_text(nombre, encoding="utf-8")
+        entradas.append({"ruta_relativa": nombre, "hash_sha256": hashlib.sha256(nombre.encode()).hexdigest()})
+    (tmp_path / "a.txt").write_text("modificado", encoding="utf-8")
+    (tmp_path / "c.txt").write_text("modificado", encoding="utf-8")
+    entradas.append({"ruta_relativa": "borrado.txt", "hash_sha256": "abc"})
+    (tmp_path / "manifest.json").write_text(json.dumps({"archivos": entradas}), encoding="utf-8")
+
+    resultado = AuditarProyectoGenerado(
+        ejecutor_procesos=EjecutorFalso(),
+        calculadora_hash=CalculadoraHashFalsa(),
+    ).ejecutar(str(tmp_path))
+
+    error_manifest = next(error for error in resultado.lista_errores if "manifest.json" in error)
+    assert "manifest.json referencia archivo inexistente: borrado.txt" in error_manifest
+    assert "Hash inconsistente para a.txt en manifest.json" in error_manifest
+    assert "Hash inconsistente para c.txt en manifest.json" in error_manifest
+    assert "b.txt" not in error_manifest
@@ -3,6 +3,7 @@ import pytest
 from aplicacion.casos_uso.crear_plan_desde_blueprints import CrearPlanDesdeBlueprints
 from aplicacion.puertos.blueprint import Blueprint, RepositorioBlueprints
 from aplicacion.errores import ErrorConflictoArchivos
+from aplicacion.servicios.trazado import Trazador, activar_trazador
 from dominio.modelos import ArchivoGenerado, EspecificacionProyecto, PlanGeneracion
 
 
@@ -24,6 +25,11 @@ class BlueprintDoble(Blueprint):
         return PlanGeneracion([ArchivoGenerado(ruta, "contenido") for ruta in self._rutas])
 
 
+class BlueprintDiferidoDoble(BlueprintDoble):
+    def generar_plan_diferido(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
+        return PlanGeneracion([ArchivoGenerado.diferido(ruta, lambda: "contenido") for ruta in self._rutas])
+
+
 class RepositorioDoble(RepositorioBlueprints):
     def __init__(self, blueprints: list[Blueprint]) -> None:
         self._blueprints = {b.nombre(): b for b in blueprints}
@@ -58,3 +64,22 @@ def test_crear_plan_desde_blueprints_detecta_conflictos() -> None:
 
     with pytest.raises(ErrorConflictoArchivos, match="duplicadas"):
         CrearPlanDesdeBlueprints(repo).ejecutar(especificacion, ["a", "b"])
+
+
+def test_crear_plan_diferido_suma_el_renderizado_al_blueprint_que_lo_produce() -> None:
+    repo = RepositorioDoble([
+        BlueprintDiferidoDoble("a", ["README.md", "LICENSE"]),
+        BlueprintDoble("b", ["VERSION"]),
+    ])
+    especificacion = EspecificacionProyecto("demo", "/tmp/demo")
+    trazador = Trazador()
+
+    with activar_trazador(trazador):
+        plan = CrearPlanDesdeBlueprints(repo, plan_diferido=True).ejecutar(especificacion, ["a", "b"])
+
+    assert [span.atributos["nombre"] for span in trazador.spans if span.nombre == "planificar_blueprint"] == ["a", "b"]
+    assert "renderizado_ns.a" not in trazador.contadores
+
+    assert [archivo.renderizar() for archivo in plan.archivos] == ["contenido"] * 3
+    assert trazador.contadores["renderizado_ns.a"] > 0
+    assert "renderizado_ns.b" not in trazador.contadores
@@ -1,17 +1,21 @@
+import hashlib
 from pathlib import Path
 
 from aplicacion.casos_uso.ejecutar_plan import EjecutarPlan
+from aplicacion.puertos.sistema_archivos import SistemaArchivos
 from dominio.modelos import ArchivoGenerado, PlanGeneracion
+from infraestructura.calculadora_hash_real import CalculadoraHashReal
 from infraestructura.sistema_archivos_real import SistemaArchivosReal
 
 
-class SistemaArchivosDoble:
+class SistemaArchivosDoble(SistemaArchivos):
     def __init__(self) -> None:
         self.directorios: list[str] = []
         self.escrituras: list[tuple[str, str]] = []
 
-    def escribir_texto_atomico(self, ruta_absoluta: str, contenido: str) -> None:
+    def escribir_texto_atomico(self, ruta_absoluta: str, contenido: str) -> str:
         self.escrituras.append((ruta_absoluta, contenido))
+        return hashlib.sha256(contenido.encode("utf-8")).hexdigest()
 
     def asegurar_directorio(self, ruta_absoluta: str) -> None:
         self.directorios.append(ruta_absoluta)
@@ -64,3 +68,83 @@ def test_ejecutar_plan_dispara_generacion_manifest(tmp_path: Path) -> None:
     )
 
     assert len(doble_manifest.llamadas) == 1
+
+
+def test_ejecutar_plan_crea_cada_directorio_padre_una_sola_vez(tmp_path: Path) -> None:
+    plan = PlanGeneracion(
+        archivos=[
+            ArchivoGenerado("pkg/a.py", "a"),
+            ArchivoGenerado("pkg/b.py", "b"),
+            ArchivoGenerado("pkg/sub/c.py", "c"),
+        ]
+    )
+    doble = SistemaArchivosDoble()
+
+    EjecutarPlan(doble).ejecutar(plan, str(tmp_path))
+
+    assert doble.directorios == [str(tmp_path / "pkg"), str(tmp_path / "pkg" / "sub")]
+    assert len(doble.escrituras) == 3
+
+
+def test_ejecutar_plan_concurrente_respeta_orden_y_progreso(tmp_path: Path) -> None:
+    plan = PlanGeneracion(
+        archivos=[ArchivoGenerado(f"modulo_{indice % 4}/archivo_{indice}.py", f"# {indice}\n") for indice in range(40)]
+    )
+    avances: list[tuple[int, int]] = []
+
+    archivos_creados = EjecutarPlan(SistemaArchivosReal(max_hilos_escritura=4)).ejecutar(
+        plan,
+        str(tmp_path),
+        notificar_progreso=lambda completados, total: avances.append((completados, total)),
+    )
+
+    assert archivos_creados == plan.obtener_rutas()
+    assert avances == [(indice, 40) for indice in range(1, 41)]
+    for archivo in plan.archivos:
+        assert (tmp_path / archivo.ruta_relativa).read_text(encoding="utf-8") == archivo.contenido_texto
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_ejecutar_plan_genera_manifest_con_hashes_de_escritura(tmp_path: Path) -> None:
+    plan = PlanGeneracion(archivos=[ArchivoGenerado("README.md", "contenido ñ\n")])
+    doble_manifest = GeneradorManifestDoble()
+
+    EjecutarPlan(SistemaArchivosReal(), doble_manifest).ejecutar(plan, str(tmp_path))
+
+    esperado = CalculadoraHashReal().calcular_sha256(str(tmp_path / "README.md"))
+    assert doble_manifest.llamadas[0]["hashes_sha256"] == {"README.md": esperado}
+
+
+def test_ejecutar_plan_renderiza_archivos_diferidos_al_escribir(tmp_path: Path) -> None:
+    renderizados: list[str] = []
+
+    def renderizador(indice: int) -> str:
+        renderizados.append(f"archivo_{indice}.py")
+        return f"# {indice}\n"
+
+    plan = PlanGeneracion(
+        archivos=[
+            ArchivoGenerado.diferido(f"pkg/archivo_{indice}.py", lambda indice=indice: renderizador(indice))
+            for indice in range(10)
+        ]
+    )
+    doble_manifest = GeneradorManifestDoble()
+
+    EjecutarPlan(SistemaArchivosReal(max_hilos_escritura=4), doble_manifest).ejecutar(plan, str(tmp_path))
+
+    assert sorted(renderizados) == sorted(f"archivo_{indice}.py" for indice in range(10))
+    assert (tmp_path / "pkg" / "archivo_7.py").read_text(encoding="utf-8") == "# 7\n"
+    assert len(doble_manifest.llamadas[0]["hashes_sha256"]) == 10
+
+
+def test_ejecutar_plan_con_escritura_directa_no_deja_temporales(tmp_path: Path) -> None:
+    plan = PlanGeneracion(archivos=[ArchivoGenerado(f"pkg/m{indice}.py", f"x = {indice}\n") for indice in range(5)])
+    doble_manifest = GeneradorManifestDoble()
+
+    EjecutarPlan(SistemaArchivosReal(max_hilos_escritura=2), doble_manifest).ejecutar(
+        plan, str(tmp_path), escritura_directa=True
+    )
+
+    assert sorted(ruta.name for ruta in (tmp_path / "pkg").iterdir()) == [f"m{indice}.py" for indice in range(5)]
+    esperado = CalculadoraHashReal().calcular_sha256(str(tmp_path / "pkg" / "m3.py"))
+    assert doble_manifest.llamadas[0]["hashes_sha256"]["pkg/m3.py"] == esperado
@@ -9,6 +9,8 @@ import pytest
 
 from aplicacion.casos_uso.crear_plan_desde_blueprints import CrearPlanDesdeBlueprints
 from aplicacion.casos_uso.ejecutar_plan import EjecutarPlan
+from aplicacion.casos_uso.generacion.pasos.area_preparacion import AreaPreparacionGeneracion
+from aplicacion.casos_uso.generacion.pasos.errores_pipeline import ErrorPreparacionEstructuraGeneracion
 from aplicacion.casos_uso.generacion.generar_proyecto_mvp import (
     GenerarProyectoMvp,
     GenerarProyectoMvpEntrada,
@@ -90,3 +92,97 @@ def test_rollback_elimina_carpeta_cuando_hay_fallo_interno(tmp_path: Path) -> No
         caso_uso.ejecutar(_entrada(tmp_path))
 
     assert not (tmp_path / "proyecto_seguro").exists()
+
+
+def test_preparacion_aislada_publica_proyecto_con_un_renombrado(tmp_path: Path, monkeypatch) -> None:
+    def _sin_temporales(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("El área de preparación no debe escribir con temporal por archivo")
+
+    monkeypatch.setattr(SistemaArchivosReal, "_escribir_con_temporal", _sin_temporales)
+    sistema_archivos = SistemaArchivosReal(max_hilos_escritura=4)
+    caso_uso = GenerarProyectoMvp(
+        crear_plan_desde_blueprints=CrearPlanDesdeBlueprints(RepositorioBlueprintsEnDisco("blueprints")),
+        ejecutar_plan=EjecutarPlan(sistema_archivos),
+        sistema_archivos=sistema_archivos,
+        generador_manifest=GeneradorManifest(),
+        preparacion_aislada=True,
+    )
+
+    salida = caso_uso.ejecutar(_entrada(tmp_path))
+
+    assert salida.valido is True
+    assert salida.ruta_generada == str(tmp_path / "proyecto_seguro")
+    assert [ruta.name for ruta in tmp_path.iterdir()] == ["proyecto_seguro"]
+    assert (tmp_path / "proyecto_seguro" / "configuracion" / "MANIFEST.json").exists()
+
+
+def test_preparacion_aislada_descarta_area_y_no_toca_destino(tmp_path: Path) -> None:
+    ruta_proyecto = tmp_path / "proyecto_seguro"
+    ruta_proyecto.mkdir()
+    caso_uso = GenerarProyectoMvp(
+        crear_plan_desde_blueprints=CrearPlanDesdeBlueprints(RepositorioBlueprintsEnDisco("blueprints")),
+        ejecutar_plan=EjecutarPlanFalla(),
+        sistema_archivos=SistemaArchivosReal(),
+        generador_manifest=GeneradorManifest(),
+        preparacion_aislada=True,
+    )
+
+    with pytest.raises(ErrorGeneracionProyecto):
+        caso_uso.ejecutar(_entrada(tmp_path))
+
+    assert list(tmp_path.iterdir()) == [ruta_proyecto]
+    assert not any(ruta_proyecto.iterdir())
+
+
+class SistemaArchivosSincronizado(SistemaArchivosReal):
+    def __init__(self) -> None:
+        super().__init__(modo_durabilidad="duradera")
+        self.directorios_sincronizados: list[str] = []
+
+    def sincronizar_directorio(self, ruta_absoluta: str) -> None:
+        self.directorios_sincronizados.append(ruta_absoluta)
+        super().sincronizar_directorio(ruta_absoluta)
+
+
+def test_area_preparacion_rechaza_destino_con_contenido_antes_de_generar(tmp_path: Path) -> None:
+    ruta_proyecto = tmp_path / "proyecto_seguro"
+    ruta_proyecto.mkdir()
+    (ruta_proyecto / "ajeno.txt").write_text("x", encoding="utf-8")
+
+    with pytest.raises(ErrorPreparacionEstructuraGeneracion, match="vacío"):
+        AreaPreparacionGeneracion(SistemaArchivosReal()).crear(ruta_proyecto)
+
+    assert list(tmp_path.iterdir()) == [ruta_proyecto]
+    assert (ruta_proyecto / "ajeno.txt").read_text(encoding="utf-8") == "x"
+
+
+def test_area_preparacion_publica_sobre_ruta_libre_y_sincroniza_el_padre(tmp_path: Path) -> None:
+    ruta_proyecto = tmp_path / "proyecto_seguro"
+    ruta_proyecto.mkdir()
+    sistema_archivos = SistemaArchivosSincronizado()
+    area_preparacion = AreaPreparacionGeneracion(sistema_archivos)
+
+    area = area_preparacion.crear(ruta_proyecto)
+    assert not ruta_proyecto.exists()
+    (area.ruta / "README.md").write_text("hola", encoding="utf-8")
+    area_preparacion.publicar(area)
+
+    assert [ruta.name for ruta in tmp_path.iterdir()] == ["proyecto_seguro"]
+    assert (ruta_proyecto / "README.md").read_text(encoding="utf-8") == "hola"
+    assert sistema_archivos.directorios_sincronizados == [str(tmp_path)]
+
+
+def test_area_preparacion_no_pisa_un_destino_llenado_durante_la_generacion(tmp_path: Path) -> None:
+    ruta_proyecto = tmp_path / "proyecto_seguro"
+    area_preparacion = AreaPreparacionGeneracion(SistemaArchivosReal())
+    area = area_preparacion.crear(ruta_proyecto)
+    (area.ruta / "README.md").write_text("generado", encoding="utf-8")
+    ruta_proyecto.mkdir()
+    (ruta_proyecto / "ajeno.txt").write_text("x", encoding="utf-8")
+
+    with pytest.raises(ErrorPreparacionEstructuraGeneracion):
+        area_preparacion.publicar(area)
+    area_preparacion.descartar(area)
+
+    assert list(tmp_path.iterdir()) == [ruta_proyecto]
+    assert [ruta.name for ruta in ruta_proyecto.iterdir()] == ["ajeno.txt"]
@@ -1,7 +1,10 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from aplicacion.casos_uso.generar_manifest import GenerarManifest
+from aplicacion.errores import ErrorIntegridadManifest
 from aplicacion.puertos.calculadora_hash import CalculadoraHash
 from dominio.modelos import ArchivoGenerado, PlanGeneracion
 
@@ -35,3 +38,63 @@ def test_generar_manifest_crea_archivo_manifest_json(tmp_path: Path) -> None:
     assert contenido["version_generador"] == "0.2.0"
     assert len(contenido["archivos"]) == 2
     assert manifest.archivos[0].hash_sha256.startswith("hash::")
+
+
+class CalculadoraHashContadora(CalculadoraHash):
+    def __init__(self, hash_fijo: str) -> None:
+        self.hash_fijo = hash_fijo
+        self.rutas: list[str] = []
+
+    def calcular_sha256(self, ruta_absoluta: str) -> str:
+        self.rutas.append(ruta_absoluta)
+        return self.hash_fijo
+
+
+def test_generar_manifest_reutiliza_hashes_de_escritura_sin_leer_disco(tmp_path: Path) -> None:
+    plan = PlanGeneracion(archivos=[ArchivoGenerado("README.md", "hola")])
+    calculadora = CalculadoraHashContadora("no-usar")
+
+    manifest = GenerarManifest(calculadora).ejecutar(
+        plan=plan,
+        ruta_destino=str(tmp_path),
+        opciones={},
+        version_generador="0.2.0",
+        blueprints_usados=[],
+        hashes_sha256={"README.md": "hash-escrito"},
+    )
+
+    assert manifest.archivos[0].hash_sha256 == "hash-escrito"
+    assert calculadora.rutas == []
+
+
+def test_generar_manifest_modo_verificacion_detecta_divergencia(tmp_path: Path) -> None:
+    plan = PlanGeneracion(archivos=[ArchivoGenerado("README.md", "hola")])
+
+    with pytest.raises(ErrorIntegridadManifest):
+        GenerarManifest(CalculadoraHashContadora("hash-disco"), verificar_en_disco=True).ejecutar(
+            plan=plan,
+            ruta_destino=str(tmp_path),
+            opciones={},
+            version_generador="0.2.0",
+            blueprints_usados=[],
+            hashes_sha256={"README.md": "hash-escrito"},
+        )
+
+
+def test_generar_manifest_deja_una_sola_linea_info(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    plan = PlanGeneracion(archivos=[ArchivoGenerado(f"archivo_{indice}.txt", "x") for indice in range(5)])
+    for archivo in plan.archivos:
+        (tmp_path / archivo.ruta_relativa).write_text("x", encoding="utf-8")
+
+    with caplog.at_level("INFO", logger="aplicacion.casos_uso.generar_manifest"):
+        GenerarManifest(CalculadoraHashDoble()).ejecutar(
+            plan=plan,
+            ruta_destino=str(tmp_path),
+            opciones={},
+            version_generador="0.1.0",
+            blueprints_usados=[],
+        )
+
+    assert [registro.getMessage() for registro in caplog.records] == [
+        f"Manifest generado con 5 entradas en {tmp_path}"
+    ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from aplicacion.casos_uso.crear_plan_desde_blueprints import CrearPlanDesdeBlueprints
@@ -71,3 +72,40 @@ def test_generar_proyecto_mvp_crea_estructura_minima(tmp_path: Path) -> None:
     assert (ruta_proyecto / "VERSION").exists()
     assert (ruta_proyecto / "README.md").exists()
     assert salida.archivos_generados > 0
+
+
+def test_generar_proyecto_mvp_emite_traza_junto_al_proyecto(tmp_path: Path) -> None:
+    especificacion = EspecificacionProyecto(nombre_proyecto="trazado", ruta_destino=str(tmp_path), version="1.0.0")
+    clase = EspecificacionClase(nombre="Cliente")
+    clase.agregar_atributo(EspecificacionAtributo(nombre="nombre", tipo="str", obligatorio=True))
+    especificacion.agregar_clase(clase)
+    sistema_archivos = SistemaArchivosReal()
+    caso_uso = GenerarProyectoMvp(
+        crear_plan_desde_blueprints=CrearPlanDesdeBlueprints(RepositorioBlueprintsEnDisco("blueprints")),
+        ejecutar_plan=EjecutarPlan(sistema_archivos, GenerarManifest(CalculadoraHashReal())),
+        sistema_archivos=sistema_archivos,
+        generador_manifest=GeneradorManifest(),
+        emitir_traza=True,
+    )
+
+    salida = caso_uso.ejecutar(
+        GenerarProyectoMvpEntrada(
+            especificacion_proyecto=especificacion,
+            ruta_destino=str(tmp_path),
+            nombre_proyecto="trazado",
+            blueprints=["base_clean_arch_v1", "crud_json_v1"],
+        )
+    )
+
+    assert salida.ruta_traza == str(tmp_path / "trazado.traza.json")
+    traza = json.loads(Path(salida.ruta_traza).read_text(encoding="utf-8"))
+    nombres = [span["nombre"] for span in traza["spans"]]
+    assert nombres[0] == "generar_proyecto_mvp"
+    for paso in ["validar_entrada", "preparar_estructura", "ejecutar_plan", "escribir_lote", "auditoria"]:
+        assert paso in nombres
+    assert [span["atributos"]["nombre"] for span in traza["spans"] if span["nombre"] == "planificar_blueprint"] == [
+        "base_clean_arch",
+        "crud_json",
+    ]
+    assert traza["contadores"]["archivos"] == salida.archivos_generados
+    assert traza["contadores"]["bytes"] > 0
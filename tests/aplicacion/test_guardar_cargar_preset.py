@@ -1,5 +1,5 @@
 from aplicacion.casos_uso.presets import CargarPresetProyecto, GuardarPresetProyecto
-from dominio.modelos import EspecificacionClase, EspecificacionProyecto
+from dominio.modelos import EspecificacionAtributo, EspecificacionClase, EspecificacionProyecto
 from dominio.preset.preset_proyecto import PresetProyecto
 from infraestructura.presets.repositorio_presets_json import RepositorioPresetsJson
 
@@ -24,3 +24,29 @@ def test_guardar_y_cargar_preset(tmp_path) -> None:
     assert cargado.nombre == "demo"
     assert cargado.especificacion.nombre_proyecto == "demo"
     assert cargado.blueprints == ["base_clean_arch_v1", "crud_json_v1"]
+
+
+def test_preset_conserva_marcas_de_indice_de_atributos(tmp_path) -> None:
+    repositorio = RepositorioPresetsJson(str(tmp_path / "presets"))
+    clase = EspecificacionClase(
+        nombre="Cliente",
+        atributos=[
+            EspecificacionAtributo(nombre="email", tipo="str", obligatorio=True, unico=True),
+            EspecificacionAtributo(nombre="ciudad", tipo="str", obligatorio=False, indexado=True),
+            EspecificacionAtributo(nombre="edad", tipo="int", obligatorio=False),
+        ],
+    )
+    preset = PresetProyecto(
+        nombre="indices",
+        especificacion=EspecificacionProyecto(nombre_proyecto="demo", ruta_destino="/tmp/demo", clases=[clase]),
+        blueprints=["crud_sqlite"],
+    )
+
+    GuardarPresetProyecto(repositorio).ejecutar(preset)
+    cargado = CargarPresetProyecto(repositorio).ejecutar("indices")
+
+    assert [(a.nombre, a.indexado, a.unico) for a in cargado.especificacion.clases[0].atributos] == [
+        ("email", False, True),
+        ("ciudad", True, False),
+        ("edad", False, False),
+    ]
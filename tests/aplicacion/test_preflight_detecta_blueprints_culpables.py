@@ -44,7 +44,8 @@ def test_preflight_detecta_blueprints_culpables(tmp_path: Path) -> None:
     caso = AuditarFinalizacionProyecto(CrearPlanDuplicado(), GeneradorNulo(), AuditorNulo(), EjecutorNulo())
 
     salida = caso.ejecutar(
-        DtoAuditoriaFinalizacionEntrada(ruta_preset=str(preset), ruta_salida_auditoria=str(tmp_path / "sandbox"))
+        DtoAuditoriaFinalizacionEntrada(ruta_preset=str(preset), ruta_salida_auditoria=str(tmp_path / "sandbox")),
+        ruta_evidencias=str(tmp_path / "evidencias"),
     )
 
     assert salida.conflictos is not None
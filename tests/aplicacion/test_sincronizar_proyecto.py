@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from functools import partial
+import hashlib
+import json
+from pathlib import Path
+
+from aplicacion.casos_uso.auditoria.verificador_hashes_manifest import VerificadorHashesManifest
+from aplicacion.casos_uso.crear_plan_desde_blueprints import CrearPlanDesdeBlueprints
+from aplicacion.casos_uso.ejecutar_plan import EjecutarPlan
+from aplicacion.casos_uso.sincronizar_proyecto import SincronizarProyecto
+from aplicacion.puertos.blueprint import Blueprint, RepositorioBlueprints
+from aplicacion.puertos.sistema_archivos import SistemaArchivos
+from aplicacion.servicios.cache_renderizado import cache_renderizado_actual
+from dominio.modelos import ArchivoGenerado, EspecificacionProyecto, PlanGeneracion
+from infraestructura.calculadora_hash_real import CalculadoraHashReal
+from infraestructura.manifest_en_disco import EscritorManifestSeguro, LectorManifestEnDisco
+from infraestructura.sistema_archivos_real import SistemaArchivosReal
+
+
+class BlueprintTextos(Blueprint):
+    def __init__(self, contenidos: dict[str, str]) -> None:
+        self._contenidos = contenidos
+
+    def nombre(self) -> str:
+        return "textos"
+
+    def version(self) -> str:
+        return "1.0.0"
+
+    def validar(self, especificacion: EspecificacionProyecto) -> None:
+        especificacion.validar()
+
+    def generar_plan(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
+        return PlanGeneracion([ArchivoGenerado(ruta, texto) for ruta, texto in self._contenidos.items()])
+
+
+class RepoBlueprintsTextos(RepositorioBlueprints):
+    def __init__(self, blueprint: Blueprint) -> None:
+        self._blueprint = blueprint
+
+    def listar_blueprints(self) -> list[Blueprint]:
+        return [self._blueprint]
+
+    def obtener_por_nombre(self, nombre: str) -> Blueprint:
+        return self._blueprint
+
+
+class SistemaArchivosEspia(SistemaArchivos):
+    def __init__(self) -> None:
+        self._real = SistemaArchivosReal()
+        self.escritas: list[str] = []
+
+    def escribir_texto_atomico(self, ruta_absoluta: str, contenido: str) -> str:
+        self.escritas.append(Path(ruta_absoluta).name)
+        return self._real.escribir_texto_atomico(ruta_absoluta, contenido)
+
+    def asegurar_directorio(self, ruta_absoluta: str) -> None:
+        self._real.asegurar_directorio(ruta_absoluta)
+
+
+def _sha(texto: str) -> str:
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+def test_sincronizar_escribe_solo_archivos_con_hash_distinto(tmp_path: Path) -> None:
+    (tmp_path / "igual.txt").write_text("igual", encoding="utf-8")
+    (tmp_path / "cambia.txt").write_text("antes", encoding="utf-8")
+    manifest = {
+        "version_generador": "0.7.0",
+        "blueprints_usados": ["textos@1.0.0"],
+        "archivos": [
+            {"ruta_relativa": "igual.txt", "hash_sha256": _sha("igual")},
+            {"ruta_relativa": "cambia.txt", "hash_sha256": _sha("antes")},
+            {"ruta_relativa": "viejo.txt", "hash_sha256": _sha("viejo")},
+        ],
+        "timestamp_generacion": "2026-01-01T00:00:00+00:00",
+        "opciones": {"origen": "test"},
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    blueprint = BlueprintTextos({"igual.txt": "igual", "cambia.txt": "despues", "nuevo.txt": "nuevo"})
+    sistema_archivos = SistemaArchivosEspia()
+    caso_uso = SincronizarProyecto(
+        lector_manifest=LectorManifestEnDisco(),
+        escritor_manifest=EscritorManifestSeguro(),
+        crear_plan_desde_blueprints=CrearPlanDesdeBlueprints(RepoBlueprintsTextos(blueprint)),
+        ejecutar_plan=EjecutarPlan(sistema_archivos),
+    )
+
+    resultado = caso_uso.ejecutar(EspecificacionProyecto(nombre_proyecto="demo", ruta_destino=str(tmp_path)), str(tmp_path))
+
+    assert resultado.sin_cambios == ["igual.txt"]
+    assert resultado.actualizados == ["cambia.txt"]
+    assert resultado.nuevos == ["nuevo.txt"]
+    assert resultado.huerfanos == ["viejo.txt"]
+    assert sistema_archivos.escritas == ["cambia.txt", "nuevo.txt"]
+    assert (tmp_path / "cambia.txt").read_text(encoding="utf-8") == "despues"
+    manifest_final = LectorManifestEnDisco().leer(str(tmp_path))
+    assert {entrada.ruta_relativa: entrada.hash_sha256 for entrada in manifest_final.archivos} == {
+        "igual.txt": _sha("igual"),
+        "cambia.txt": _sha("despues"),
+        "nuevo.txt": _sha("nuevo"),
+    }
+
+
+def _caso_uso_con_archivo_editado(tmp_path: Path) -> SincronizarProyecto:
+    (tmp_path / "editado.txt").write_text("edición local", encoding="utf-8")
+    manifest = {
+        "version_generador": "0.7.0",
+        "blueprints_usados": ["textos@1.0.0"],
+        "archivos": [{"ruta_relativa": "editado.txt", "hash_sha256": _sha("original")}],
+        "timestamp_generacion": "2026-01-01T00:00:00+00:00",
+        "opciones": {},
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    return SincronizarProyecto(
+        lector_manifest=LectorManifestEnDisco(),
+        escritor_manifest=EscritorManifestSeguro(),
+        crear_plan_desde_blueprints=CrearPlanDesdeBlueprints(RepoBlueprintsTextos(BlueprintTextos({"editado.txt": "original"}))),
+        ejecutar_plan=EjecutarPlan(SistemaArchivosEspia()),
+        verificador_hashes=VerificadorHashesManifest(CalculadoraHashReal()),
+    )
+
+
+def test_sincronizar_conserva_ediciones_locales_por_defecto(tmp_path: Path) -> None:
+    caso_uso = _caso_uso_con_archivo_editado(tmp_path)
+
+    resultado = caso_uso.ejecutar(EspecificacionProyecto(nombre_proyecto="demo", ruta_destino=str(tmp_path)), str(tmp_path))
+
+    assert resultado.sin_cambios == ["editado.txt"]
+    assert (tmp_path / "editado.txt").read_text(encoding="utf-8") == "edición local"
+
+
+def test_sincronizar_con_restaurar_editados_reescribe_archivos_editados_en_disco(tmp_path: Path) -> None:
+    caso_uso = _caso_uso_con_archivo_editado(tmp_path)
+
+    resultado = caso_uso.ejecutar(
+        EspecificacionProyecto(nombre_proyecto="demo", ruta_destino=str(tmp_path)),
+        str(tmp_path),
+        restaurar_editados=True,
+    )
+
+    assert resultado.actualizados == ["editado.txt"]
+    assert (tmp_path / "editado.txt").read_text(encoding="utf-8") == "original"
+
+
+class BlueprintDiferido(BlueprintTextos):
+    def __init__(self, contenidos: dict[str, str]) -> None:
+        super().__init__(contenidos)
+        self.renderizados: list[str] = []
+
+    def generar_plan(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
+        return PlanGeneracion(
+            [ArchivoGenerado.diferido(ruta, self._renderizador(ruta)) for ruta in self._contenidos]
+        )
+
+    def _renderizador(self, ruta: str):
+        def renderizar() -> str:
+            self.renderizados.append(ruta)
+            return self._contenidos[ruta]
+
+        return renderizar
+
+
+def test_sincronizar_no_retiene_contenidos_y_retira_huerfanos_del_manifest(tmp_path: Path) -> None:
+    (tmp_path / "igual.txt").write_text("igual", encoding="utf-8")
+    manifest = {
+        "version_generador": "0.7.0",
+        "blueprints_usados": ["textos@1.0.0"],
+        "archivos": [
+            {"ruta_relativa": "igual.txt", "hash_sha256": _sha("igual")},
+            {"ruta_relativa": "viejo.txt", "hash_sha256": _sha("viejo")},
+        ],
+        "timestamp_generacion": "2026-01-01T00:00:00+00:00",
+        "opciones": {},
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    (tmp_path / "viejo.txt").write_text("viejo", encoding="utf-8")
+    blueprint = BlueprintDiferido({"igual.txt": "igual", "nuevo.txt": "nuevo"})
+    caso_uso = SincronizarProyecto(
+        lector_manifest=LectorManifestEnDisco(),
+        escritor_manifest=EscritorManifestSeguro(),
+        crear_plan_desde_blueprints=CrearPlanDesdeBlueprints(RepoBlueprintsTextos(blueprint)),
+        ejecutar_plan=EjecutarPlan(SistemaArchivosReal()),
+    )
+
+    resultado = caso_uso.ejecutar(EspecificacionProyecto(nombre_proyecto="demo", ruta_destino=str(tmp_path)), str(tmp_path))
+
+    assert blueprint.renderizados == ["igual.txt", "nuevo.txt", "nuevo.txt"]
+    assert resultado.huerfanos == ["viejo.txt"]
+    assert [entrada.ruta_relativa for entrada in LectorManifestEnDisco().leer(str(tmp_path)).archivos] == [
+        "igual.txt",
+        "nuevo.txt",
+    ]
+    assert (tmp_path / "viejo.txt").exists()
+
+
+class BlueprintDiferidoCacheado(BlueprintDiferido):
+    def generar_plan(self, especificacion: EspecificacionProyecto) -> PlanGeneracion:
+        cache = cache_renderizado_actual()
+        assert cache is not None
+        return PlanGeneracion(
+            [
+                ArchivoGenerado.diferido(
+                    ruta, partial(cache.obtener_o_renderizar, ("textos", "1.0.0", ruta, ""), self._renderizador(ruta))
+                )
+                for ruta in self._contenidos
+            ]
+        )
+
+
+def test_sincronizar_activa_cache_y_no_renderiza_dos_veces_los_cambiados(tmp_path: Path) -> None:
+    manifest = {
+        "version_generador": "0.7.0",
+        "blueprints_usados": ["textos@1.0.0"],
+        "archivos": [],
+        "timestamp_generacion": "2026-01-01T00:00:00+00:00",
+        "opciones": {},
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    blueprint = BlueprintDiferidoCacheado({"nuevo.txt": "nuevo"})
+    caso_uso = SincronizarProyecto(
+        lector_manifest=LectorManifestEnDisco(),
+        escritor_manifest=EscritorManifestSeguro(),
+        crear_plan_desde_blueprints=CrearPlanDesdeBlueprints(RepoBlueprintsTextos(blueprint)),
+        ejecutar_plan=EjecutarPlan(SistemaArchivosReal()),
+    )
+
+    resultado = caso_uso.ejecutar(EspecificacionProyecto(nombre_proyecto="demo", ruta_destino=str(tmp_path)), str(tmp_path))
+
+    assert resultado.nuevos == ["nuevo.txt"]
+    assert blueprint.renderizados == ["nuevo.txt"]
+    assert cache_renderizado_actual() is None
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+
+from aplicacion.servicios.trazado import Trazador, activar_trazador, incrementar, span, trazador_actual
+
+
+def test_trazador_anida_spans_y_acumula_contadores() -> None:
+    trazador = Trazador()
+
+    with activar_trazador(trazador):
+        with span("generar", preset="demo"):
+            with span("blueprint", nombre="crud_json"):
+                incrementar("archivos", 3)
+            incrementar("archivos")
+
+    spans = trazador.spans
+    assert [(item.nombre, item.padre) for item in spans] == [("generar", None), ("blueprint", 0)]
+    assert spans[1].duracion_ns <= spans[0].duracion_ns
+    assert trazador.contadores == {"archivos": 4}
+    assert trazador.resumen()[1].startswith("  blueprint nombre=crud_json: ")
+    assert json.loads(trazador.a_json())["spans"][0]["atributos"] == {"preset": "demo"}
+
+
+def test_span_sin_trazador_activo_no_registra_nada() -> None:
+    with span("ignorado") as registrado:
+        incrementar("archivos")
+
+    assert registrado is None
+    assert trazador_actual() is None
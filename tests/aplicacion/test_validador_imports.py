@@ -4,6 +4,8 @@ import textwrap
 from pathlib import Path
 
 from aplicacion.casos_uso.auditar_proyecto_generado import AuditarProyectoGenerado
+from aplicacion.casos_uso.auditoria import grafo_imports
+from aplicacion.casos_uso.auditoria.grafo_imports import ExtractorGrafoImports
 from aplicacion.casos_uso.auditoria.validadores import ContextoAuditoria, ResultadoValidacion, ValidadorAuditoria
 from aplicacion.casos_uso.auditoria.validadores.validador_imports import ValidadorImports
 from aplicacion.puertos.ejecutor_procesos import EjecutorProcesos, ResultadoProceso
@@ -82,6 +84,63 @@ def test_validador_imports_proyecto_vacio(tmp_path: Path) -> None:
     assert resultado.errores == []
 
 
+def test_validador_imports_detecta_ciclo_de_tres_modulos(tmp_path: Path) -> None:
+    _crear_estructura_minima(tmp_path)
+    (tmp_path / "aplicacion" / "a.py").write_text("from aplicacion.b import B\n", encoding="utf-8")
+    (tmp_path / "aplicacion" / "b.py").write_text("from aplicacion.c import C\n", encoding="utf-8")
+    (tmp_path / "aplicacion" / "c.py").write_text("from aplicacion.a import A\n", encoding="utf-8")
+
+    resultado = ValidadorImports().validar(ContextoAuditoria(base=tmp_path))
+
+    assert resultado.errores == ["Import circular detectado entre aplicacion.a, aplicacion.b y aplicacion.c"]
+
+
+def test_extractor_grafo_reutiliza_cache_y_relee_archivos_modificados(tmp_path: Path, monkeypatch) -> None:
+    _crear_estructura_minima(tmp_path)
+    modulo = tmp_path / "aplicacion" / "caso.py"
+    modulo.write_text("import json\n", encoding="utf-8")
+    leidos: list[str] = []
+    extraer_original = grafo_imports.extraer_imports_archivo
+
+    def extraer_espia(ruta: str) -> frozenset[str]:
+        leidos.append(Path(ruta).name)
+        return extraer_original(ruta)
+
+    monkeypatch.setattr(grafo_imports, "extraer_imports_archivo", extraer_espia)
+    extractor = ExtractorGrafoImports(max_procesos=1)
+
+    extractor.extraer(tmp_path)
+    leidos.clear()
+    extractor.extraer(tmp_path)
+    assert leidos == []
+
+    modulo.write_text("import json\nimport sqlite3\n", encoding="utf-8")
+    grafo = extractor.extraer(tmp_path)
+    assert leidos == ["caso.py"]
+    assert grafo.modulos["aplicacion.caso"].imports == frozenset({"json", "sqlite3"})
+
+
+def test_extractor_grafo_solo_retiene_el_ultimo_arbol(tmp_path: Path, monkeypatch) -> None:
+    for nombre in ["uno", "dos"]:
+        (tmp_path / nombre / "aplicacion").mkdir(parents=True)
+        (tmp_path / nombre / "aplicacion" / f"{nombre}.py").write_text("import json\n", encoding="utf-8")
+    leidos: list[str] = []
+    extraer_original = grafo_imports.extraer_imports_archivo
+
+    def extraer_espia(ruta: str) -> frozenset[str]:
+        leidos.append(Path(ruta).name)
+        return extraer_original(ruta)
+
+    monkeypatch.setattr(grafo_imports, "extraer_imports_archivo", extraer_espia)
+    extractor = ExtractorGrafoImports(max_procesos=1)
+
+    extractor.extraer(tmp_path / "uno")
+    extractor.extraer(tmp_path / "dos")
+    extractor.extraer(tmp_path / "uno")
+
+    assert leidos == ["uno.py", "dos.py", "uno.py"]
+
+
 def test_regla_imports_dominio_reducida_en_complejidad() -> None:
     codigo = textwrap.dedent(inspect.getsource(ValidadorImports._regla_imports_dominio))
     arbol = ast.parse(codigo)
@@ -100,3 +159,34 @@ def test_auditar_proyecto_incluye_validador_imports_en_pipeline(tmp_path: Path)
 
     assert doble.ejecutado is True
     assert resultado.valido is True
+
+
+class ValidadorQueGuardaGrafo(ValidadorAuditoria):
+    def __init__(self) -> None:
+        self.grafos: list[object] = []
+
+    def validar(self, contexto: ContextoAuditoria) -> ResultadoValidacion:
+        self.grafos.append(contexto.grafo_imports)
+        return ResultadoValidacion(exito=True, errores=[])
+
+
+def test_auditar_proyecto_comparte_un_solo_grafo_entre_validadores(tmp_path: Path, monkeypatch) -> None:
+    _crear_estructura_minima(tmp_path)
+    leidos: list[str] = []
+    extraer_original = grafo_imports.extraer_imports_archivo
+
+    def extraer_espia(ruta: str) -> frozenset[str]:
+        leidos.append(Path(ruta).name)
+        return extraer_original(ruta)
+
+    monkeypatch.setattr(grafo_imports, "extraer_imports_archivo", extraer_espia)
+    primero, segundo = ValidadorQueGuardaGrafo(), ValidadorQueGuardaGrafo()
+    auditor = AuditarProyectoGenerado(EjecutorFalso())
+    auditor._validadores_auditoria = [primero, segundo]
+
+    auditor.ejecutar(str(tmp_path))
+
+    assert leidos == ["logging_config.py"]
+    assert primero.grafos[0] is not None
+    assert primero.grafos == segundo.grafos
+    assert primero.grafos[0] is segundo.grafos[0]
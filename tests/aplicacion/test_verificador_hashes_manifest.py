@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+from aplicacion.casos_uso.auditoria.verificador_hashes_manifest import VerificadorHashesManifest
+from aplicacion.puertos.manifest import CacheEstadoManifest, EstadoArchivoManifest
+
+
+class CalculadoraContadora:
+    def __init__(self) -> None:
+        self.hasheados: list[str] = []
+
+    def calcular_hash_archivo(self, ruta: Path) -> str:
+        self.hasheados.append(ruta.name)
+        return hashlib.sha256(ruta.read_bytes()).hexdigest()
+
+
+class CacheEstadoEnMemoria(CacheEstadoManifest):
+    def __init__(self) -> None:
+        self.estados: dict[str, EstadoArchivoManifest] = {}
+        self.guardados = 0
+
+    def cargar(self, ruta_proyecto: str) -> dict[str, EstadoArchivoManifest]:
+        return dict(self.estados)
+
+    def guardar(self, ruta_proyecto: str, estados: dict[str, EstadoArchivoManifest]) -> None:
+        self.estados = dict(estados)
+        self.guardados += 1
+
+
+def _escribir_antiguo(ruta: Path, texto: str, mtime: int = 1_700_000_000) -> str:
+    ruta.write_text(texto, encoding="utf-8")
+    os.utime(ruta, (mtime, mtime))
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+def test_verificador_reporta_todos_los_faltantes_e_inconsistentes(tmp_path: Path) -> None:
+    hashes = {nombre: _escribir_antiguo(tmp_path / nombre, nombre) for nombre in ["a", "b", "c"]}
+    (tmp_path / "b").write_text("cambiado", encoding="utf-8")
+    hashes["borrado"] = "0" * 64
+
+    resultado = VerificadorHashesManifest(CalculadoraContadora(), max_hilos=4).verificar(tmp_path, hashes)
+
+    assert resultado.faltantes == ["borrado"]
+    assert resultado.inconsistentes == ["b"]
+    assert resultado.exito is False
+
+
+def test_verificador_con_cache_solo_hashea_entradas_con_stat_distinto(tmp_path: Path) -> None:
+    hashes = {nombre: _escribir_antiguo(tmp_path / nombre, nombre) for nombre in ["a", "b"]}
+    calculadora = CalculadoraContadora()
+    cache = CacheEstadoEnMemoria()
+    verificador = VerificadorHashesManifest(calculadora, cache_estado=cache)
+
+    verificador.verificar(tmp_path, hashes)
+    assert sorted(calculadora.hasheados) == ["a", "b"]
+
+    calculadora.hasheados.clear()
+    assert verificador.verificar(tmp_path, hashes).exito is True
+    assert calculadora.hasheados == []
+    assert cache.guardados == 1
+
+    _escribir_antiguo(tmp_path / "b", "bb", mtime=1_700_000_100)
+    resultado = verificador.verificar(tmp_path, hashes)
+    assert calculadora.hasheados == ["b"]
+    assert resultado.inconsistentes == ["b"]
+    assert set(cache.estados) == {"a"}
+
+
+def test_verificador_verificacion_completa_ignora_cache(tmp_path: Path) -> None:
+    hashes = {"a": _escribir_antiguo(tmp_path / "a", "a")}
+    calculadora = CalculadoraContadora()
+    verificador = VerificadorHashesManifest(calculadora, cache_estado=CacheEstadoEnMemoria())
+    verificador.verificar(tmp_path, hashes)
+
+    verificador.verificar(tmp_path, hashes, verificacion_completa=True)
+
+    assert calculadora.hasheados == ["a", "a"]
+
+
+def test_verificador_no_cachea_archivos_modificados_recientemente(tmp_path: Path) -> None:
+    (tmp_path / "reciente").write_text("x", encoding="utf-8")
+    cache = CacheEstadoEnMemoria()
+
+    VerificadorHashesManifest(CalculadoraContadora(), cache_estado=cache).verificar(
+        tmp_path, {"reciente": hashlib.sha256(b"x").hexdigest()}
+    )
+
+    assert cache.estados == {}
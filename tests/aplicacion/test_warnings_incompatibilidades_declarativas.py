@@ -37,7 +37,8 @@ def test_warnings_incompatibilidades_declarativas_aparecen_ante_fallo_validacion
     caso = AuditarFinalizacionProyecto(CrearPlanNoUsado(), GeneradorNoUsado(), AuditorNoUsado(), EjecutorNoUsado())
 
     salida = caso.ejecutar(
-        DtoAuditoriaFinalizacionEntrada(ruta_preset=str(preset), ruta_salida_auditoria=str(tmp_path / "sandbox"))
+        DtoAuditoriaFinalizacionEntrada(ruta_preset=str(preset), ruta_salida_auditoria=str(tmp_path / "sandbox")),
+        ruta_evidencias=str(tmp_path / "evidencias"),
     )
 
     evidencia = salida.evidencias["preflight_validacion_entrada"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import ast
 from pathlib import Path
 
 from infraestructura.bootstrap import construir_contenedor_aplicacion
@@ -20,9 +21,15 @@ def test_construir_contenedor_aplicacion_expone_casos_de_uso_principales() -> No
 
 
 def test_cli_importa_bootstrap_por_contexto() -> None:
-    contenido = Path("presentacion/cli/__main__.py").read_text(encoding="utf-8")
-
-    assert "from infraestructura.bootstrap.bootstrap_cli import construir_contenedor_cli" in contenido
+    arbol = ast.parse(Path("presentacion/cli/__main__.py").read_text(encoding="utf-8"))
+    importados = {
+        alias.name
+        for nodo in arbol.body
+        if isinstance(nodo, ast.ImportFrom) and nodo.module == "infraestructura.bootstrap.bootstrap_cli"
+        for alias in nodo.names
+    }
+
+    assert "construir_contenedor_cli" in importados
 
 
 def test_wizard_no_importa_infraestructura_directamente() -> None:
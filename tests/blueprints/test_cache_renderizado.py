@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from aplicacion.servicios.cache_renderizado import CacheRenderizado, activar_cache_renderizado
+from blueprints.cache_renderizado import huella_clase
+from blueprints.crud_json_v1.blueprint import CrudJsonBlueprint
+from dominio.modelos import EspecificacionAtributo, EspecificacionClase, EspecificacionProyecto
+
+
+def _especificacion() -> EspecificacionProyecto:
+    return EspecificacionProyecto(
+        nombre_proyecto="demo",
+        ruta_destino="/tmp/demo",
+        clases=[
+            EspecificacionClase(
+                nombre="Cliente",
+                atributos=[EspecificacionAtributo(nombre="nombre", tipo="str", obligatorio=True)],
+            )
+        ],
+    )
+
+
+def test_cache_renderizado_desaloja_por_bytes_la_entrada_menos_usada() -> None:
+    cache = CacheRenderizado(max_bytes=8)
+    renderizados: list[str] = []
+
+    def renderizar(texto: str):  # type: ignore[no-untyped-def]
+        return lambda: renderizados.append(texto) or texto
+
+    cache.obtener_o_renderizar(("bp", "1", "a", ""), renderizar("aaa"))
+    cache.obtener_o_renderizar(("bp", "1", "b", ""), renderizar("bbb"))
+    cache.obtener_o_renderizar(("bp", "1", "a", ""), renderizar("aaa"))
+    cache.obtener_o_renderizar(("bp", "1", "c", ""), renderizar("ccc"))
+    cache.obtener_o_renderizar(("bp", "1", "b", ""), renderizar("bbb"))
+
+    assert renderizados == ["aaa", "bbb", "ccc", "bbb"]
+    assert cache.estadisticas() == {"aciertos": 1, "fallos": 4, "entradas": 2, "bytes": 6}
+
+
+def test_cache_renderizado_no_guarda_textos_mayores_que_el_limite() -> None:
+    cache = CacheRenderizado(max_bytes=4)
+
+    assert cache.obtener_o_renderizar(("bp", "1", "grande", ""), lambda: "ñandú") == "ñandú"
+    assert cache.estadisticas()["entradas"] == 0
+
+
+def test_huella_clase_ignora_id_interno() -> None:
+    clase_a = _especificacion().clases[0]
+    clase_b = _especificacion().clases[0]
+
+    assert clase_a.id_interno != clase_b.id_interno
+    assert huella_clase(clase_a) == huella_clase(clase_b)
+
+
+def test_planificar_dos_veces_con_cache_activa_reutiliza_contenidos_renderizados() -> None:
+    cache = CacheRenderizado()
+
+    with activar_cache_renderizado(cache):
+        primero = CrudJsonBlueprint().generar_plan(_especificacion())
+        fallos_iniciales = cache.fallos
+        segundo = CrudJsonBlueprint().generar_plan(_especificacion())
+
+    assert fallos_iniciales == 9
+    assert cache.fallos == fallos_iniciales
+    assert cache.aciertos == 9
+    assert segundo.archivos == primero.archivos
+
+
+def test_sin_cache_activa_el_plan_no_retiene_textos() -> None:
+    cache = CacheRenderizado()
+    with activar_cache_renderizado(cache):
+        pass
+
+    CrudJsonBlueprint().generar_plan(_especificacion())
+
+    assert cache.estadisticas() == {"aciertos": 0, "fallos": 0, "entradas": 0, "bytes": 0}
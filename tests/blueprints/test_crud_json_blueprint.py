@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 from blueprints.crud_json_v1.blueprint import CrudJsonBlueprint
@@ -62,3 +65,97 @@ def test_generar_plan_crud_json_sin_clases_falla() -> None:
 
     with pytest.raises(ErrorValidacionDominio, match="al menos una clase"):
         blueprint.generar_plan(especificacion)
+
+
+def test_generar_plan_diferido_crud_json_equivale_al_plan_materializado() -> None:
+    blueprint = CrudJsonBlueprint()
+    especificacion = EspecificacionProyecto(
+        nombre_proyecto="demo",
+        ruta_destino="/tmp/demo",
+        clases=[
+            EspecificacionClase(
+                nombre="Cliente",
+                atributos=[EspecificacionAtributo(nombre="nombre", tipo="str", obligatorio=True)],
+            )
+        ],
+    )
+
+    plan_diferido = blueprint.generar_plan_diferido(especificacion)
+
+    assert any(archivo.es_diferido for archivo in plan_diferido.archivos)
+    assert plan_diferido.materializar().archivos == blueprint.generar_plan(especificacion).archivos
+
+
+_ENTIDAD_CLIENTE = """
+from dataclasses import dataclass
+
+
+@dataclass
+class Cliente:
+    id: int = 0
+    nombre: str = ""
+"""
+
+_SCRIPT_REPOSITORIO_CON_INDICE = """
+import json
+from pathlib import Path
+
+from dominio.entidades.cliente import Cliente
+from infraestructura.persistencia.json.repositorio_cliente_json import RepositorioClienteJson
+
+repo = RepositorioClienteJson(".")
+ruta = Path("datos/clientes.json")
+with repo.lote():
+    creados = [repo.crear(Cliente(id=0, nombre=f"c{indice}")) for indice in range(3)]
+    assert json.loads(ruta.read_text(encoding="utf-8")) == []
+assert [item["id"] for item in json.loads(ruta.read_text(encoding="utf-8"))] == [1, 2, 3]
+assert "\\n " not in ruta.read_text(encoding="utf-8")
+
+ruta.write_text(json.dumps([{"id": 7, "nombre": "externo"}, {"id": 9, "nombre": "otro"}]), encoding="utf-8")
+assert repo.obtener_por_id(7).nombre == "externo"
+assert repo.crear(Cliente(id=0, nombre="nuevo")).id == 10
+assert [cliente.id for cliente in RepositorioClienteJson(".").listar()] == [7, 9, 10]
+assert [cliente.id for cliente in repo.listar_pagina(2, despues_de_id=7)] == [9, 10]
+assert [cliente.id for cliente in repo.listar_pagina(5, filtros={"nombre": "externo"})] == [7]
+try:
+    with repo.lote():
+        repo.crear(Cliente(id=0, nombre="descartado"))
+        repo.eliminar(7)
+        raise RuntimeError("abortar")
+except RuntimeError:
+    pass
+assert [cliente.id for cliente in repo.listar()] == [7, 9, 10]
+assert [cliente.id for cliente in RepositorioClienteJson(".").listar()] == [7, 9, 10]
+print(creados[-1].id)
+"""
+
+
+def test_repositorio_json_generado_indexa_en_memoria_y_agrupa_escrituras(tmp_path) -> None:
+    especificacion = EspecificacionProyecto(
+        nombre_proyecto="demo",
+        ruta_destino=str(tmp_path),
+        clases=[
+            EspecificacionClase(
+                nombre="Cliente",
+                atributos=[EspecificacionAtributo(nombre="nombre", tipo="str", obligatorio=True)],
+            )
+        ],
+    )
+    for archivo in CrudJsonBlueprint().generar_plan(especificacion).archivos:
+        if archivo.ruta_relativa.endswith(("repositorio_cliente.py", "repositorio_cliente_json.py")):
+            destino = tmp_path / archivo.ruta_relativa
+            destino.parent.mkdir(parents=True, exist_ok=True)
+            destino.write_text(archivo.contenido_texto, encoding="utf-8")
+    (tmp_path / "dominio" / "entidades").mkdir(parents=True)
+    (tmp_path / "dominio" / "entidades" / "cliente.py").write_text(_ENTIDAD_CLIENTE, encoding="utf-8")
+
+    resultado = subprocess.run(
+        [sys.executable, "-c", _SCRIPT_REPOSITORIO_CON_INDICE],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert resultado.returncode == 0, resultado.stderr
+    assert resultado.stdout.strip() == "3"
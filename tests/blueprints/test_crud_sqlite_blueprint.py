@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 from blueprints.crud_json_v1.blueprint import CrudJsonBlueprint
@@ -61,3 +64,166 @@ def test_generar_plan_crud_sqlite_sin_clases_falla() -> None:
 
     with pytest.raises(ErrorValidacionDominio, match="al menos una clase"):
         blueprint.generar_plan(especificacion)
+
+
+_ENTIDAD_CLIENTE = """
+from dataclasses import dataclass
+
+
+@dataclass
+class Cliente:
+    id: int = 0
+    nombre: str = ""
+    activo: bool = False
+"""
+
+_SCRIPT_REPOSITORIO_MASIVO = """
+import threading
+
+from dominio.entidades.cliente import Cliente
+from infraestructura.persistencia.sqlite.repositorio_cliente_sqlite import RepositorioClienteSqlite
+
+with RepositorioClienteSqlite(".") as repo:
+    conexion = repo._conectar()
+    assert conexion is repo._conectar()
+    assert conexion.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    otras = []
+    hilo = threading.Thread(target=lambda: otras.append(repo._conectar()))
+    hilo.start()
+    hilo.join()
+    assert otras[0] is not conexion
+
+    creados = repo.crear_muchos(Cliente(nombre=f"c{indice}", activo=True) for indice in range(50))
+    assert [cliente.id for cliente in creados] == list(range(1, 51))
+    repo.actualizar_muchos(Cliente(id=cliente.id, nombre="upd", activo=False) for cliente in creados[:10])
+    repo.eliminar_muchos(cliente.id for cliente in creados[40:])
+    try:
+        repo.eliminar_muchos([1, 999])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("eliminar_muchos debe rechazar ids inexistentes")
+    listados = repo.listar()
+    assert len(listados) == 40
+    assert listados[0] == Cliente(id=1, nombre="upd", activo=False)
+    pagina = repo.listar_pagina(5, despues_de_id=8, filtros={"activo": False})
+    assert [cliente.id for cliente in pagina] == [9, 10]
+    assert [cliente.id for cliente in repo.listar_pagina(3, despues_de_id=38)] == [39, 40]
+    nuevos = repo.crear_muchos([Cliente(nombre="x", activo=True), Cliente(nombre="y", activo=False)])
+    assert nuevos == [Cliente(id=51, nombre="x", activo=True), Cliente(id=52, nombre="y", activo=False)]
+    assert repo.obtener_por_id(52) == nuevos[1]
+    assert repo.crear_muchos([]) == []
+print("ok")
+"""
+
+
+def test_repositorio_sqlite_generado_reutiliza_conexion_y_opera_en_lote(tmp_path) -> None:
+    for archivo in CrudSqliteBlueprint().generar_plan(_especificacion_demo()).archivos:
+        if archivo.ruta_relativa.endswith(("repositorio_cliente.py", "repositorio_cliente_sqlite.py")):
+            destino = tmp_path / archivo.ruta_relativa
+            destino.parent.mkdir(parents=True, exist_ok=True)
+            destino.write_text(archivo.contenido_texto, encoding="utf-8")
+    (tmp_path / "dominio" / "entidades").mkdir(parents=True)
+    (tmp_path / "dominio" / "entidades" / "cliente.py").write_text(_ENTIDAD_CLIENTE, encoding="utf-8")
+
+    resultado = subprocess.run(
+        [sys.executable, "-c", _SCRIPT_REPOSITORIO_MASIVO],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert resultado.returncode == 0, resultado.stderr
+    assert resultado.stdout.strip() == "ok"
+
+
+_SCRIPT_BUSQUEDAS_INDEXADAS = """
+from dominio.entidades.cliente import Cliente
+from infraestructura.persistencia.sqlite.repositorio_cliente_sqlite import RepositorioClienteSqlite
+
+with RepositorioClienteSqlite(".") as repo:
+    repo.crear_muchos([Cliente(nombre="ana", activo=True), Cliente(nombre="luis", activo=True)])
+    assert repo.buscar_por_nombre("luis").id == 2
+    assert [cliente.id for cliente in repo.buscar_por_activo(True)] == [1, 2]
+    plan = repo._conectar().execute("EXPLAIN QUERY PLAN SELECT id FROM clientes WHERE nombre = ?", ("ana",)).fetchall()
+    assert "idx_clientes_nombre" in str([tuple(fila) for fila in plan])
+    try:
+        repo.crear(Cliente(nombre="ana", activo=False))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("el índice único debe rechazar duplicados")
+print("ok")
+"""
+
+
+def test_repositorio_sqlite_generado_crea_indices_y_buscadores(tmp_path) -> None:
+    especificacion = EspecificacionProyecto(
+        nombre_proyecto="demo",
+        ruta_destino="/tmp/demo",
+        clases=[
+            EspecificacionClase(
+                nombre="Cliente",
+                atributos=[
+                    EspecificacionAtributo(nombre="nombre", tipo="str", obligatorio=True, unico=True),
+                    EspecificacionAtributo(nombre="activo", tipo="bool", obligatorio=True, indexado=True),
+                ],
+            )
+        ],
+    )
+    for archivo in CrudSqliteBlueprint().generar_plan(especificacion).archivos:
+        if archivo.ruta_relativa.endswith(("repositorio_cliente.py", "repositorio_cliente_sqlite.py")):
+            destino = tmp_path / archivo.ruta_relativa
+            destino.parent.mkdir(parents=True, exist_ok=True)
+            destino.write_text(archivo.contenido_texto, encoding="utf-8")
+    (tmp_path / "dominio" / "entidades").mkdir(parents=True)
+    (tmp_path / "dominio" / "entidades" / "cliente.py").write_text(_ENTIDAD_CLIENTE, encoding="utf-8")
+
+    resultado = subprocess.run(
+        [sys.executable, "-c", _SCRIPT_BUSQUEDAS_INDEXADAS],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert resultado.returncode == 0, resultado.stderr
+    assert resultado.stdout.strip() == "ok"
+
+
+def test_suite_generada_pasa_con_atributos_unicos_e_indexados(tmp_path) -> None:
+    especificacion = EspecificacionProyecto(
+        nombre_proyecto="demo",
+        ruta_destino="/tmp/demo",
+        clases=[
+            EspecificacionClase(
+                nombre="Cliente",
+                atributos=[
+                    EspecificacionAtributo(nombre="nombre", tipo="str", obligatorio=True, unico=True),
+                    EspecificacionAtributo(nombre="activo", tipo="bool", obligatorio=True, indexado=True),
+                ],
+            )
+        ],
+    )
+    plan = CrudSqliteBlueprint().generar_plan(especificacion)
+    for archivo in plan.archivos:
+        if archivo.ruta_relativa.endswith(
+            ("repositorio_cliente.py", "repositorio_cliente_sqlite.py", "test_crud_cliente.py")
+        ):
+            destino = tmp_path / archivo.ruta_relativa
+            destino.parent.mkdir(parents=True, exist_ok=True)
+            destino.write_text(archivo.contenido_texto, encoding="utf-8")
+    (tmp_path / "dominio" / "entidades").mkdir(parents=True)
+    (tmp_path / "dominio" / "entidades" / "cliente.py").write_text(_ENTIDAD_CLIENTE, encoding="utf-8")
+
+    resultado = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "tests/aplicacion/test_crud_cliente.py"],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert resultado.returncode == 0, resultado.stdout + resultado.stderr
+    assert "8 passed" in resultado.stdout
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 from blueprints.export_csv_v1.blueprint import ExportCsvBlueprint
@@ -33,3 +36,103 @@ def test_export_csv_falla_sin_clases() -> None:
         ExportCsvBlueprint().generar_plan(
             EspecificacionProyecto(nombre_proyecto="demo", ruta_destino="/tmp/demo")
         )
+
+
+_SCRIPT_INFORME_PAGINADO = """
+from dataclasses import dataclass
+
+from aplicacion.casos_uso.informes.generar_informe_clientes_csv import GenerarInformeClienteCsv
+from infraestructura.informes.csv.exportador_csv import ExportadorCsv
+
+
+@dataclass
+class Cliente:
+    id: int
+    nombre: str
+
+
+class RepositorioPaginado:
+    def __init__(self) -> None:
+        self.filas = [Cliente(id=indice, nombre=f"c{indice}") for indice in range(1, 6)]
+        self.llamadas = []
+
+    def listar(self):
+        raise AssertionError("el informe no debe cargar la tabla completa")
+
+    def listar_pagina(self, limite, despues_de_id=0, filtros=None):
+        self.llamadas.append(despues_de_id)
+        return [cliente for cliente in self.filas if cliente.id > despues_de_id][:limite]
+
+
+repositorio = RepositorioPaginado()
+caso_uso = GenerarInformeClienteCsv(repositorio, ExportadorCsv())
+caso_uso.TAMANO_PAGINA = 2
+caso_uso.ejecutar("salida/clientes.csv")
+assert repositorio.llamadas == [0, 2, 4]
+print(open("salida/clientes.csv", encoding="utf-8").read().splitlines()[-1])
+"""
+
+
+def test_informe_csv_generado_recorre_el_repositorio_por_paginas(tmp_path) -> None:
+    for archivo in ExportCsvBlueprint().generar_plan(_especificacion_demo()).archivos:
+        destino = tmp_path / archivo.ruta_relativa
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        destino.write_text(archivo.contenido_texto, encoding="utf-8")
+    (tmp_path / "aplicacion" / "puertos" / "repositorio_cliente.py").write_text(
+        "class RepositorioCliente:\n    pass\n", encoding="utf-8"
+    )
+
+    resultado = subprocess.run(
+        [sys.executable, "-c", _SCRIPT_INFORME_PAGINADO],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert resultado.returncode == 0, resultado.stderr
+    assert resultado.stdout.strip() == "5,c5"
+
+
+_SCRIPT_EXPORTACION_POR_PARTES = """
+import gzip
+import json
+import os
+
+from infraestructura.informes.csv.exportador_csv import ExportadorCsv
+
+filas = ([str(indice), "x" * 20] for indice in range(7))
+ExportadorCsv(max_bytes_por_parte=60, comprimir=True).exportar("salida/clientes.csv", ["id", "nombre"], filas)
+indice = json.load(open("salida/clientes.indice.json", encoding="utf-8"))
+for parte in indice["partes"]:
+    with gzip.open("salida/" + parte["archivo"], "rt", encoding="utf-8") as archivo:
+        lineas = archivo.read().splitlines()
+    assert lineas[0] == "id,nombre"
+    assert len(lineas) - 1 == parte["filas"]
+print(indice["total_filas"], [parte["filas"] for parte in indice["partes"]])
+
+ExportadorCsv(max_filas_por_parte=5, comprimir=True).exportar("salida/clientes.csv", ["id"], [["1"]])
+print(sorted(os.listdir("salida")))
+"""
+
+
+def test_exportador_csv_generado_divide_en_partes_gzip_con_indice(tmp_path) -> None:
+    for archivo in ExportCsvBlueprint().generar_plan(_especificacion_demo()).archivos:
+        destino = tmp_path / archivo.ruta_relativa
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        destino.write_text(archivo.contenido_texto, encoding="utf-8")
+
+    resultado = subprocess.run(
+        [sys.executable, "-c", _SCRIPT_EXPORTACION_POR_PARTES],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert resultado.returncode == 0, resultado.stderr
+    assert resultado.stdout.splitlines() == [
+        "7 [3, 3, 1]",
+        "['clientes.indice.json', 'clientes.part0001.csv.gz']",
+    ]
+    assert not (tmp_path / "salida" / "clientes.csv").exists()
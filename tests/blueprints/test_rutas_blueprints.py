@@ -0,0 +1,54 @@
+import pytest
+
+from aplicacion.casos_uso.crear_plan_desde_blueprints import CrearPlanDesdeBlueprints
+from aplicacion.servicios.cache_renderizado import CacheRenderizado, activar_cache_renderizado
+from dominio.modelos import EspecificacionAtributo, EspecificacionClase, EspecificacionProyecto
+from infraestructura.planificador_blueprints_real import PlanificadorBlueprintsReal
+from infraestructura.repositorio_blueprints_en_disco import RepositorioBlueprintsEnDisco
+
+REPOSITORIO = RepositorioBlueprintsEnDisco("blueprints")
+
+
+def _especificacion() -> EspecificacionProyecto:
+    return EspecificacionProyecto(
+        nombre_proyecto="demo",
+        ruta_destino="/tmp/demo",
+        clases=[
+            EspecificacionClase(
+                nombre="Cliente",
+                atributos=[
+                    EspecificacionAtributo(nombre="nombre", tipo="str", obligatorio=True),
+                    EspecificacionAtributo(nombre="edad", tipo="int", obligatorio=False),
+                ],
+            ),
+            EspecificacionClase(
+                nombre="FacturaLinea",
+                atributos=[EspecificacionAtributo(nombre="importe", tipo="float", obligatorio=True)],
+            ),
+        ],
+    )
+
+
+@pytest.mark.parametrize("blueprint", REPOSITORIO.listar_blueprints(), ids=lambda blueprint: blueprint.nombre())
+def test_obtener_rutas_equivale_al_plan_completo(blueprint) -> None:  # type: ignore[no-untyped-def]
+    especificacion = _especificacion()
+
+    assert blueprint.obtener_rutas(especificacion) == blueprint.generar_plan(especificacion).obtener_rutas()
+
+
+def test_obtener_rutas_crud_no_renderiza_contenidos() -> None:
+    cache = CacheRenderizado()
+
+    with activar_cache_renderizado(cache):
+        REPOSITORIO.obtener_por_nombre("crud_json").obtener_rutas(_especificacion())
+
+    assert cache.estadisticas()["fallos"] == 0
+
+
+def test_planificador_real_usa_enumeracion_de_rutas() -> None:
+    planificador = PlanificadorBlueprintsReal(CrearPlanDesdeBlueprints(REPOSITORIO))
+    especificacion = _especificacion()
+
+    rutas = planificador.obtener_rutas_generadas("crud_sqlite", especificacion)
+
+    assert rutas == set(REPOSITORIO.obtener_por_nombre("crud_sqlite").generar_plan(especificacion).obtener_rutas())
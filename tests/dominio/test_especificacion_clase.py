@@ -49,3 +49,49 @@ def test_clase_elimina_atributo() -> None:
 
     with pytest.raises(ErrorValidacionDominio, match="No existe"):
         clase.obtener_atributo(atributo.id_interno)
+
+
+def test_clase_permite_reutilizar_nombre_tras_eliminar_o_editar_atributo() -> None:
+    clase = EspecificacionClase(nombre="Pedido")
+    id_atributo = EspecificacionAtributo(nombre="id", tipo="str", obligatorio=True)
+    total = EspecificacionAtributo(nombre="total", tipo="float", obligatorio=True)
+    clase.agregar_atributo(id_atributo)
+    clase.agregar_atributo(total)
+
+    clase.editar_atributo(total.id_interno, "importe", "float", True, None)
+    clase.agregar_atributo(EspecificacionAtributo(nombre="total", tipo="int", obligatorio=False))
+    clase.eliminar_atributo(id_atributo.id_interno)
+    clase.agregar_atributo(EspecificacionAtributo(nombre="id", tipo="int", obligatorio=True))
+
+    with pytest.raises(ErrorValidacionDominio, match="Ya existe un atributo con nombre 'importe'"):
+        clase.editar_atributo(clase.atributos[1].id_interno, "importe", "int", False, None)
+    assert [atributo.nombre for atributo in clase.atributos] == ["importe", "total", "id"]
+
+
+def test_editar_atributo_conserva_marcas_de_indice_si_no_se_indican() -> None:
+    clase = EspecificacionClase(nombre="Cliente")
+    email = EspecificacionAtributo(nombre="email", tipo="str", obligatorio=True, unico=True)
+    clase.agregar_atributo(email)
+
+    conservado = clase.editar_atributo(email.id_interno, "correo", "str", True, None)
+    cambiado = clase.editar_atributo(email.id_interno, "correo", "str", True, None, indexado=True, unico=False)
+
+    assert (conservado.indexado, conservado.unico) == (False, True)
+    assert (cambiado.indexado, cambiado.unico) == (True, False)
+
+
+def test_clase_comparte_la_lista_del_llamador_y_su_indice_sigue_vigente() -> None:
+    atributos = [
+        EspecificacionAtributo(nombre="id", tipo="str", obligatorio=True),
+        EspecificacionAtributo(nombre="total", tipo="float", obligatorio=True),
+    ]
+    clase = EspecificacionClase(nombre="Pedido", atributos=atributos)
+
+    atributos.pop()
+    atributos.append(EspecificacionAtributo(nombre="fecha", tipo="str", obligatorio=False))
+    clase.agregar_atributo(EspecificacionAtributo(nombre="total", tipo="float", obligatorio=True))
+
+    assert clase.atributos is atributos
+    assert [atributo.nombre for atributo in atributos] == ["id", "fecha", "total"]
+    with pytest.raises(ErrorValidacionDominio, match="fecha"):
+        clase.agregar_atributo(EspecificacionAtributo(nombre="fecha", tipo="str", obligatorio=False))
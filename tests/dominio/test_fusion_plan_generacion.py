@@ -19,3 +19,50 @@ def test_validar_sin_conflictos_falla_con_ruta_duplicada() -> None:
 
     with pytest.raises(ErrorValidacionDominio, match="duplicadas"):
         plan_a.fusionar(plan_b)
+
+
+def test_incorporar_anexa_en_sitio_y_conserva_mensaje_de_conflicto() -> None:
+    plan = PlanGeneracion([ArchivoGenerado("README.md", "a")])
+    plan.incorporar(PlanGeneracion([ArchivoGenerado("VERSION", "1.0.0")]))
+
+    with pytest.raises(ErrorValidacionDominio, match=r"rutas duplicadas: \['README.md'\]"):
+        plan.incorporar(PlanGeneracion([ArchivoGenerado("README.md", "b"), ArchivoGenerado("otro.txt", "")]))
+
+    assert plan.obtener_rutas() == ["README.md", "VERSION"]
+
+
+def test_validar_sin_conflictos_detecta_archivos_agregados_tras_validar() -> None:
+    plan = PlanGeneracion([ArchivoGenerado("README.md", "a")])
+    plan.validar_sin_conflictos()
+    plan.agregar_archivo(ArchivoGenerado("README.md", "b"))
+
+    with pytest.raises(ErrorValidacionDominio, match="duplicadas"):
+        plan.validar_sin_conflictos()
+
+
+def test_validar_sin_conflictos_detecta_archivo_sustituido_tras_validar() -> None:
+    plan = PlanGeneracion([ArchivoGenerado("README.md", "a"), ArchivoGenerado("VERSION", "1")])
+    plan.validar_sin_conflictos()
+    plan.archivos[1] = ArchivoGenerado("README.md", "b")
+
+    with pytest.raises(ErrorValidacionDominio, match=r"rutas duplicadas: \['README.md'\]"):
+        plan.validar_sin_conflictos()
+
+
+def test_validar_sin_conflictos_detecta_pop_y_append_tras_validar() -> None:
+    plan = PlanGeneracion([ArchivoGenerado("README.md", "a"), ArchivoGenerado("VERSION", "1")])
+    plan.validar_sin_conflictos()
+    plan.archivos.pop()
+    plan.archivos.append(ArchivoGenerado("README.md", "b"))
+
+    with pytest.raises(ErrorValidacionDominio, match=r"rutas duplicadas: \['README.md'\]"):
+        plan.validar_sin_conflictos()
+
+
+def test_validar_sin_conflictos_reconstruye_si_la_lista_se_reasigna() -> None:
+    plan = PlanGeneracion([ArchivoGenerado("README.md", "a")])
+    plan.validar_sin_conflictos()
+    plan.archivos = [ArchivoGenerado("VERSION", "1"), ArchivoGenerado("VERSION", "2")]
+
+    with pytest.raises(ErrorValidacionDominio, match=r"rutas duplicadas: \['VERSION'\]"):
+        plan.validar_sin_conflictos()
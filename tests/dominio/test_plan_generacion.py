@@ -35,3 +35,15 @@ def test_comprobar_duplicados_permte_plan_unico() -> None:
     )
 
     plan.comprobar_duplicados()
+
+
+def test_plan_valida_los_archivos_que_el_llamador_anade_a_su_lista() -> None:
+    archivos = [ArchivoGenerado("README.md", "a")]
+    plan = PlanGeneracion(archivos=archivos)
+    plan.validar_sin_conflictos()
+
+    archivos.append(ArchivoGenerado("README.md", "b"))
+
+    assert plan.archivos is archivos
+    with pytest.raises(ErrorValidacionDominio, match="README.md"):
+        plan.validar_sin_conflictos()
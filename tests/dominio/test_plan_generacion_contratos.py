@@ -20,3 +20,19 @@ def test_plan_generacion_fusiona_y_mantiene_todas_las_rutas() -> None:
     fusion = plan_a.fusionar(plan_b)
 
     assert fusion.obtener_rutas() == ["a.txt", "b.txt"]
+
+
+def test_archivo_diferido_renderiza_solo_al_materializar() -> None:
+    llamadas: list[str] = []
+
+    def renderizar() -> str:
+        llamadas.append("render")
+        return "contenido"
+
+    plan = PlanGeneracion([ArchivoGenerado.diferido("a.txt", renderizar), ArchivoGenerado("b.txt", "B")])
+    plan.validar_sin_conflictos()
+
+    assert plan.obtener_rutas() == ["a.txt", "b.txt"]
+    assert llamadas == []
+    assert plan.materializar().archivos == [ArchivoGenerado("a.txt", "contenido"), ArchivoGenerado("b.txt", "B")]
+    assert llamadas == ["render"]
@@ -35,3 +35,14 @@ def test_renombrar_clase_a_nombre_existente_falla() -> None:
 
     with pytest.raises(ErrorValidacionDominio, match="clase"):
         proyecto.renombrar_clase(pedido.id_interno, "Cliente")
+
+
+def test_validar_proyecto_detecta_clase_sustituida_fuera_del_agregado() -> None:
+    proyecto = EspecificacionProyecto(nombre_proyecto="demo", ruta_destino="/tmp/demo")
+    proyecto.agregar_clase(EspecificacionClase(nombre="Cliente"))
+    proyecto.agregar_clase(EspecificacionClase(nombre="Pedido"))
+    proyecto.validar()
+    proyecto.clases[1] = EspecificacionClase(nombre="Cliente")
+
+    with pytest.raises(ErrorValidacionDominio, match="clases duplicadas"):
+        proyecto.validar()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from herramientas.benchmark_generacion import (
+    Escenario,
+    combinaciones_blueprints,
+    comparar_con_linea_base,
+    construir_especificacion_sintetica,
+    construir_informe,
+    ejecutar_benchmark,
+)
+
+
+def test_especificacion_sintetica_es_determinista() -> None:
+    primera = construir_especificacion_sintetica(3, 5, "/tmp/destino")
+    segunda = construir_especificacion_sintetica(3, 5, "/tmp/destino")
+
+    assert [clase.nombre for clase in primera.clases] == ["Entidad0000", "Entidad0001", "Entidad0002"]
+    assert [(atributo.nombre, atributo.tipo) for atributo in primera.clases[0].atributos] == [
+        (atributo.nombre, atributo.tipo) for atributo in segunda.clases[0].atributos
+    ]
+    assert len(primera.clases[2].atributos) == 5
+
+
+def test_combinaciones_excluyen_dos_crud_completos() -> None:
+    combinaciones = combinaciones_blueprints(["base_clean_arch", "crud_json", "crud_sqlite", "export_csv"])
+
+    assert ("base_clean_arch",) in combinaciones
+    assert ("base_clean_arch", "crud_json", "export_csv") in combinaciones
+    assert all(not {"crud_json", "crud_sqlite"} <= set(combinacion) for combinacion in combinaciones)
+
+
+def test_benchmark_mide_escenario_y_genera_informe(tmp_path: Path) -> None:
+    resultados = ejecutar_benchmark(
+        [Escenario(clases=2, atributos=2, blueprints=("base_clean_arch", "crud_json"))],
+        aislar_procesos=False,
+    )
+
+    informe = construir_informe(resultados)
+    escenario = informe["escenarios"][0]
+    assert escenario["escenario"] == "c2_a2_base_clean_arch+crud_json"
+    assert escenario["archivos"] > 0
+    assert escenario["archivos_por_segundo"] > 0
+    assert set(escenario["etapas"]) >= {"crear_plan", "generar_manifest", "auditoria", "auditoria_arquitectura"}
+    json.dumps(informe)
+
+
+def test_comparacion_detecta_solo_regresiones_fuera_de_tolerancia() -> None:
+    linea_base = {
+        "escenarios": [
+            {"escenario": "lento", "segundos_total": 1.0, "rss_pico_kb": 1000, "archivos_por_segundo": 100.0},
+            {"escenario": "estable", "segundos_total": 1.0, "rss_pico_kb": 1000, "archivos_por_segundo": 100.0},
+            {"escenario": "ruido", "segundos_total": 0.01, "rss_pico_kb": 1000, "archivos_por_segundo": 100.0},
+        ]
+    }
+    actual = {
+        "escenarios": [
+            {"escenario": "lento", "segundos_total": 2.0, "rss_pico_kb": 1000, "archivos_por_segundo": 50.0},
+            {"escenario": "estable", "segundos_total": 0.5, "rss_pico_kb": 1100, "archivos_por_segundo": 200.0},
+            {"escenario": "ruido", "segundos_total": 0.05, "rss_pico_kb": 1000, "archivos_por_segundo": 20.0},
+            {"escenario": "nuevo", "segundos_total": 9.0, "rss_pico_kb": 1000, "archivos_por_segundo": 1.0},
+        ]
+    }
+
+    regresiones = comparar_con_linea_base(actual, linea_base, tolerancia=0.25)
+
+    assert {(regresion.escenario, regresion.metrica) for regresion in regresiones} == {
+        ("lento", "segundos_total"),
+        ("lento", "archivos_por_segundo"),
+    }
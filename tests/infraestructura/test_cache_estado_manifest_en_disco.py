@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from aplicacion.puertos.manifest import EstadoArchivoManifest
+from infraestructura.manifest_en_disco import CacheEstadoManifestEnDisco
+
+
+def test_cache_estado_manifest_en_disco_persiste_y_recarga(tmp_path: Path) -> None:
+    cache = CacheEstadoManifestEnDisco()
+    estados = {"README.md": EstadoArchivoManifest(mtime_ns=1, tamano=2, inodo=3, hash_sha256="abc")}
+
+    cache.guardar(str(tmp_path), estados)
+
+    assert (tmp_path / CacheEstadoManifestEnDisco.NOMBRE_ARCHIVO).exists()
+    assert cache.cargar(str(tmp_path)) == estados
+
+
+def test_cache_estado_manifest_en_disco_corrupto_equivale_a_vacio(tmp_path: Path) -> None:
+    (tmp_path / CacheEstadoManifestEnDisco.NOMBRE_ARCHIVO).write_text("{no json", encoding="utf-8")
+
+    assert CacheEstadoManifestEnDisco().cargar(str(tmp_path)) == {}
+    assert CacheEstadoManifestEnDisco().cargar(str(tmp_path / "inexistente")) == {}
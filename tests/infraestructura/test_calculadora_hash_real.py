@@ -12,3 +12,10 @@ def test_calculadora_hash_real_calcula_sha256(tmp_path: Path) -> None:
 
     esperado = hashlib.sha256("contenido".encode("utf-8")).hexdigest()
     assert hash_real == esperado
+
+
+def test_calculadora_hash_real_cumple_puerto_de_auditoria(tmp_path: Path) -> None:
+    ruta = tmp_path / "archivo.bin"
+    ruta.write_bytes(b"\x00" * 100_000)
+
+    assert CalculadoraHashReal().calcular_hash_archivo(ruta) == hashlib.sha256(b"\x00" * 100_000).hexdigest()
@@ -8,6 +8,7 @@ from aplicacion.casos_uso.crear_plan_desde_blueprints import CrearPlanDesdeBluep
 from aplicacion.puertos.blueprint import Blueprint, RepositorioBlueprints
 from aplicacion.errores import ErrorValidacion
 from dominio.modelos import EspecificacionProyecto
+from infraestructura.plugins import catalogo_plugins
 from infraestructura.plugins.descubridor_plugins import DescubridorPlugins
 
 
@@ -80,3 +81,107 @@ def test_plugin_incompatible_retorna_error_controlado(tmp_path) -> None:
 
     with pytest.raises(ErrorValidacion, match="Plugin incompatible"):
         caso_uso.ejecutar(EspecificacionProyecto("Demo", "/tmp/demo"), ["api_fastapi"])
+
+
+def _crear_plugin(raiz, nombre: str = "api_fastapi") -> None:  # type: ignore[no-untyped-def]
+    ruta_plugin = raiz / nombre
+    (ruta_plugin / "templates").mkdir(parents=True)
+    (ruta_plugin / "templates" / "archivo.txt").write_text("ok", encoding="utf-8")
+    (ruta_plugin / "blueprint.json").write_text(
+        json.dumps(
+            {
+                "nombre": nombre,
+                "version": "1.0.0",
+                "descripcion": "API",
+                "compatible_con": ["base_clean_arch"],
+                "capas": ["presentacion"],
+                "requiere": [],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_catalogo_no_reparsea_metadata_sin_cambios(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _crear_plugin(tmp_path / "plugins")
+    lecturas: list[object] = []
+    cargar_original = catalogo_plugins._cargar_metadata
+    monkeypatch.setattr(
+        catalogo_plugins,
+        "_cargar_metadata",
+        lambda *args: lecturas.append(args) or cargar_original(*args),
+    )
+    descubridor = DescubridorPlugins(str(tmp_path / "plugins"))
+
+    descubridor.cargar_plugin("api_fastapi")
+    descubridor.cargar_plugin("api_fastapi")
+
+    assert len(lecturas) == 1
+
+
+def test_catalogo_persistido_se_reutiliza_entre_instancias(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _crear_plugin(tmp_path / "plugins")
+    ruta_cache = tmp_path / "cache" / "catalogo_plugins.json"
+    DescubridorPlugins(str(tmp_path / "plugins"), ruta_cache_catalogo=str(ruta_cache)).listar_plugins()
+    monkeypatch.setattr(catalogo_plugins, "_cargar_metadata", lambda *args: pytest.fail("no debe releer"))
+
+    plugins = DescubridorPlugins(str(tmp_path / "plugins"), ruta_cache_catalogo=str(ruta_cache)).listar_plugins()
+
+    assert ruta_cache.exists()
+    assert [plugin.nombre for plugin in plugins] == ["api_fastapi"]
+
+
+def test_snapshot_templates_se_reutiliza_y_se_invalida(tmp_path) -> None:
+    _crear_plugin(tmp_path / "plugins")
+    descubridor = DescubridorPlugins(str(tmp_path / "plugins"))
+    especificacion = EspecificacionProyecto("Demo", "/tmp/demo")
+
+    primer_plan = descubridor.cargar_plugin("api_fastapi").generar_plan(especificacion)
+    segundo_plan = descubridor.cargar_plugin("api_fastapi").generar_plan(especificacion)
+    (tmp_path / "plugins" / "api_fastapi" / "templates" / "nuevo.txt").write_text("nuevo", encoding="utf-8")
+    plan_dentro_del_ttl = descubridor.cargar_plugin("api_fastapi").generar_plan(especificacion)
+    descubridor.invalidar()
+    tercer_plan = descubridor.cargar_plugin("api_fastapi").generar_plan(especificacion)
+
+    assert primer_plan.archivos[0] is segundo_plan.archivos[0]
+    assert plan_dentro_del_ttl.obtener_rutas() == ["archivo.txt"]
+    assert tercer_plan.obtener_rutas() == ["archivo.txt", "nuevo.txt"]
+
+
+def test_cargar_plugin_resuelve_por_indice_sin_relistar(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _crear_plugin(tmp_path / "plugins")
+    descubridor = DescubridorPlugins(str(tmp_path / "plugins"))
+    descubridor.cargar_plugin("api_fastapi")
+    monkeypatch.setattr(descubridor, "listar_plugins", lambda: pytest.fail("no debe relistar"))
+
+    assert descubridor.cargar_plugin("api_fastapi").nombre() == "api_fastapi"
+
+
+def test_cargar_plugin_relista_si_el_nombre_no_esta_indexado(tmp_path) -> None:
+    descubridor = DescubridorPlugins(str(tmp_path / "plugins"))
+    with pytest.raises(ValueError, match="Plugin no encontrado"):
+        descubridor.cargar_plugin("api_fastapi")
+    _crear_plugin(tmp_path / "plugins")
+
+    assert descubridor.cargar_plugin("api_fastapi").nombre() == "api_fastapi"
+
+
+def test_fallo_al_guardar_catalogo_no_rompe_descubrimiento(tmp_path, caplog: pytest.LogCaptureFixture) -> None:
+    _crear_plugin(tmp_path / "plugins")
+    (tmp_path / "bloqueo").write_text("no es un directorio", encoding="utf-8")
+    ruta_cache = tmp_path / "bloqueo" / "catalogo_plugins.json"
+
+    plugins = DescubridorPlugins(str(tmp_path / "plugins"), ruta_cache_catalogo=str(ruta_cache)).listar_plugins()
+
+    assert [plugin.nombre for plugin in plugins] == ["api_fastapi"]
+    assert "No se pudo guardar la caché de plugins" in caplog.text
+
+
+def test_plugin_obtener_rutas_coincide_con_plan(tmp_path) -> None:
+    _crear_plugin(tmp_path / "plugins")
+    (tmp_path / "plugins" / "api_fastapi" / "templates" / "sub").mkdir()
+    (tmp_path / "plugins" / "api_fastapi" / "templates" / "sub" / "modulo.py").write_text("x = 1\n", encoding="utf-8")
+    plugin = DescubridorPlugins(str(tmp_path / "plugins")).cargar_plugin("api_fastapi")
+    especificacion = EspecificacionProyecto("Demo", "/tmp/demo")
+
+    assert plugin.obtener_rutas(especificacion) == plugin.generar_plan(especificacion).obtener_rutas()
@@ -21,3 +21,15 @@ def test_filtro_logs_oculta_password() -> None:
     assert "abcd1234" not in mensaje
     assert "password=***" in mensaje
     assert "token=***" in mensaje
+
+
+def test_filtro_logs_conserva_argumentos_sin_palabras_sensibles() -> None:
+    filtro = FiltroSecretos()
+    record = logging.makeLogRecord(
+        {"msg": "%d archivos en %.2f s para %s", "args": (12, 0.5, "proyecto"), "levelno": logging.INFO}
+    )
+
+    filtro.filter(record)
+
+    assert record.args == (12, 0.5, "proyecto")
+    assert record.getMessage() == "12 archivos en 0.50 s para proyecto"
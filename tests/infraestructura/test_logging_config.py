@@ -1,8 +1,19 @@
+from concurrent.futures import ProcessPoolExecutor
 import logging
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 import sys
 
-from infraestructura.logging_config import configurar_logging
+from infraestructura.logging_config import (
+    configurar_logging,
+    configurar_logging_proceso,
+    detener_logging,
+    reenviar_logs_de_procesos,
+)
+
+
+def _registrar_desde_worker(indice: int) -> None:
+    logging.getLogger("prueba_worker").error("fallo en worker %s con token=%s", indice, "oculto")
 
 
 def test_configurar_logging_crea_archivos_y_filtra_secretos(tmp_path: Path) -> None:
@@ -27,3 +38,45 @@ def test_configurar_logging_instala_excepthook() -> None:
     anterior = sys.excepthook
     configurar_logging("logs")
     assert sys.excepthook is not anterior
+
+
+def test_configurar_logging_asincrono_escribe_tras_detener(tmp_path: Path) -> None:
+    configurar_logging(str(tmp_path), asincrono=True)
+    try:
+        assert not any(isinstance(handler, RotatingFileHandler) for handler in logging.getLogger().handlers)
+        logging.getLogger("prueba_asincrona").error("fallo con password=%s", "oculta")
+    finally:
+        detener_logging()
+
+    assert "password=***" in (tmp_path / "seguimiento.log").read_text(encoding="utf-8")
+    crashes = (tmp_path / "crashes.log").read_text(encoding="utf-8")
+    assert "fallo con" in crashes
+    assert "oculta" not in crashes
+
+
+def test_configurar_logging_aplica_niveles_por_logger(tmp_path: Path) -> None:
+    configurar_logging(str(tmp_path), niveles={"prueba_bucle": "INFO"})
+    logger = logging.getLogger("prueba_bucle")
+
+    logger.debug("detalle por iteración")
+    logger.info("resumen del bucle")
+
+    contenido = (tmp_path / "seguimiento.log").read_text(encoding="utf-8")
+    assert "resumen del bucle" in contenido
+    assert "detalle por iteración" not in contenido
+    logger.setLevel(logging.NOTSET)
+
+
+def test_logs_de_procesos_hijos_llegan_a_los_handlers_del_padre(tmp_path: Path) -> None:
+    configurar_logging(str(tmp_path), asincrono=True)
+    try:
+        with reenviar_logs_de_procesos() as cola, ProcessPoolExecutor(
+            max_workers=2, initializer=configurar_logging_proceso, initargs=(cola,)
+        ) as pool:
+            list(pool.map(_registrar_desde_worker, range(4)))
+    finally:
+        detener_logging()
+
+    crashes = (tmp_path / "crashes.log").read_text(encoding="utf-8")
+    assert sorted(linea.split("fallo en worker ")[1][0] for linea in crashes.splitlines()) == ["0", "1", "2", "3"]
+    assert "oculto" not in crashes
@@ -1,3 +1,11 @@
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+from aplicacion.errores import ErrorBlueprintNoEncontrado
+from infraestructura.blueprints.registro_blueprints import RegistroBlueprints
 from infraestructura.repositorio_blueprints_en_disco import RepositorioBlueprintsEnDisco
 
 
@@ -18,3 +26,89 @@ def test_obtener_por_nombre_retorna_blueprint() -> None:
     blueprint = repositorio.obtener_por_nombre("base_clean_arch")
 
     assert blueprint.version() == "1.0.0"
+
+
+def test_obtener_por_nombre_no_importa_blueprints_ajenos() -> None:
+    codigo = (
+        "import sys\n"
+        "from infraestructura.repositorio_blueprints_en_disco import RepositorioBlueprintsEnDisco\n"
+        "RepositorioBlueprintsEnDisco('blueprints').obtener_por_nombre('crud_sqlite')\n"
+        "print('blueprints.export_pdf_v1.blueprint' in sys.modules)\n"
+    )
+
+    resultado = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True)
+
+    assert resultado.stdout.strip() == "False"
+
+
+def _crear_blueprint(raiz: Path, carpeta: str, nombre: str) -> None:
+    (raiz / carpeta).mkdir()
+    (raiz / carpeta / "__init__.py").write_text("", encoding="utf-8")
+    (raiz / carpeta / "blueprint.py").write_text(
+        "from aplicacion.puertos.blueprint import Blueprint\n"
+        "from dominio.plan_generacion import PlanGeneracion\n\n\n"
+        f"class Blueprint{carpeta.title().replace('_', '')}(Blueprint):\n"
+        f"    def nombre(self):\n        return '{nombre}'\n\n"
+        "    def version(self):\n        return '1.0.0'\n\n"
+        "    def validar(self, especificacion):\n        return None\n\n"
+        "    def generar_plan(self, especificacion):\n        return PlanGeneracion()\n",
+        encoding="utf-8",
+    )
+
+
+def test_registro_se_invalida_al_agregar_carpeta(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    raiz = tmp_path / "blueprints_registro_tmp"
+    raiz.mkdir()
+    (raiz / "__init__.py").write_text("", encoding="utf-8")
+    _crear_blueprint(raiz, "demo_v1", "demo")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    repositorio = RepositorioBlueprintsEnDisco(str(raiz))
+
+    assert repositorio.obtener_por_nombre("demo").nombre() == "demo"
+    with pytest.raises(ErrorBlueprintNoEncontrado):
+        repositorio.obtener_por_nombre("nuevo")
+
+    _crear_blueprint(raiz, "nuevo_v1", "nuevo")
+
+    assert repositorio.obtener_por_nombre("nuevo").nombre() == "nuevo"
+    assert [blueprint.nombre() for blueprint in repositorio.listar_blueprints()] == ["demo", "nuevo"]
+
+
+def test_registro_reintenta_carpeta_cuya_importacion_fallo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    raiz = tmp_path / "blueprints_registro_roto"
+    raiz.mkdir()
+    (raiz / "__init__.py").write_text("", encoding="utf-8")
+    _crear_blueprint(raiz, "demo_v1", "demo")
+    (raiz / "roto_v1").mkdir()
+    (raiz / "roto_v1" / "__init__.py").write_text("", encoding="utf-8")
+    (raiz / "roto_v1" / "blueprint.py").write_text("raise RuntimeError('blueprint roto')\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    repositorio = RepositorioBlueprintsEnDisco(str(raiz))
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="blueprint roto"):
+            repositorio.obtener_por_nombre("roto")
+        with pytest.raises(RuntimeError, match="blueprint roto"):
+            repositorio.listar_blueprints()
+    assert repositorio.obtener_por_nombre("demo").nombre() == "demo"
+
+
+def test_registro_no_reescanea_dentro_del_ttl_salvo_invalidacion(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    raiz = tmp_path / "blueprints_registro_ttl"
+    raiz.mkdir()
+    (raiz / "__init__.py").write_text("", encoding="utf-8")
+    _crear_blueprint(raiz, "demo_v1", "demo")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    registro = RegistroBlueprints(raiz, ttl_segundos=3600)
+    assert [clase().nombre() for clase in registro.listar_clases()] == ["demo"]
+
+    _crear_blueprint(raiz, "otro_v1", "otro")
+    monkeypatch.setattr(Path, "iterdir", lambda _: pytest.fail("la huella no debe recalcularse"))
+    assert [clase().nombre() for clase in registro.listar_clases()] == ["demo"]
+    monkeypatch.undo()
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    registro.invalidar()
+    assert [clase().nombre() for clase in registro.listar_clases()] == ["demo", "otro"]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from infraestructura.sistema_archivos_real import SistemaArchivosReal
+
+
+@pytest.mark.parametrize("modo", ["rapida", "atomica", "duradera"])
+def test_cada_modo_escribe_lote_y_devuelve_hash_de_los_bytes(tmp_path: Path, modo: str) -> None:
+    (tmp_path / "pkg").mkdir()
+    escrituras = [(str(tmp_path / "pkg" / f"m{indice}.py"), f"valor = 'ñ{indice}'\n") for indice in range(6)]
+
+    hashes = SistemaArchivosReal(max_hilos_escritura=3, modo_durabilidad=modo).escribir_lote_atomico(escrituras)
+
+    assert hashes == [hashlib.sha256(contenido.encode("utf-8")).hexdigest() for _, contenido in escrituras]
+    assert sorted(ruta.name for ruta in (tmp_path / "pkg").iterdir()) == [f"m{indice}.py" for indice in range(6)]
+
+
+def test_modo_duradero_sincroniza_cada_directorio_una_vez(tmp_path: Path, monkeypatch) -> None:
+    sincronizados: list[int] = []
+    fsync_original = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda descriptor: sincronizados.append(descriptor) or fsync_original(descriptor))
+    for nombre in ("a", "b"):
+        (tmp_path / nombre).mkdir()
+    escrituras = [(str(tmp_path / nombre / f"{indice}.txt"), "x") for nombre in ("a", "b") for indice in range(3)]
+
+    SistemaArchivosReal(modo_durabilidad="duradera").escribir_lote_atomico(escrituras)
+
+    if os.name == "nt":
+        assert len(sincronizados) == 6
+    else:
+        assert len(sincronizados) == 6 + 2
+
+
+def test_modo_rapido_no_usa_temporales(tmp_path: Path, monkeypatch) -> None:
+    def _sin_temporal(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("El modo rápido escribe directamente")
+
+    monkeypatch.setattr(SistemaArchivosReal, "_escribir_con_temporal", _sin_temporal)
+
+    SistemaArchivosReal(modo_durabilidad="rapida").escribir_texto_atomico(str(tmp_path / "nuevo" / "a.txt"), "hola")
+
+    assert (tmp_path / "nuevo" / "a.txt").read_text(encoding="utf-8") == "hola"
+
+
+def test_modo_atomico_limpia_temporal_si_falla_el_reemplazo(tmp_path: Path, monkeypatch) -> None:
+    def _replace_fallido(origen, destino):  # type: ignore[no-untyped-def]
+        raise OSError("disco lleno")
+
+    monkeypatch.setattr(os, "replace", _replace_fallido)
+
+    with pytest.raises(OSError):
+        SistemaArchivosReal().escribir_texto_atomico(str(tmp_path / "a.txt"), "hola")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_modo_desconocido_se_rechaza() -> None:
+    with pytest.raises(ValueError):
+        SistemaArchivosReal(modo_durabilidad="temeraria")  # type: ignore[arg-type]
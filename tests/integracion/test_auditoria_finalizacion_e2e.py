@@ -61,7 +61,8 @@ def test_e2e_conflicto_duplicados_corta_antes_de_generar(tmp_path: Path) -> None
         DtoAuditoriaFinalizacionEntrada(
             ruta_preset=str(_preset(tmp_path)),
             ruta_salida_auditoria=str(tmp_path / "sandbox" / "conflicto"),
-        )
+        ),
+        ruta_evidencias=str(tmp_path / "evidencias"),
     )
 
     assert any(etapa.estado == "FAIL" for etapa in salida.etapas if etapa.nombre == "Preflight conflictos de rutas")
@@ -80,7 +81,8 @@ def test_e2e_happy_path_genera_salida_exitosa(tmp_path: Path) -> None:
         DtoAuditoriaFinalizacionEntrada(
             ruta_preset=str(_preset(tmp_path)),
             ruta_salida_auditoria=str(tmp_path / "sandbox" / "ok"),
-        )
+        ),
+        ruta_evidencias=str(tmp_path / "evidencias"),
     )
 
     assert salida.exito_global is True
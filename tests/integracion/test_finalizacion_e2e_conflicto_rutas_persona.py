@@ -45,7 +45,8 @@ def test_finalizacion_preflight_conflicto_rutas_persona(tmp_path: Path) -> None:
     )
 
     salida = caso.ejecutar(
-        DtoAuditoriaFinalizacionEntrada(ruta_preset=str(preset), ruta_salida_auditoria=str(tmp_path / "sandbox"))
+        DtoAuditoriaFinalizacionEntrada(ruta_preset=str(preset), ruta_salida_auditoria=str(tmp_path / "sandbox")),
+        ruta_evidencias=str(tmp_path / "evidencias"),
     )
 
     etapa = next(et for et in salida.etapas if et.nombre == "Preflight conflictos de rutas")
@@ -37,7 +37,8 @@ def test_finalizacion_preflight_validacion_blueprint_crud_json_sin_clases(tmp_pa
     caso = AuditarFinalizacionProyecto(CrearPlanNoUsado(), GeneradorNoUsado(), AuditorNoUsado(), EjecutorNoUsado())
 
     salida = caso.ejecutar(
-        DtoAuditoriaFinalizacionEntrada(ruta_preset=str(preset), ruta_salida_auditoria=str(tmp_path / "sandbox"))
+        DtoAuditoriaFinalizacionEntrada(ruta_preset=str(preset), ruta_salida_auditoria=str(tmp_path / "sandbox")),
+        ruta_evidencias=str(tmp_path / "evidencias"),
     )
 
     etapa = next(et for et in salida.etapas if et.nombre == "Preflight validación entrada")
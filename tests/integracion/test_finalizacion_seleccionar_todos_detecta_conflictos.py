@@ -62,7 +62,8 @@ def test_finalizacion_seleccionar_todos_detecta_conflictos(tmp_path: Path) -> No
         DtoAuditoriaFinalizacionEntrada(
             ruta_preset=str(_preset_seleccionar_todos(tmp_path)),
             ruta_salida_auditoria=str(tmp_path / "sandbox"),
-        )
+        ),
+        ruta_evidencias=str(tmp_path / "evidencias"),
     )
 
     etapa_validacion = next(etapa for etapa in salida.etapas if etapa.nombre == "Preflight validación entrada")
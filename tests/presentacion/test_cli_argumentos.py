@@ -27,7 +27,11 @@ def test_parser_generar_reconoce_argumentos() -> None:
         preset="a.json",
         destino="salida",
         patch=True,
+        sincronizar=False,
+        restaurar_editados=False,
+        perfil=False,
         blueprint=["api_fastapi", "crud_json"],
+        durabilidad=None,
     )
 
 
@@ -53,7 +57,7 @@ def test_parser_auditar_finalizacion_reconoce_argumentos() -> None:
     )
 
 def test_main_invoca_comando_generar(monkeypatch) -> None:
-    monkeypatch.setattr(cli, "configurar_logging", lambda _: None)
+    monkeypatch.setattr(cli, "configurar_logging", lambda _, **__: None)
     monkeypatch.setattr(cli, "construir_contenedor_cli", lambda: SimpleNamespace())
     monkeypatch.setattr(cli, "_ejecutar_generar", lambda args, _: 0)
 
@@ -62,8 +66,20 @@ def test_main_invoca_comando_generar(monkeypatch) -> None:
     assert resultado == 0
 
 
+def test_main_pasa_modo_durabilidad_al_contenedor(monkeypatch) -> None:
+    recibidos: list[dict[str, str]] = []
+    monkeypatch.setattr(cli, "configurar_logging", lambda _, **__: None)
+    monkeypatch.setattr(cli, "construir_contenedor_cli", lambda **kwargs: recibidos.append(kwargs) or SimpleNamespace())
+    monkeypatch.setattr(cli, "_ejecutar_generar", lambda args, _: 0)
+
+    resultado = cli.main(["generar", "--preset", "a.json", "--destino", "salida", "--durabilidad", "rapida"])
+
+    assert resultado == 0
+    assert recibidos == [{"modo_durabilidad": "rapida"}]
+
+
 def test_main_invoca_comando_validar(monkeypatch) -> None:
-    monkeypatch.setattr(cli, "configurar_logging", lambda _: None)
+    monkeypatch.setattr(cli, "configurar_logging", lambda _, **__: None)
     monkeypatch.setattr(cli, "construir_contenedor_cli", lambda: SimpleNamespace())
     monkeypatch.setattr(cli, "_ejecutar_validar_preset", lambda args, _: 0)
 
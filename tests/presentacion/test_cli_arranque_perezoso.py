@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+RAIZ_REPO = Path(__file__).resolve().parents[2]
+
+# Presupuesto holgado: el arranque perezoso ronda los 50 ms y el ensamblado completo superaba 250 ms.
+# Depende de la máquina, así que solo se comprueba con MEDIR_ARRANQUE_CLI=1.
+PRESUPUESTO_IMPORTACION_MS = 150
+MEDIR_ARRANQUE = os.environ.get("MEDIR_ARRANQUE_CLI") == "1"
+
+MODULOS_PESADOS = (
+    "aplicacion.casos_uso.auditar_finalizacion_proyecto",
+    "aplicacion.casos_uso.auditar_proyecto_generado",
+    "aplicacion.casos_uso.auditoria.auditar_proyecto_generado",
+    "aplicacion.casos_uso.generacion.generar_proyecto_mvp",
+    "aplicacion.casos_uso.crear_plan_desde_blueprints",
+    "infraestructura.blueprints.metadata_registry",
+    "infraestructura.bootstrap.bootstrap_gui",
+    "infraestructura.seguridad",
+)
+
+
+def _modulos_cargados(codigo: str) -> set[str]:
+    resultado = subprocess.run(
+        [sys.executable, "-c", f"{codigo}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        cwd=RAIZ_REPO,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(resultado.stdout.split())
+
+
+def test_importar_cli_no_carga_casos_de_uso() -> None:
+    cargados = _modulos_cargados("import presentacion.cli.__main__")
+
+    assert cargados.isdisjoint(MODULOS_PESADOS), sorted(cargados.intersection(MODULOS_PESADOS))
+
+
+def test_validar_preset_solo_construye_sus_proveedores() -> None:
+    cargados = _modulos_cargados(
+        "from infraestructura.bootstrap.bootstrap_cli import construir_contenedor_cli\n"
+        "construir_contenedor_cli().cargar_preset_proyecto"
+    )
+
+    assert "aplicacion.casos_uso.presets" in cargados
+    assert cargados.isdisjoint(MODULOS_PESADOS), sorted(cargados.intersection(MODULOS_PESADOS))
+
+
+def test_auditar_no_carga_blueprints_ni_generacion() -> None:
+    cargados = _modulos_cargados(
+        "from infraestructura.bootstrap.bootstrap_cli import construir_contenedor_cli\n"
+        "construir_contenedor_cli().auditar_proyecto"
+    )
+
+    assert "aplicacion.casos_uso.auditar_proyecto_generado" in cargados
+    assert "aplicacion.casos_uso.generacion.generar_proyecto_mvp" not in cargados
+    assert "infraestructura.repositorio_blueprints_en_disco" not in cargados
+
+
+@pytest.mark.skipif(not MEDIR_ARRANQUE, reason="medición de tiempos opcional: exportar MEDIR_ARRANQUE_CLI=1")
+def test_importacion_de_cli_respeta_presupuesto() -> None:
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import presentacion.cli.__main__"],
+        cwd=RAIZ_REPO,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    linea_cli = next(
+        linea for linea in resultado.stderr.splitlines() if linea.rstrip().endswith("| presentacion.cli.__main__")
+    )
+    acumulado_us = int(linea_cli.split("|")[1])
+
+    assert acumulado_us / 1000 < PRESUPUESTO_IMPORTACION_MS
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from argparse import Namespace
+import json
 from dataclasses import dataclass
 from pathlib import Path
 from types import SimpleNamespace
@@ -61,7 +62,7 @@ def test_comando_generar_happy_path(tmp_path: Path) -> None:
 def test_main_devuelve_codigo_error_validacion(monkeypatch, tmp_path: Path) -> None:
     contenedor = SimpleNamespace()
     contenedor.cargar_preset_proyecto = _CasoUsoStub(ErrorValidacion("preset inválido"))
-    monkeypatch.setattr(cli_main, "configurar_logging", lambda _: None)
+    monkeypatch.setattr(cli_main, "configurar_logging", lambda _, **__: None)
     monkeypatch.setattr(cli_main, "construir_contenedor_cli", lambda: contenedor)
     monkeypatch.setattr(
         cli_main.argparse.ArgumentParser,
@@ -77,7 +78,7 @@ def test_main_devuelve_codigo_error_validacion(monkeypatch, tmp_path: Path) -> N
 def test_main_devuelve_codigo_error_tecnico(monkeypatch, tmp_path: Path) -> None:
     contenedor = SimpleNamespace()
     contenedor.cargar_preset_proyecto = _CasoUsoStub(ValueError("fallo técnico"))
-    monkeypatch.setattr(cli_main, "configurar_logging", lambda _: None)
+    monkeypatch.setattr(cli_main, "configurar_logging", lambda _, **__: None)
     monkeypatch.setattr(cli_main, "construir_contenedor_cli", lambda: contenedor)
     monkeypatch.setattr(
         cli_main.argparse.ArgumentParser,
@@ -138,3 +139,46 @@ def test_comando_generar_patch_forzado(tmp_path: Path) -> None:
 
     assert contenedor.crear_plan_patch_desde_blueprints.llamadas
     assert contenedor.actualizar_manifest_patch.llamadas
+
+
+def test_comando_generar_sincronizar_con_manifest_existente(tmp_path: Path) -> None:
+    (tmp_path / "manifest.json").write_text("{}", encoding="utf-8")
+    preset = PresetProyecto(
+        nombre="sync",
+        especificacion=EspecificacionProyecto(nombre_proyecto="app", ruta_destino="base"),
+        blueprints=["crud_json"],
+    )
+    contenedor = _crear_contenedor(preset)
+    contenedor.sincronizar_proyecto = _CasoUsoStub(SimpleNamespace(resumen=lambda: "sin cambios=1"))
+
+    ejecutar_comando_generar(
+        Namespace(preset="sync", destino=str(tmp_path), patch=False, sincronizar=True, blueprint=[]),
+        contenedor,
+    )
+
+    args, kwargs = contenedor.sincronizar_proyecto.llamadas[0]
+    assert args[1] == str(tmp_path)
+    assert kwargs["blueprints"] == ["crud_json"]
+    assert kwargs["restaurar_editados"] is False
+    assert not contenedor.ejecutar_plan.llamadas
+    assert not contenedor.crear_plan_patch_desde_blueprints.llamadas
+
+
+def test_comando_generar_con_perfil_escribe_traza_junto_al_destino(tmp_path: Path) -> None:
+    preset = PresetProyecto(
+        nombre="demo",
+        especificacion=EspecificacionProyecto(nombre_proyecto="app", ruta_destino="original"),
+        blueprints=["crud_json"],
+        metadata={},
+    )
+    destino = tmp_path / "app"
+
+    codigo = ejecutar_comando_generar(
+        Namespace(preset="demo", destino=str(destino), patch=False, blueprint=[], perfil=True),
+        _crear_contenedor(preset),
+    )
+
+    assert codigo == 0
+    traza = json.loads((tmp_path / "app.traza.json").read_text(encoding="utf-8"))
+    assert traza["spans"][0]["nombre"] == "generar"
+    assert traza["spans"][0]["atributos"] == {"preset": "demo"}
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from argparse import Namespace
+import io
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from aplicacion.errores import ErrorValidacion
+from dominio.especificacion import EspecificacionProyecto
+from dominio.preset.preset_proyecto import PresetProyecto
+from infraestructura.logging_config import configurar_logging, detener_logging
+from presentacion.cli.comandos.comando_generar_lote import ejecutar_comando_generar_lote
+import presentacion.cli.__main__ as cli_main
+
+
+class _CargarPresetStub:
+    def ejecutar(self, nombre_preset: str) -> PresetProyecto:
+        if "roto" in nombre_preset:
+            raise ErrorValidacion(f"Preset inválido: {nombre_preset}")
+        if "sin_permiso" in nombre_preset:
+            raise PermissionError(f"Permiso denegado: {nombre_preset}")
+        if "inesperado" in nombre_preset:
+            raise AttributeError("atributo ausente")
+        if "caido" in nombre_preset:
+            os._exit(1)
+        return PresetProyecto(
+            nombre=Path(nombre_preset).stem,
+            especificacion=EspecificacionProyecto(nombre_proyecto="app", ruta_destino="base"),
+            blueprints=["crud_json"],
+        )
+
+
+class _RegistroStub:
+    def __init__(self) -> None:
+        self.llamadas: list[dict] = []
+
+    def ejecutar(self, *args, **kwargs):
+        self.llamadas.append(kwargs)
+        return {"plan": "base"}
+
+
+def _crear_contenedor() -> SimpleNamespace:
+    return SimpleNamespace(
+        cargar_preset_proyecto=_CargarPresetStub(),
+        crear_plan_desde_blueprints=_RegistroStub(),
+        crear_plan_patch_desde_blueprints=_RegistroStub(),
+        ejecutar_plan=_RegistroStub(),
+        actualizar_manifest_patch=_RegistroStub(),
+    )
+
+
+def _no_construir_contenedor() -> SimpleNamespace:
+    raise AssertionError("Con un solo proceso no debe construirse otro contenedor")
+
+
+def test_generar_lote_continua_tras_un_preset_fallido(tmp_path: Path) -> None:
+    presets = tmp_path / "presets"
+    presets.mkdir()
+    for nombre in ("a", "roto", "c"):
+        (presets / f"{nombre}.json").write_text("{}", encoding="utf-8")
+    contenedor = _crear_contenedor()
+
+    codigo = ejecutar_comando_generar_lote(
+        Namespace(presets=str(presets), destino_base=str(tmp_path / "salida"), procesos=1, sincronizar=False),
+        contenedor,
+        _no_construir_contenedor,
+    )
+
+    assert codigo == 1
+    destinos = [llamada["ruta_destino"] for llamada in contenedor.ejecutar_plan.llamadas]
+    assert destinos == [str(tmp_path / "salida" / "a"), str(tmp_path / "salida" / "c")]
+
+
+def test_generar_lote_en_pool_usa_manifest_de_presets(tmp_path: Path) -> None:
+    manifest = tmp_path / "lote.json"
+    manifest.write_text(
+        json.dumps(["uno.json", {"preset": "dos.json", "destino": str(tmp_path / "propio")}]),
+        encoding="utf-8",
+    )
+
+    codigo = ejecutar_comando_generar_lote(
+        Namespace(presets=str(manifest), destino_base=str(tmp_path / "salida"), procesos=2, sincronizar=False),
+        _crear_contenedor(),
+        _crear_contenedor,
+    )
+
+    assert codigo == 0
+
+
+def test_generar_lote_aisla_errores_de_preset_y_muestra_tabla(tmp_path: Path) -> None:
+    presets = tmp_path / "presets"
+    presets.mkdir()
+    for nombre in ("a", "roto", "sin_permiso"):
+        (presets / f"{nombre}.json").write_text("{}", encoding="utf-8")
+
+    for procesos, fabrica in ((1, _no_construir_contenedor), (2, _crear_contenedor)):
+        salida = io.StringIO()
+        codigo = ejecutar_comando_generar_lote(
+            Namespace(
+                presets=str(presets), destino_base=str(tmp_path / "salida"), procesos=procesos, sincronizar=False
+            ),
+            _crear_contenedor(),
+            fabrica,
+            salida=salida,
+        )
+
+        lineas = salida.getvalue().splitlines()
+        assert codigo == 1
+        assert lineas[0].split() == ["PRESET", "ESTADO", "SEGUNDOS", "DESTINO", "/", "ERROR"]
+        assert [linea.split()[1] for linea in lineas[1:4]] == ["OK", "ERROR", "ERROR"]
+        assert "Preset inválido" in lineas[2]
+        assert "Permiso denegado" in lineas[3]
+        assert lineas[-1].startswith("Lote completado: 3 proyectos, 2 fallidos")
+
+
+def test_generar_lote_propaga_errores_de_programacion(tmp_path: Path) -> None:
+    presets = tmp_path / "presets"
+    presets.mkdir()
+    (presets / "inesperado.json").write_text("{}", encoding="utf-8")
+
+    with pytest.raises(AttributeError, match="atributo ausente"):
+        ejecutar_comando_generar_lote(
+            Namespace(presets=str(presets), destino_base=str(tmp_path / "salida"), procesos=1, sincronizar=False),
+            _crear_contenedor(),
+            _no_construir_contenedor,
+            salida=io.StringIO(),
+        )
+
+
+def test_generar_lote_en_pool_registra_worker_caido_como_fallo(tmp_path: Path) -> None:
+    presets = tmp_path / "presets"
+    presets.mkdir()
+    for nombre in ("a", "caido"):
+        (presets / f"{nombre}.json").write_text("{}", encoding="utf-8")
+    salida = io.StringIO()
+
+    codigo = ejecutar_comando_generar_lote(
+        Namespace(presets=str(presets), destino_base=str(tmp_path / "salida"), procesos=2, sincronizar=False),
+        _crear_contenedor(),
+        _crear_contenedor,
+        salida=salida,
+    )
+
+    fila_caido = next(linea for linea in salida.getvalue().splitlines() if "caido.json" in linea)
+    assert codigo == 1
+    assert "ERROR" in fila_caido
+    assert "BrokenProcessPool" in fila_caido
+
+
+def test_generar_lote_en_pool_conserva_logs_de_los_workers(tmp_path: Path) -> None:
+    presets = tmp_path / "presets"
+    presets.mkdir()
+    for nombre in ("a", "roto", "c"):
+        (presets / f"{nombre}.json").write_text("{}", encoding="utf-8")
+    logs = tmp_path / "logs"
+
+    configurar_logging(str(logs), asincrono=True)
+    try:
+        ejecutar_comando_generar_lote(
+            Namespace(presets=str(presets), destino_base=str(tmp_path / "salida"), procesos=2, sincronizar=False),
+            _crear_contenedor(),
+            _crear_contenedor,
+            salida=io.StringIO(),
+        )
+    finally:
+        detener_logging()
+
+    assert (logs / "crashes.log").read_text(encoding="utf-8").count("Fallo generando preset") == 1
+
+
+def test_parser_generar_lote_reconoce_argumentos() -> None:
+    args = cli_main.construir_parser().parse_args(
+        ["generar-lote", "--presets", "presets", "--destino-base", "salida", "--procesos", "4"]
+    )
+
+    assert args == Namespace(
+        comando="generar-lote",
+        presets="presets",
+        destino_base="salida",
+        procesos=4,
+        sincronizar=False,
+        durabilidad=None,
+    )
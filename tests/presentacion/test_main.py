@@ -35,3 +35,21 @@ def test_main_inicializa_app_qt(monkeypatch) -> None:
     codigo = modulo_main.main()
 
     assert codigo == 0
+
+
+@pytest.mark.parametrize(("argv", "esperado"), [(["app"], False), (["app", "--perfil", "-style", "fusion"], True)])
+def test_main_solo_emite_traza_con_perfil(monkeypatch, argv: list[str], esperado: bool) -> None:
+    solicitado: list[bool] = []
+    construir = modulo_main.construir_contenedor_gui
+
+    def construir_registrando(emitir_traza: bool = False):  # noqa: ANN202
+        solicitado.append(emitir_traza)
+        return construir(emitir_traza=emitir_traza)
+
+    monkeypatch.setattr(modulo_main.sys, "argv", argv)
+    monkeypatch.setattr(modulo_main, "construir_contenedor_gui", construir_registrando)
+    monkeypatch.setattr(modulo_main, "QApplication", _FakeApp)
+    monkeypatch.setattr(modulo_main, "WizardGeneradorProyectos", _FakeWizard)
+
+    assert modulo_main.main() == 0
+    assert solicitado == [esperado]